@@ -0,0 +1,79 @@
+"""Benchmark ekstraksi ekspor CSV: mode ``dict`` (lama) terhadap ``lean``.
+
+Mengukur baris per detik untuk setiap mode ekstraksi ``ExportManager`` pada
+satu file PDF, lalu memastikan file CSV keduanya identik byte per byte.
+
+Contoh:
+    python bench_export.py dokumen.pdf --repeat 3
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+
+from controller.export_mgr import ROW_EXTRACTORS, ExportManager
+
+# Mode ekstraksi yang menghasilkan baris CSV berformat
+CSV_MODES: tuple[str, ...] = ("dict", "lean")
+
+
+class _NoProgress:
+    """Penerima progres kosong untuk ``ExportManager.to_csv``."""
+
+    def update_progress(self, value: float) -> None:
+        """Mengabaikan nilai progres."""
+
+
+def bench_extract(doc: fitz.Document, mode: str, repeat: int) -> tuple[int, float]:
+    """Mengukur laju ekstraksi terbaik dari beberapa putaran.
+
+    Args:
+        doc (fitz.Document): Dokumen sumber.
+        mode (str): Kunci ``ROW_EXTRACTORS``.
+        repeat (int): Jumlah putaran pengukuran.
+
+    Returns:
+        Tuple[int, float]: Jumlah baris dan laju terbaik (baris/detik).
+
+    """
+    extract = ROW_EXTRACTORS[mode]
+    best: float = 0.0
+    rows: int = 0
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        rows = sum(len(extract(page)) for page in doc)
+        best = max(best, rows / (time.perf_counter() - start))
+    return rows, best
+
+
+def main() -> None:
+    """Menjalankan benchmark dan mencetak ringkasannya."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf", help="File PDF yang diekspor")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah putaran")
+    args = parser.parse_args()
+
+    with fitz.open(args.pdf) as doc:
+        for mode in CSV_MODES:
+            rows, rate = bench_extract(doc, mode, args.repeat)
+            print(f"{mode:>5}: {rows} baris, {rate:,.0f} baris/detik")
+
+        # Ekspor penuh (serial) untuk memastikan keluaran tetap identik
+        outputs: list[bytes] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            for mode in CSV_MODES:
+                path: str = os.path.join(tmp, f"{mode}.csv")
+                ExportManager(workers=1, mode=mode).to_csv(
+                    doc, path, list(range(len(doc))), _NoProgress()
+                )
+                with open(path, "rb") as f:
+                    outputs.append(f.read())
+        same: bool = all(out == outputs[0] for out in outputs)
+        print("keluaran identik" if same else "KELUARAN BERBEDA")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Modul cache LRU berbatas memori untuk hasil render halaman.
+
+Cache di modul ini dipakai bersama oleh seluruh jendela dokumen (MDI) agar
+anggaran memori berlaku per aplikasi, bukan per jendela. Seluruh akses
+dilakukan dari thread GUI sehingga tidak memerlukan penguncian.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+# Anggaran bawaan cache pixmap (256 MB)
+DEFAULT_PIXMAP_BUDGET: int = 256 * 1024 * 1024
+
+
+class LRUCache:
+    """Cache Least-Recently-Used dengan anggaran ukuran total.
+
+    Ukuran setiap entri dihitung melalui :meth:`_sizeof`; secara bawaan
+    setiap entri bernilai 1 sehingga anggaran berarti jumlah entri maksimum.
+
+    Attributes:
+        budget (int): Batas ukuran total seluruh entri.
+        hits (int): Jumlah pencarian yang ditemukan di cache.
+        misses (int): Jumlah pencarian yang tidak ditemukan.
+        evictions (int): Jumlah entri yang dibuang karena melebihi anggaran.
+
+    """
+
+    def __init__(self, budget: int) -> None:
+        """Inisialisasi cache kosong.
+
+        Args:
+            budget (int): Batas ukuran total seluruh entri.
+
+        """
+        self.budget: int = budget
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._size: int = 0
+
+    def _sizeof(self, value: Any) -> int:
+        """Menghitung ukuran satu entri dalam satuan anggaran.
+
+        Args:
+            value (Any): Nilai yang akan disimpan.
+
+        Returns:
+            int: Ukuran entri.
+
+        """
+        return 1
+
+    def get(self, key: Hashable) -> Any | None:
+        """Mengambil entri dan menandainya sebagai yang terbaru dipakai.
+
+        Args:
+            key (Hashable): Kunci entri.
+
+        Returns:
+            Optional[Any]: Nilai tersimpan atau None jika tidak ada.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Memeriksa keberadaan entri tanpa memengaruhi urutan dan statistik.
+
+        Args:
+            key (Hashable): Kunci entri.
+
+        Returns:
+            bool: True jika entri tersimpan.
+
+        """
+        return key in self._entries
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Menyimpan entri baru lalu membuang entri terlama bila perlu.
+
+        Entri yang ukurannya melebihi seluruh anggaran tidak disimpan.
+
+        Args:
+            key (Hashable): Kunci entri.
+            value (Any): Nilai yang disimpan.
+
+        """
+        size = self._sizeof(value)
+        self.discard(key)
+        if size > self.budget:
+            return
+        self._entries[key] = (value, size)
+        self._size += size
+        self._evict()
+
+    def discard(self, key: Hashable) -> None:
+        """Menghapus satu entri tanpa menghitungnya sebagai eviction.
+
+        Args:
+            key (Hashable): Kunci entri.
+
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def set_budget(self, budget: int) -> None:
+        """Mengubah anggaran dan langsung membuang entri yang berlebih.
+
+        Args:
+            budget (int): Batas ukuran total yang baru.
+
+        """
+        self.budget = budget
+        self._evict()
+
+    def clear(self) -> None:
+        """Mengosongkan seluruh entri tanpa mengubah statistik."""
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Mengambil ringkasan statistik cache.
+
+        Returns:
+            Dict[str, Any]: Jumlah hit, miss, eviction, entri, ukuran,
+            anggaran, dan rasio hit.
+
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size": self._size,
+            "budget": self.budget,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _evict(self) -> None:
+        """Membuang entri terlama sampai ukuran total masuk anggaran."""
+        while self._size > self.budget and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+            self.evictions += 1
+
+
+class PixmapCache(LRUCache):
+    """Cache pixmap halaman dengan anggaran dalam byte.
+
+    Kunci yang dipakai berbentuk ``(doc_key, page_index, zoom, options)``.
+    """
+
+    def _sizeof(self, value: Any) -> int:
+        """Menghitung ukuran buffer piksel dalam byte.
+
+        Args:
+            value (Any): Objek pixmap (``PixmapData`` atau fitz.Pixmap).
+
+        Returns:
+            int: Ukuran buffer piksel.
+
+        """
+        return value.stride * value.height
+
+
+# Instance tunggal yang dipakai bersama oleh semua controller
+pixmap_cache = PixmapCache(DEFAULT_PIXMAP_BUDGET)
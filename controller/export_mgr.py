@@ -1,7 +1,356 @@
-import csv
+"""Modul ekspor teks PDF ke CSV dan format kolumnar.
+
+Rentang halaman dibagi menjadi potongan (chunk) yang diekstrak paralel di
+pool proses; setiap proses pekerja membuka dokumennya sendiri karena objek
+PyMuPDF tidak dapat dibagi antar-proses. Potongan digabung ke file keluaran
+menurut urutan halaman sehingga penomoran ``nomor`` tetap berurutan dan
+hasilnya sama persis dengan ekspor serial.
+
+Mode ekstraksi bawaan ``"lean"`` meminta PyMuPDF hanya blok teks (tanpa
+gambar) dan memformat kolom angka per halaman sekaligus; mode ``"dict"``
+adalah ekstraksi lama yang dipertahankan sebagai pembanding. Keluaran
+keduanya identik byte per byte. Format selain CSV (lihat
+``export_writers``) menerima nilai mentah dari ``page_spans``.
+
+Ekspor dari antarmuka berjalan sebagai ``ExportJob`` di thread latar
+belakang yang dapat dijeda dan dibatalkan; UI cukup membaca penghitung job
+secara berkala. Modul ini tidak bergantung pada Qt agar dapat dipakai tanpa
+antarmuka.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import repeat
+from typing import Any
+
+import fitz  # PyMuPDF
+
+from .export_writers import COLUMNS, ExportWriter, resolve_writer
+from .page_info_mgr import LEAN_TEXT_FLAGS
+
+# Nama kolom keluaran; dipertahankan untuk kompatibilitas impor lama
+CSV_HEADER: list[str] = COLUMNS
+
+# Jumlah halaman per potongan yang dikirim ke satu proses pekerja
+CHUNK_PAGES: int = 16
+
+# Di bawah jumlah halaman ini ekspor dijalankan serial (biaya start pool)
+PARALLEL_MIN_PAGES: int = 48
+
+# Jumlah kolom angka per span: x0, x1, top, bottom, sumbu
+_NUM_COLS: int = 5
+
+
+class ExportJob:
+    """Status satu pekerjaan ekspor latar belakang.
+
+    Penghitung ditulis oleh thread ekspor dan dibaca oleh UI tanpa kunci;
+    setiap nilai berupa satu atribut sehingga pembacaan selalu konsisten.
+
+    Attributes:
+        filepath (str): Lokasi file keluaran.
+        source (str): Path dokumen PDF sumber.
+        total_pages (int): Jumlah halaman yang akan diekspor.
+        pages_done (int): Jumlah halaman yang sudah ditulis.
+        rows_written (int): Jumlah baris data yang sudah ditulis.
+        state (str): ``"running"``, ``"done"``, ``"cancelled"``, atau
+            ``"failed"``.
+        error (Optional[Exception]): Galat bila ekspor gagal.
+
+    """
+
+    def __init__(self, filepath: str, source: str, total_pages: int) -> None:
+        """Inisialisasi job yang belum berjalan.
+
+        Args:
+            filepath (str): Lokasi file keluaran.
+            source (str): Path dokumen PDF sumber.
+            total_pages (int): Jumlah halaman yang akan diekspor.
+
+        """
+        self.filepath: str = filepath
+        self.source: str = source
+        self.total_pages: int = total_pages
+        self.pages_done: int = 0
+        self.rows_written: int = 0
+        self.state: str = "running"
+        self.error: Exception | None = None
+        self._resume = threading.Event()
+        self._resume.set()
+        self._cancel = threading.Event()
+        self._started: float = time.perf_counter()
+        self._paused_at: float | None = None
+        self._paused_total: float = 0.0
+        self._finished: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        """True jika job sudah selesai, dibatalkan, atau gagal."""
+        return self.state != "running"
+
+    @property
+    def paused(self) -> bool:
+        """True jika job sedang dijeda."""
+        return not self._resume.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        """Durasi aktif job dalam detik, tanpa waktu jeda."""
+        end: float = self._finished or self._paused_at or time.perf_counter()
+        return max(0.0, end - self._started - self._paused_total)
+
+    @property
+    def pages_per_sec(self) -> float:
+        """Laju ekspor rata-rata dalam halaman per detik."""
+        elapsed: float = self.elapsed
+        return self.pages_done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Perkiraan sisa waktu dalam detik, None bila laju belum diketahui."""
+        rate: float = self.pages_per_sec
+        if rate <= 0:
+            return None
+        return (self.total_pages - self.pages_done) / rate
+
+    def pause(self) -> None:
+        """Menjeda job pada batas potongan berikutnya."""
+        if self._resume.is_set() and not self.finished:
+            self._paused_at = time.perf_counter()
+            self._resume.clear()
+
+    def resume(self) -> None:
+        """Melanjutkan job yang dijeda."""
+        if self._paused_at is not None:
+            self._paused_total += time.perf_counter() - self._paused_at
+            self._paused_at = None
+        self._resume.set()
+
+    def cancel(self) -> None:
+        """Membatalkan job; file keluaran parsial dihapus."""
+        self._cancel.set()
+        self.resume()
+
+    def checkpoint(self) -> bool:
+        """Menunggu selama dijeda, lalu memeriksa pembatalan.
+
+        Returns:
+            bool: True jika job boleh dilanjutkan.
+
+        """
+        self._resume.wait()
+        return not self._cancel.is_set()
+
+    def advance(self, pages: int, rows: int) -> None:
+        """Mencatat potongan yang sudah ditulis.
+
+        Args:
+            pages (int): Jumlah halaman potongan.
+            rows (int): Jumlah baris potongan.
+
+        """
+        self.pages_done += pages
+        self.rows_written += rows
+
+    def finish(self, state: str, error: Exception | None = None) -> None:
+        """Menandai job berakhir.
+
+        Args:
+            state (str): Status akhir job.
+            error (Optional[Exception]): Galat bila job gagal.
+
+        """
+        self._finished = time.perf_counter()
+        self.error = error
+        self.state = state
+
+
+def page_rows(page: fitz.Page) -> list[list[Any]]:
+    """Mengekstrak baris CSV (tanpa kolom ``nomor``) dari satu halaman.
+
+    Hanya blok teks yang diminta dari PyMuPDF. Seluruh angka halaman
+    dibulatkan lalu digabung menjadi satu string sehingga penggantian titik
+    desimal menjadi koma cukup dilakukan sekali per halaman.
+
+    Args:
+        page (fitz.Page): Halaman sumber.
+
+    Returns:
+        List[List[Any]]: Satu baris per span teks, berurutan seperti di PDF.
+
+    """
+    spans: list[dict[str, Any]] = [
+        span
+        for b in page.get_text("dict", flags=LEAN_TEXT_FLAGS)["blocks"]
+        for line in b["lines"]
+        for span in line["spans"]
+    ]
+    nums: list[float] = []
+    for span in spans:
+        x0, y0, x1, y1 = span["bbox"]
+        nums += (x0, x1, y0, y1, (y0 + y1) / 2)
+    # str(round(v, 2)) dengan koma desimal, untuk semua angka sekaligus
+    cells: list[str] = (
+        ";".join(map(str, map(round, nums, repeat(2)))).replace(".", ",").split(";")
+    )
+
+    page_num: int = page.number + 1
+    rows: list[list[Any]] = []
+    for k, span in zip(range(0, len(cells), _NUM_COLS), spans, strict=False):
+        x0, x1, y0, y1, mid = cells[k : k + _NUM_COLS]
+        rows.append(
+            [
+                page_num,
+                span["text"].replace("\n", " ").strip(),  # Jangan hapus ';' disini!
+                x0,
+                x1,
+                y0,
+                y1,
+                span["font"],
+                span["size"],
+                mid,
+            ]
+        )
+    return rows
+
+
+def page_rows_dict(page: fitz.Page) -> list[list[Any]]:
+    """Mengekstrak baris CSV dengan ``get_text("dict")`` lengkap (mode lama).
+
+    Args:
+        page (fitz.Page): Halaman sumber.
+
+    Returns:
+        List[List[Any]]: Satu baris per span teks, berurutan seperti di PDF.
+
+    """
+    rows: list[list[Any]] = []
+    page_num: int = page.number + 1
+    blocks = page.get_text("dict")["blocks"]
+    for b in [b for b in blocks if b["type"] == 0]:
+        for line in b["lines"]:
+            for span in line["spans"]:
+                x0, y0, x1, y1 = span["bbox"]
+
+                # Logika format angka desimal dengan koma tetap bisa dipertahankan
+                rows.append(
+                    [
+                        page_num,
+                        span["text"]
+                        .replace("\n", " ")
+                        .strip(),  # Jangan hapus ';' disini!
+                        str(round(x0, 2)).replace(".", ","),
+                        str(round(x1, 2)).replace(".", ","),
+                        str(round(y0, 2)).replace(".", ","),
+                        str(round(y1, 2)).replace(".", ","),
+                        span["font"],
+                        span["size"],
+                        str(round((y0 + y1) / 2, 2)).replace(
+                            ".", ","
+                        ),  # Formula: $$ \frac{y_{0} + y_{1}}{2} $$
+                    ]
+                )
+    return rows
+
+
+def page_spans(page: fitz.Page) -> list[list[Any]]:
+    """Mengekstrak span teks satu halaman sebagai nilai mentah bertipe.
+
+    Urutan kolom sama dengan :func:`page_rows`, tetapi koordinat, ukuran
+    font, dan sumbu tetap float tanpa pembulatan.
+
+    Args:
+        page (fitz.Page): Halaman sumber.
+
+    Returns:
+        List[List[Any]]: Satu baris per span teks, berurutan seperti di PDF.
+
+    """
+    page_num: int = page.number + 1
+    rows: list[list[Any]] = []
+    for b in page.get_text("dict", flags=LEAN_TEXT_FLAGS)["blocks"]:
+        for line in b["lines"]:
+            for span in line["spans"]:
+                x0, y0, x1, y1 = span["bbox"]
+                rows.append(
+                    [
+                        page_num,
+                        span["text"].replace("\n", " ").strip(),
+                        x0,
+                        x1,
+                        y0,
+                        y1,
+                        span["font"],
+                        span["size"],
+                        (y0 + y1) / 2,
+                    ]
+                )
+    return rows
+
+
+ROW_EXTRACTORS: dict[str, Callable[[fitz.Page], list[list[Any]]]] = {
+    "lean": page_rows,
+    "dict": page_rows_dict,
+    "spans": page_spans,  # Nilai mentah untuk writer bertipe
+}
+
+
+def extract_chunk(path: str, indices: list[int], mode: str = "lean") -> list[list[Any]]:
+    """Mengekstrak satu potongan halaman di proses pekerja.
+
+    Args:
+        path (str): Path file PDF; dibuka ulang di proses pekerja.
+        indices (List[int]): Indeks halaman potongan (0-indexed), berurutan.
+        mode (str): Kunci ``ROW_EXTRACTORS``.
+
+    Returns:
+        List[List[Any]]: Baris tanpa kolom ``nomor``.
+
+    """
+    extract = ROW_EXTRACTORS[mode]
+    rows: list[list[Any]] = []
+    with fitz.open(path) as doc:
+        for p_idx in indices:
+            rows.extend(extract(doc[p_idx]))
+    return rows
 
 
 class ExportManager:
+    """Pengelola ekspor teks PDF secara serial atau paralel.
+
+    Attributes:
+        workers (int): Jumlah proses pekerja untuk ekspor paralel.
+        chunk_pages (int): Jumlah halaman per potongan pekerjaan.
+        mode (str): Mode ekstraksi baris CSV, kunci ``ROW_EXTRACTORS``.
+
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        chunk_pages: int = CHUNK_PAGES,
+        mode: str = "lean",
+    ) -> None:
+        """Inisialisasi pengelola ekspor.
+
+        Args:
+            workers (Optional[int]): Jumlah proses pekerja; None untuk
+                jumlah inti CPU.
+            chunk_pages (int): Jumlah halaman per potongan pekerjaan.
+            mode (str): ``"lean"`` (bawaan) atau ``"dict"`` (ekstraksi lama).
+
+        """
+        self.workers: int = workers or os.cpu_count() or 1
+        self.chunk_pages: int = chunk_pages
+        self.mode: str = mode
+
     def parse_ranges(self, range_str, total_pages):
         """Logika parsing rentang halaman (misal: 1, 3, 5-10)"""
         pages = set()
@@ -17,57 +366,219 @@ class ExportManager:
             return None
         return sorted([p for p in pages if 0 <= p < total_pages])
 
-    def to_csv(self, doc, filepath, indices, view):
-        """Proses ekstraksi teks ke file CSV yang aman bagi karakter khusus."""
-        header = [
-            "nomor",
-            "halaman",
-            "teks",
-            "x0",
-            "x1",
-            "top",
-            "bottom",
-            "font_style",
-            "font_size",
-            "sumbu",
+    def _chunks(self, indices: list[int]) -> list[list[int]]:
+        """Membagi indeks halaman menjadi potongan berurutan."""
+        step: int = self.chunk_pages
+        return [indices[i : i + step] for i in range(0, len(indices), step)]
+
+    def _serial_rows(
+        self, doc: fitz.Document, chunks: list[list[int]], mode: str
+    ) -> Iterable[list[list[Any]]]:
+        """Menghasilkan baris setiap potongan di proses ini."""
+        extract = ROW_EXTRACTORS[mode]
+        for chunk in chunks:
+            rows: list[list[Any]] = []
+            for p_idx in chunk:
+                rows.extend(extract(doc[p_idx]))
+            yield rows
+
+    def _parallel_rows(
+        self, path: str, chunks: list[list[int]], mode: str
+    ) -> Iterable[list[list[Any]]]:
+        """Menghasilkan baris setiap potongan dari pool proses, urut halaman.
+
+        Jumlah potongan yang sedang dikerjakan dibatasi dua kali jumlah
+        pekerja sehingga memori tetap datar pada dokumen besar.
+        """
+        # "spawn": proses GUI memiliki thread render yang tidak aman di-fork
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(self.workers, mp_context=ctx) as pool:
+            pending: deque[Future] = deque()
+            queue = iter(chunks)
+            for chunk in queue:
+                pending.append(pool.submit(extract_chunk, path, chunk, mode))
+                if len(pending) >= self.workers * 2:
+                    break
+            try:
+                while pending:
+                    rows = pending.popleft().result()
+                    for chunk in queue:
+                        pending.append(pool.submit(extract_chunk, path, chunk, mode))
+                        break
+                    yield rows
+            finally:
+                # Potongan yang belum mulai dibuang saat ekspor dihentikan
+                pool.shutdown(cancel_futures=True)
+
+    def start(
+        self,
+        doc: fitz.Document,
+        filepath: str,
+        indices: list[int],
+        page_info: Any | None = None,
+        fmt: str | None = None,
+    ) -> ExportJob:
+        """Menjalankan ekspor sebagai job di thread latar belakang.
+
+        Thread ekspor membuka dokumennya sendiri dari path ``doc`` karena
+        handle PyMuPDF milik thread GUI tidak boleh dipakai bersama.
+
+        Args:
+            doc (fitz.Document): Dokumen sumber yang sudah tersimpan di disk.
+            filepath (str): Lokasi file keluaran.
+            indices (List[int]): Indeks halaman (0-indexed), berurutan naik.
+            page_info (Optional[PageInfoTable]): Lihat :meth:`export`.
+            fmt (Optional[str]): Lihat :meth:`export`.
+
+        Returns:
+            ExportJob: Job yang sedang berjalan; ``job.filepath`` adalah path
+                akhir setelah ekstensi format ditambahkan.
+
+        """
+        indices = self._text_pages(indices, page_info)
+        writer: ExportWriter = resolve_writer(filepath, fmt)
+        job = ExportJob(writer.filepath, doc.name, len(indices))
+
+        def run() -> None:
+            try:
+                with fitz.open(job.source) as own_doc:
+                    self.export(own_doc, writer.filepath, indices, job=job, fmt=fmt)
+            except Exception as e:
+                job.finish("failed", e)
+
+        threading.Thread(target=run, name="pdf-export", daemon=True).start()
+        return job
+
+    def _text_pages(self, indices: list[int], page_info: Any | None) -> list[int]:
+        """Membuang halaman yang sudah dipindai dan tidak memiliki blok teks."""
+        if page_info is None:
+            return indices
+        return [
+            p
+            for p in indices
+            if not page_info.is_scanned(p) or page_info.text_blocks[p] > 0
         ]
 
+    def to_csv(
+        self,
+        doc: fitz.Document,
+        filepath: str,
+        indices: list[int],
+        view: Any | None = None,
+        page_info: Any | None = None,
+        job: ExportJob | None = None,
+    ) -> None:
+        """Mengekspor teks halaman terpilih ke file CSV berpemisah ``;``.
+
+        Args:
+            doc (fitz.Document): Dokumen sumber.
+            filepath (str): Lokasi file CSV keluaran.
+            indices (List[int]): Indeks halaman (0-indexed), berurutan naik.
+            view (Optional[Any]): Penerima ``update_progress(persen)``.
+            page_info (Optional[PageInfoTable]): Lihat :meth:`export`.
+            job (Optional[ExportJob]): Lihat :meth:`export`.
+
+        """
+        self.export(doc, filepath, indices, view, page_info, job, fmt="csv")
+
+    def export(
+        self,
+        doc: fitz.Document,
+        filepath: str,
+        indices: list[int],
+        view: Any | None = None,
+        page_info: Any | None = None,
+        job: ExportJob | None = None,
+        fmt: str | None = None,
+    ) -> None:
+        """Mengekspor teks halaman terpilih ke format yang dipilih.
+
+        Dokumen kecil diekstrak serial; selebihnya dibagi per potongan ke
+        pool proses. Hasil selalu ditulis menurut urutan halaman dengan
+        penomoran ``nomor`` yang berlanjut antar-potongan, satu row group
+        per potongan.
+
+        Args:
+            doc (fitz.Document): Dokumen sumber (path-nya dibuka ulang oleh
+                proses pekerja).
+            filepath (str): Lokasi file keluaran.
+            indices (List[int]): Indeks halaman (0-indexed), berurutan naik.
+            view (Optional[Any]): Penerima ``update_progress(persen)``.
+            page_info (Optional[PageInfoTable]): Jika diberikan, halaman yang
+                sudah dipindai dan tidak memiliki blok teks dilewati.
+            job (Optional[ExportJob]): Job penerima penghitung progres dan
+                sinyal jeda/batal; dibuat baru jika None.
+            fmt (Optional[str]): Kunci ``export_writers.WRITERS``; None untuk
+                memilih dari ekstensi ``filepath``.
+
+        """
+        writer: ExportWriter = resolve_writer(filepath, fmt)
+        indices = self._text_pages(indices, page_info)
+        if job is None:
+            job = ExportJob(writer.filepath, doc.name, len(indices))
+        chunks: list[list[int]] = self._chunks(indices)
+        mode: str = writer.extractor or self.mode
+        parallel: bool = (
+            self.workers > 1
+            and len(indices) >= PARALLEL_MIN_PAGES
+            and os.path.exists(doc.name or "")
+        )
+        rows_iter: Iterable[list[list[Any]]] = (
+            self._parallel_rows(doc.name, chunks, mode)
+            if parallel
+            else self._serial_rows(doc, chunks, mode)
+        )
+        progress: Callable[[float], None] | None = (
+            view.update_progress if view is not None else None
+        )
+        self._write(job, writer, rows_iter, chunks, progress)
+
+    def _write(
+        self,
+        job: ExportJob,
+        writer: ExportWriter,
+        rows_iter: Iterable[list[list[Any]]],
+        chunks: list[list[int]],
+        progress: Callable[[float], None] | None,
+    ) -> None:
+        """Menulis potongan baris lewat writer sambil memberi nomor urut global.
+
+        Data ditulis ke file ``.part`` dan baru menggantikan file tujuan
+        setelah seluruh potongan selesai, sehingga pembatalan atau galat
+        tidak meninggalkan file setengah jadi.
+        """
+        part: str = job.filepath + ".part"
+        writer.filepath = part
         try:
-            # Gunakan newline='' dan quoting=csv.QUOTE_MINIMAL agar ';' di dalam teks aman dibungkus tanda kutip
-            with open(filepath, mode="w", encoding="utf-8-sig", newline="") as f:
-                writer = csv.writer(
-                    f, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL
-                )
-                writer.writerow(header)
-
-                idx = 1
-                for i, p_idx in enumerate(indices):
-                    blocks = doc[p_idx].get_text("dict")["blocks"]
-                    for b in [b for b in blocks if b["type"] == 0]:
-                        for line in b["lines"]:
-                            for span in line["spans"]:
-                                x0, y0, x1, y1 = span["bbox"]
-
-                                # Logika format angka desimal dengan koma tetap bisa dipertahankan
-                                row = [
-                                    idx,
-                                    p_idx + 1,
-                                    span["text"]
-                                    .replace("\n", " ")
-                                    .strip(),  # Jangan hapus ';' disini!
-                                    str(round(x0, 2)).replace(".", ","),
-                                    str(round(x1, 2)).replace(".", ","),
-                                    str(round(y0, 2)).replace(".", ","),
-                                    str(round(y1, 2)).replace(".", ","),
-                                    span["font"],
-                                    span["size"],
-                                    str(round((y0 + y1) / 2, 2)).replace(
-                                        ".", ","
-                                    ),  # Formula: $$ \frac{y_{0} + y_{1}}{2} $$
-                                ]
-                                writer.writerow(row)
-                                idx += 1
-                    view.update_progress(((i + 1) / len(indices)) * 100)
-                view.update_progress(0)
+            if os.path.exists(part):
+                os.remove(part)  # Sisa ekspor lama yang terhenti
+            writer.open()
+            try:
+                idx: int = 1
+                for chunk, rows in zip(chunks, rows_iter, strict=False):
+                    writer.write(idx, rows)
+                    idx += len(rows)
+                    job.advance(len(chunk), len(rows))
+                    if progress is not None:
+                        progress((job.pages_done / job.total_pages) * 100)
+                    if not job.checkpoint():
+                        break
+            finally:
+                writer.close()
+            if job.checkpoint():
+                os.replace(part, job.filepath)
+                job.finish("done")
+            else:
+                os.remove(part)
+                job.finish("cancelled")
         except Exception as e:
-            print(f"Export gagal: {e}")
+            if os.path.exists(part):
+                os.remove(part)
+            job.finish("failed", e)
+        finally:
+            # Menghentikan pool proses lebih awal bila job dibatalkan
+            close = getattr(rows_iter, "close", None)
+            if close is not None:
+                close()
+            if progress is not None:
+                progress(0)
@@ -0,0 +1,333 @@
+"""Modul writer format keluaran ekspor teks PDF.
+
+Setiap writer menerima baris per potongan halaman (satu potongan = satu
+row group) sehingga memori tetap datar berapa pun jumlah span yang
+diekspor. CSV menerima baris yang sudah diformat (koma desimal, dua angka
+di belakang koma); format lain menerima nilai mentah bertipe dari
+``page_spans`` tanpa pembulatan.
+
+Parquet dan Arrow IPC memakai paket opsional ``pyarrow`` (lihat
+``requirements-optional.txt``) yang baru diimpor saat writer dibuka. Modul
+ini tidak bergantung pada Qt.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Any
+
+COLUMNS: list[str] = [
+    "nomor",
+    "halaman",
+    "teks",
+    "x0",
+    "x1",
+    "top",
+    "bottom",
+    "font_style",
+    "font_size",
+    "sumbu",
+]
+
+
+def _require_pyarrow() -> Any:
+    """Mengimpor ``pyarrow`` atau memberi pesan galat yang jelas."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Ekspor Parquet/Arrow membutuhkan paket opsional 'pyarrow' "
+            "(pip install -r requirements-optional.txt)"
+        ) from e
+    return pyarrow
+
+
+class ExportWriter(ABC):
+    """Basis abstrak writer keluaran ekspor.
+
+    Attributes:
+        name (str): Kunci format, misal ``"csv"``.
+        extensions (Tuple[str, ...]): Ekstensi file yang dikenali; yang
+            pertama dipakai saat path belum berekstensi.
+        description (str): Label format pada dialog simpan.
+        extractor (Optional[str]): Kunci ekstraktor baris yang dibutuhkan;
+            None berarti mengikuti mode ekstraksi ``ExportManager``.
+        filepath (str): Lokasi file yang sedang ditulis.
+
+    """
+
+    name: str = ""
+    extensions: tuple[str, ...] = ()
+    description: str = ""
+    extractor: str | None = "spans"
+
+    def __init__(self, filepath: str) -> None:
+        """Inisialisasi writer tanpa membuka file.
+
+        Args:
+            filepath (str): Lokasi file keluaran.
+
+        """
+        self.filepath: str = filepath
+
+    @abstractmethod
+    def open(self) -> None:
+        """Membuat file keluaran dan menulis header atau skema."""
+
+    @abstractmethod
+    def write(self, start: int, rows: list[list[Any]]) -> None:
+        """Menulis satu potongan baris sebagai satu row group.
+
+        Args:
+            start (int): Nilai ``nomor`` baris pertama potongan.
+            rows (List[List[Any]]): Baris potongan tanpa kolom ``nomor``.
+
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Menuntaskan dan menutup file keluaran."""
+
+
+class CsvWriter(ExportWriter):
+    """Writer CSV berpemisah ``;`` dengan koma desimal (format asli)."""
+
+    name = "csv"
+    extensions = (".csv",)
+    description = "CSV Files (*.csv)"
+    extractor = None
+
+    def open(self) -> None:
+        """Membuka file CSV dan menulis header."""
+        # Gunakan newline='' dan quoting=csv.QUOTE_MINIMAL agar ';' di dalam teks aman dibungkus tanda kutip
+        self._file = open(self.filepath, mode="w", encoding="utf-8-sig", newline="")
+        self._writer = csv.writer(
+            self._file, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL
+        )
+        self._writer.writerow(COLUMNS)
+
+    def write(self, start: int, rows: list[list[Any]]) -> None:
+        """Menulis baris berformat beserta nomor urutnya."""
+        self._writer.writerows([n, *row] for n, row in enumerate(rows, start=start))
+
+    def close(self) -> None:
+        """Menutup file CSV."""
+        self._file.close()
+
+
+class JsonLinesWriter(ExportWriter):
+    """Writer JSON Lines: satu objek per span dengan angka presisi penuh."""
+
+    name = "jsonl"
+    extensions = (".jsonl", ".ndjson")
+    description = "JSON Lines (*.jsonl *.ndjson)"
+
+    def open(self) -> None:
+        """Membuka file JSON Lines."""
+        self._file = open(self.filepath, mode="w", encoding="utf-8", newline="\n")
+
+    def write(self, start: int, rows: list[list[Any]]) -> None:
+        """Menulis satu baris JSON per span."""
+        dumps = json.JSONEncoder(ensure_ascii=False).encode
+        self._file.write(
+            "".join(
+                dumps(dict(zip(COLUMNS, (n, *row), strict=True))) + "\n"
+                for n, row in enumerate(rows, start=start)
+            )
+        )
+
+    def close(self) -> None:
+        """Menutup file JSON Lines."""
+        self._file.close()
+
+
+class SqliteWriter(ExportWriter):
+    """Writer SQLite: tabel ``spans`` bertipe, satu transaksi per potongan."""
+
+    name = "sqlite"
+    extensions = (".sqlite", ".sqlite3", ".db")
+    description = "SQLite (*.sqlite *.sqlite3 *.db)"
+
+    def open(self) -> None:
+        """Membuat database dan tabel ``spans``."""
+        self._conn = sqlite3.connect(self.filepath)
+        self._conn.execute(
+            "CREATE TABLE spans (nomor INTEGER PRIMARY KEY, halaman INTEGER, "
+            "teks TEXT, x0 REAL, x1 REAL, top REAL, bottom REAL, "
+            "font_style TEXT, font_size REAL, sumbu REAL)"
+        )
+
+    def write(self, start: int, rows: list[list[Any]]) -> None:
+        """Menyisipkan satu potongan baris dalam satu transaksi."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO spans VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((n, *row) for n, row in enumerate(rows, start=start)),
+            )
+
+    def close(self) -> None:
+        """Membuat indeks halaman lalu menutup database."""
+        with self._conn:
+            self._conn.execute("CREATE INDEX spans_halaman ON spans (halaman)")
+        self._conn.close()
+
+
+class _ArrowWriterBase(ExportWriter):
+    """Basis writer ``pyarrow``: kolom float bertipe dan font terkodekan kamus.
+
+    Kamus font dipakai bersama oleh seluruh potongan dan hanya bertambah,
+    sehingga potongan berikutnya cukup membawa entri font baru.
+    """
+
+    def _schema(self) -> Any:
+        """Membuat skema Arrow keluaran."""
+        pa = self._pa
+        return pa.schema(
+            [
+                ("nomor", pa.int64()),
+                ("halaman", pa.int32()),
+                ("teks", pa.string()),
+                ("x0", pa.float64()),
+                ("x1", pa.float64()),
+                ("top", pa.float64()),
+                ("bottom", pa.float64()),
+                ("font_style", pa.dictionary(pa.int32(), pa.string())),
+                ("font_size", pa.float64()),
+                ("sumbu", pa.float64()),
+            ]
+        )
+
+    def open(self) -> None:
+        """Memuat ``pyarrow`` dan menyiapkan kamus font."""
+        self._pa = _require_pyarrow()
+        self._fonts: dict[str, int] = {}
+        self.schema = self._schema()
+
+    def _batch(self, start: int, rows: list[list[Any]]) -> Any:
+        """Mengubah satu potongan baris menjadi ``RecordBatch``."""
+        pa = self._pa
+        page, text, x0, x1, top, bottom, font, size, mid = zip(*rows, strict=True)
+        fonts = self._fonts
+        codes = [fonts.setdefault(f, len(fonts)) for f in font]
+        font_col = pa.DictionaryArray.from_arrays(
+            pa.array(codes, pa.int32()), pa.array(list(fonts), pa.string())
+        )
+        columns = [
+            pa.array(range(start, start + len(rows)), pa.int64()),
+            pa.array(page, pa.int32()),
+            pa.array(text, pa.string()),
+            *(pa.array(c, pa.float64()) for c in (x0, x1, top, bottom)),
+            font_col,
+            pa.array(size, pa.float64()),
+            pa.array(mid, pa.float64()),
+        ]
+        return pa.RecordBatch.from_arrays(columns, schema=self.schema)
+
+    def write(self, start: int, rows: list[list[Any]]) -> None:
+        """Menulis satu potongan sebagai satu row group/record batch."""
+        if rows:
+            self._writer.write_batch(self._batch(start, rows))
+
+    def close(self) -> None:
+        """Menutup writer ``pyarrow``."""
+        self._writer.close()
+
+
+class ParquetWriter(_ArrowWriterBase):
+    """Writer Parquet (kompresi zstd), satu row group per potongan."""
+
+    name = "parquet"
+    extensions = (".parquet",)
+    description = "Parquet (*.parquet)"
+
+    def open(self) -> None:
+        """Membuka file Parquet dengan skema keluaran."""
+        super().open()
+        import pyarrow.parquet as pq
+
+        self._writer = pq.ParquetWriter(self.filepath, self.schema, compression="zstd")
+
+
+class ArrowWriter(_ArrowWriterBase):
+    """Writer Arrow IPC format stream dengan delta kamus font.
+
+    Ekstensi ``.arrow`` lazim untuk format file IPC (berfooter), bukan
+    stream, sehingga writer ini hanya memakai ekstensi ``.arrows``.
+    """
+
+    name = "arrow"
+    extensions = (".arrows",)
+    description = "Arrow IPC Stream (*.arrows)"
+
+    def open(self) -> None:
+        """Membuka stream Arrow IPC dengan skema keluaran."""
+        super().open()
+        pa = self._pa
+        self._writer = pa.ipc.new_stream(
+            self.filepath,
+            self.schema,
+            options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True),
+        )
+
+
+# Urutan menentukan urutan filter pada dialog simpan; yang pertama bawaan
+WRITERS: dict[str, type[ExportWriter]] = {
+    cls.name: cls
+    for cls in (CsvWriter, ParquetWriter, ArrowWriter, JsonLinesWriter, SqliteWriter)
+}
+
+
+def file_filters() -> str:
+    """Filter dialog simpan untuk seluruh format, dipisah ``;;``."""
+    return ";;".join(cls.description for cls in WRITERS.values())
+
+
+def format_for_filter(selected: str) -> str | None:
+    """Mencari kunci format dari filter dialog yang dipilih pengguna."""
+    for name, cls in WRITERS.items():
+        if cls.description == selected:
+            return name
+    return None
+
+
+def format_for_path(filepath: str) -> str | None:
+    """Mencari kunci format dari ekstensi file, None jika tidak dikenal."""
+    ext: str = os.path.splitext(filepath)[1].lower()
+    for name, cls in WRITERS.items():
+        if ext in cls.extensions:
+            return name
+    return None
+
+
+def resolve_writer(filepath: str, fmt: str | None = None) -> ExportWriter:
+    """Memilih writer dari format eksplisit atau ekstensi file.
+
+    Format eksplisit menang; bila path belum memakai salah satu ekstensinya,
+    ekstensi pertama format itu ditambahkan. Tanpa format, ekstensi path
+    menentukan writer dan ekstensi yang tidak dikenal jatuh ke CSV.
+
+    Args:
+        filepath (str): Lokasi file keluaran.
+        fmt (Optional[str]): Kunci ``WRITERS``.
+
+    Returns:
+        ExportWriter: Writer untuk path akhir (``writer.filepath``).
+
+    Raises:
+        ValueError: Jika ``fmt`` tidak dikenal.
+
+    """
+    ext: str = os.path.splitext(filepath)[1].lower()
+    if fmt is None:
+        cls = next((c for c in WRITERS.values() if ext in c.extensions), WRITERS["csv"])
+    elif fmt in WRITERS:
+        cls = WRITERS[fmt]
+        if ext not in cls.extensions:
+            filepath += cls.extensions[0]
+    else:
+        raise ValueError(f"Format ekspor tidak dikenal: {fmt}")
+    return cls(filepath)
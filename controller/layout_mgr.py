@@ -0,0 +1,93 @@
+"""Modul tata letak halaman untuk mode scroll kontinu.
+
+Seluruh halaman disusun vertikal dalam satu scene. Modul ini hanya
+menyimpan posisi dan ukuran setiap slot halaman (beberapa angka per
+halaman) sehingga pencarian halaman di sekitar viewport cukup memakai
+bisect, tanpa membuat item scene untuk setiap halaman.
+"""
+
+from __future__ import annotations
+
+import bisect
+
+# Jarak vertikal antar halaman dalam piksel
+PAGE_GAP: int = 12
+
+
+class ContinuousLayout:
+    """Posisi slot setiap halaman pada scene mode kontinu.
+
+    Attributes:
+        zoom (float): Tingkat zoom tata letak.
+        sizes (List[Tuple[float, float]]): Ukuran halaman dalam poin PDF
+            yang dipakai menyusun slot.
+        slots (List[Tuple[float, float, float, float]]): Area (x, y, w, h)
+            setiap halaman pada scene dalam piksel.
+        region (Tuple[float, float, float, float]): Area scene keseluruhan.
+
+    """
+
+    def __init__(
+        self,
+        sizes: list[tuple[float, float]],
+        zoom: float,
+        padding: float,
+        viewport_w: float,
+    ) -> None:
+        """Menyusun slot halaman dari ukuran halaman dalam poin PDF.
+
+        Args:
+            sizes (List[Tuple[float, float]]): Lebar dan tinggi setiap halaman.
+            zoom (float): Tingkat zoom.
+            padding (float): Jarak tepi atas dan bawah scene.
+            viewport_w (float): Lebar viewport dalam piksel.
+
+        """
+        self.zoom: float = zoom
+        self.sizes: list[tuple[float, float]] = list(sizes)
+        max_w: float = max((w for w, _ in sizes), default=0) * zoom
+        region_w: float = max(viewport_w, max_w)
+
+        self.slots: list[tuple[float, float, float, float]] = []
+        self._tops: list[float] = []
+        y: float = padding
+        for w, h in sizes:
+            pw, ph = int(w * zoom), int(h * zoom)
+            self.slots.append((max(0, (region_w - pw) / 2), y, pw, ph))
+            self._tops.append(y)
+            y += ph + PAGE_GAP
+        self.region: tuple[float, float, float, float] = (
+            0,
+            0,
+            region_w,
+            y - PAGE_GAP + padding,
+        )
+
+    def page_at(self, y: float) -> int:
+        """Mencari indeks halaman pada posisi vertikal scene tertentu.
+
+        Args:
+            y (float): Posisi vertikal pada scene.
+
+        Returns:
+            int: Indeks halaman (0-indexed) yang memuat atau terdekat di atas y.
+
+        """
+        return max(0, bisect.bisect_right(self._tops, y) - 1)
+
+    def pages_in_range(self, y0: float, y1: float) -> list[int]:
+        """Mencari halaman yang beririsan dengan rentang vertikal scene.
+
+        Args:
+            y0 (float): Batas atas rentang.
+            y1 (float): Batas bawah rentang.
+
+        Returns:
+            List[int]: Indeks halaman yang beririsan, berurutan.
+
+        """
+        if not self.slots:
+            return []
+        first = self.page_at(y0)
+        last = min(len(self.slots) - 1, self.page_at(y1))
+        return list(range(first, last + 1))
@@ -0,0 +1,127 @@
+"""Modul indeks pengelompokan baris horizontal untuk data CSV overlay.
+
+Setiap halaman memiliki daftar kotak yang diurutkan menurut sumbu tengah
+vertikalnya. Pencarian kelompok untuk satu baris menjadi dua pencarian
+biner (``searchsorted``) alih-alih pemindaian penuh, dan indeks tidak
+bergantung pada toleransi sehingga perubahan toleransi dari toolbar tidak
+memerlukan pembangunan ulang.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+import numpy as np
+
+from model.box_table import BoxTable
+
+from .cache_mgr import LRUCache
+
+# Jumlah halaman maksimum yang indeksnya disimpan
+LINE_GROUP_INDEX_BUDGET: int = 16
+
+
+class LineGroupIndex:
+    """Indeks kotak satu halaman yang terurut menurut sumbu tengah vertikal.
+
+    Attributes:
+        table (BoxTable): Tabel sumber indeks.
+
+    """
+
+    def __init__(self, table: BoxTable) -> None:
+        """Membangun indeks terurut dari tabel kotak.
+
+        Args:
+            table (BoxTable): Tabel baris CSV satu halaman.
+
+        """
+        self.table: BoxTable = table
+        coords: np.ndarray = table.coords.astype(np.float64)
+        centers: np.ndarray = (coords[:, 1] + coords[:, 3]) / 2
+
+        # Urutan stabil agar kotak dengan sumbu sama tetap berurutan naik
+        self._order: np.ndarray = np.argsort(centers, kind="stable")
+        self._centers: np.ndarray = centers[self._order]
+        self._clusters: dict[float, list[np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        """Jumlah kotak yang diindeks."""
+        return len(self._order)
+
+    def group_of(self, index: int, tolerance: float) -> np.ndarray:
+        """Mencari kotak yang sumbunya berjarak paling jauh ``tolerance``.
+
+        Args:
+            index (int): Indeks kotak acuan dalam tabel.
+            tolerance (float): Jarak maksimum antar sumbu tengah (poin PDF).
+
+        Returns:
+            np.ndarray: Indeks kotak dalam kelompok, termasuk kotak acuan.
+
+        """
+        c0, c1 = self.table.coords[index, 1], self.table.coords[index, 3]
+        center: float = (float(c0) + float(c1)) / 2
+        lo: int = int(np.searchsorted(self._centers, center - tolerance, "left"))
+        hi: int = int(np.searchsorted(self._centers, center + tolerance, "right"))
+        return self._order[lo:hi]
+
+    def clusters(self, tolerance: float) -> list[np.ndarray]:
+        """Membagi seluruh kotak halaman menjadi kelompok baris sekaligus.
+
+        Kotak yang berurutan menurut sumbu tengah digabung selama jaraknya
+        ke kotak sebelumnya tidak melebihi ``tolerance``. Hasil disimpan per
+        nilai toleransi.
+
+        Args:
+            tolerance (float): Jarak maksimum antar sumbu yang berdekatan.
+
+        Returns:
+            List[np.ndarray]: Indeks kotak per kelompok, dari atas ke bawah.
+
+        """
+        cached = self._clusters.get(tolerance)
+        if cached is None:
+            breaks = np.flatnonzero(np.diff(self._centers) > tolerance) + 1
+            cached = np.split(self._order, breaks) if len(self) else []
+            self._clusters[tolerance] = cached
+        return cached
+
+
+class LineGroupManager:
+    """Penyimpan indeks pengelompokan baris per halaman.
+
+    Indeks dibangun malas saat pertama kali dibutuhkan dan dibangun ulang
+    otomatis jika objek tabel sumbernya berganti (misal CSV disimpan ulang).
+    Hanya indeks halaman yang terakhir dipakai yang disimpan (LRU).
+    """
+
+    def __init__(self, budget: int = LINE_GROUP_INDEX_BUDGET) -> None:
+        """Inisialisasi penyimpan indeks kosong.
+
+        Args:
+            budget (int): Jumlah halaman maksimum yang indeksnya disimpan.
+
+        """
+        self._indexes: LRUCache = LRUCache(budget)
+
+    def index_for(self, key: Hashable, table: BoxTable) -> LineGroupIndex:
+        """Mengambil indeks untuk tabel tertentu, membangunnya bila perlu.
+
+        Args:
+            key (Hashable): Kunci indeks, misal nomor halaman.
+            table (BoxTable): Tabel baris CSV halaman tersebut.
+
+        Returns:
+            LineGroupIndex: Indeks terurut atas ``table``.
+
+        """
+        index: LineGroupIndex | None = self._indexes.get(key)
+        if index is None or index.table is not table:
+            index = LineGroupIndex(table)
+            self._indexes.put(key, index)
+        return index
+
+    def clear(self) -> None:
+        """Menghapus seluruh indeks, misal saat dokumen atau CSV dimuat ulang."""
+        self._indexes.clear()
@@ -9,14 +9,56 @@ from __future__ import annotations
 
 import csv
 import os
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
 from typing import Any
 
 import fitz  # PyMuPDF
+import numpy as np
+from PyQt6.QtCore import Qt, QTimer
+
+from model.box_table import EMPTY_TABLE, BoxTable
+from model.page_info import PageInfo
 
 from .app_state import app_state
+from .cache_mgr import pixmap_cache
 from .document_mgr import DocumentManager
-from .export_mgr import ExportManager
+from .export_mgr import ExportJob, ExportManager
+from .layout_mgr import ContinuousLayout
+from .line_group_mgr import LineGroupIndex, LineGroupManager
 from .overlay_mgr import OverlayManager
+from .page_info_mgr import PageInfoManager
+from .prefetch_mgr import PrefetchManager
+from .render_mgr import RenderJob, RenderManager
+from .render_worker import PixmapData
+from .search_mgr import SearchHit, SearchIndex
+from .spatial_mgr import SpatialIndexManager
+from .tile_mgr import TileManager
+
+# Jeda tanpa input sebelum render tajam setelah pratinjau zoom (ms)
+ZOOM_DEBOUNCE_MS: int = 250
+
+# Zoom render cepat (placeholder) sebelum pixmap resolusi penuh tiba
+PREVIEW_ZOOM: float = 0.25
+
+# Ambang zoom tingkat detail layer teks, dari yang paling kasar: di bawah
+# ambang pertama kata ditampilkan sebagai rona satu halaman, lalu kotak blok,
+# lalu kotak baris; di atas ambang terakhir setiap kata digambar sendiri.
+LOD_ZOOM_THRESHOLDS: tuple[tuple[float, str], ...] = (
+    (0.15, "page"),
+    (0.3, "block"),
+    (0.5, "line"),
+)
+
+# Jeda sebelum slot mode kontinu disusun ulang setelah ukuran halaman tiba
+RELAYOUT_DEBOUNCE_MS: int = 300
+
+# Jumlah catatan waktu tampil halaman yang disimpan
+PAINT_METRICS_LIMIT: int = 200
+
+# Jumlah proses pekerja render (halaman aktif, prefetch, dan scan metadata)
+RENDER_WORKERS: int = 2
 
 
 class PDFController:
@@ -32,9 +74,43 @@ class PDFController:
         _doc_mgr (DocumentManager): Manajer untuk operasi manipulasi dokumen.
         _overlay_mgr (OverlayManager): Manajer untuk kontrol lapisan overlay visual.
         _export_mgr (ExportManager): Manajer untuk fungsionalitas ekspor data.
+        _export_jobs (List[ExportJob]): Job ekspor dokumen ini yang masih
+            berjalan di latar belakang.
+        _render_mgr (RenderManager): Pekerja render pixmap di latar belakang.
+        _prefetch_mgr (PrefetchManager): Penjadwal prefetch halaman tetangga.
+        _page_info_mgr (PageInfoManager): Tabel metadata halaman yang diisi
+            pemindaian latar belakang.
+        _tile_mgr (TileManager): Kalkulator grid tile untuk zoom tinggi.
+        _line_group_mgr (LineGroupManager): Indeks baris terurut per halaman
+            untuk pengelompokan baris horizontal.
+        _tiled (bool): True jika halaman aktif dirender per tile.
+        _view_zoom (float): Zoom yang sedang ditampilkan oleh scene; berbeda
+            dari ``model.zoom_level`` selama pratinjau zoom berlangsung.
+        _zoom_timer (QTimer): Timer debounce untuk render tajam setelah zoom.
+        _awaiting_sharp (Optional[Tuple[int, float]]): Halaman dan zoom yang
+            pixmap resolusi penuhnya masih ditunggu.
+        _paint_metric (Optional[Dict[str, Any]]): Catatan waktu tampil
+            halaman yang sedang berlangsung.
+        paint_metrics (Deque[Dict[str, Any]]): Riwayat waktu first paint dan
+            time-to-sharp per tampilan halaman.
+        _layout (Optional[ContinuousLayout]): Tata letak slot halaman mode kontinu.
+        _continuous_wanted (Set[int]): Halaman di sekitar viewport mode kontinu.
+        _continuous_tiles (Set[Tuple[int, int, int]]): Tile (halaman, kolom,
+            baris) di sekitar viewport untuk halaman yang dirender per tile.
+        _continuous_shown (Set[int]): Halaman yang pixmap dan overlay-nya
+            sudah berada di scene mode kontinu.
+        _band_ids (Set[str]): ID baris hasil seleksi rubber-band terakhir.
+        _search_index (SearchIndex): Indeks teks penuh yang diisi bertahap
+            oleh pemindaian halaman.
+        _search_hits (List[SearchHit]): Hasil pencarian terakhir.
+        _search_pos (int): Indeks hasil pencarian yang sedang disorot.
+        _search_tables (Dict[int, BoxTable]): Kotak hasil pencarian per halaman.
+        _doc_key (Tuple): Identitas dokumen (path, mtime) untuk kunci cache pixmap.
         _group_tolerance (float): Nilai toleransi jarak untuk pengelompokan elemen teks.
-        _page_data_cache (List[List[Any]]): Penyimpanan sementara data CSV per halaman.
-        _words_cache (Dict[int, List[Any]]): Penyimpanan sementara koordinat kata PDF.
+        lod_thresholds (Tuple[Tuple[float, str], ...]): Ambang zoom tingkat
+            detail layer teks, berurutan naik.
+        _page_data_cache (BoxTable): Data CSV halaman aktif dalam bentuk kolom.
+        _words_cache (Dict[int, BoxTable]): Penyimpanan sementara kotak kata PDF.
 
     """
 
@@ -52,20 +128,126 @@ class PDFController:
         self._doc_mgr: DocumentManager = DocumentManager(self.model)
         self._overlay_mgr: OverlayManager = OverlayManager()
         self._export_mgr: ExportManager = ExportManager()
+        self._export_jobs: list[ExportJob] = []
+        # Lebih dari satu proses: prefetch/scan yang sedang berjalan tidak
+        # menahan render halaman aktif yang diminta sesudahnya
+        self._render_mgr: RenderManager = RenderManager(workers=RENDER_WORKERS)
+        self._render_mgr.job_finished.connect(
+            self._on_render_finished, Qt.ConnectionType.QueuedConnection
+        )
+        self._prefetch_mgr: PrefetchManager = PrefetchManager(self._render_mgr)
+        self._page_info_mgr: PageInfoManager = PageInfoManager(self._render_mgr)
+        self._tile_mgr: TileManager = TileManager()
+        self._spatial_mgr: SpatialIndexManager = SpatialIndexManager()
+        self._line_group_mgr: LineGroupManager = LineGroupManager()
+        self._band_ids: set[str] = set()
+        self._tiled: bool = False
+        self._wanted_tiles: set[tuple[int, int]] = set()
+        self._shown_tiles: set[tuple[int, int]] = set()
+        self._view_zoom: float = self.model.zoom_level
+        self._zoom_timer: QTimer = QTimer()
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(ZOOM_DEBOUNCE_MS)
+        self._zoom_timer.timeout.connect(lambda: self._refresh(full_refresh=True))
+        self._awaiting_sharp: tuple[int, float] | None = None
+        self._paint_metric: dict[str, Any] | None = None
+        self.paint_metrics: deque[dict[str, Any]] = deque(maxlen=PAINT_METRICS_LIMIT)
+        self._layout: ContinuousLayout | None = None
+        self._layout_vw: float = 0
+        self._relayout_timer: QTimer = QTimer()
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(RELAYOUT_DEBOUNCE_MS)
+        self._relayout_timer.timeout.connect(self._relayout_continuous)
+        self._continuous_wanted: set[int] = set()
+        self._continuous_shown: set[int] = set()
+        # Tile (halaman, kolom, baris) halaman zoom tinggi di mode kontinu
+        self._continuous_tiles: set[tuple[int, int, int]] = set()
+        self._continuous_tiles_shown: set[tuple[int, int, int]] = set()
+        self._jump_y: float | None = None
+        self._pending_highlight: bool = False
+        self._search_index: SearchIndex = SearchIndex()
+        self._search_hits: list[SearchHit] = []
+        self._search_pages: list[int] = []  # Halaman setiap hasil, berurutan
+        self._search_pos: int = 0
+        self._search_tables: dict[int, BoxTable] = {}
+        self._pending_search_focus: bool = False
 
         # Konfigurasi Internal
         self._group_tolerance: float = 2.0
-        self._page_data_cache: list[list[Any]] = []  # Cache data CSV per halaman
-        self._words_cache: dict[int, list[Any]] = (
-            {}
-        )  # Cache teks PDF: {page_index: words_list}
+        self.lod_thresholds: tuple[tuple[float, str], ...] = LOD_ZOOM_THRESHOLDS
+        self._doc_key: tuple[str, float] = ("", 0.0)
+        self._page_data_cache: BoxTable = EMPTY_TABLE  # Cache data CSV per halaman
+        self._words_cache: dict[int, BoxTable] = {}  # Cache teks PDF per halaman
 
         # SINKRONISASI GLOBAL
         app_state.visibility_changed.connect(self._on_global_state_changed)
 
+    def _page_geometry(
+        self, page: fitz.Page, z: float
+    ) -> tuple[float, float, tuple[float, float, float, float]]:
+        """Menghitung offset halaman dan area scene untuk level zoom tertentu.
+
+        Ukuran piksel dihitung dengan pembulatan yang sama seperti
+        ``page.get_pixmap`` sehingga posisi overlay tidak bergeser saat
+        pixmap hasil render latar belakang tiba.
+
+        Args:
+            page (fitz.Page): Halaman yang akan ditampilkan.
+            z (float): Tingkat zoom.
+
+        Returns:
+            Tuple: Offset (ox, oy) dan area render (x, y, w, h).
+
+        """
+        vw: float
+        vw, _ = self.view.get_viewport_size()
+        pix_rect: fitz.IRect = (page.rect * fitz.Matrix(z, z)).irect
+        ox: float = max(0, (vw - pix_rect.width) / 2)
+        oy: float = self.model.padding
+        region: tuple[float, float, float, float] = (
+            0,
+            0,
+            max(vw, pix_rect.width),
+            pix_rect.height + (oy * 2),
+        )
+        return ox, oy, region
+
+    def _pixmap_key(
+        self, p_idx: int, z: float, options: str = "rgb"
+    ) -> tuple[Any, ...]:
+        """Menyusun kunci cache pixmap untuk halaman dan zoom tertentu.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            z (float): Tingkat zoom.
+            options (str): Penanda opsi render (colorspace, alpha, dll).
+
+        Returns:
+            Tuple: Kunci ``(doc_key, page_index, zoom, options)``.
+
+        """
+        return (self._doc_key, p_idx, round(z, 4), options)
+
+    def get_cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Mengambil statistik cache untuk keperluan penyesuaian anggaran.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistik per jenis cache.
+
+        """
+        return {
+            "pixmap": pixmap_cache.stats(),
+            "displaylist": self._render_mgr.display_list_stats(),
+        }
+
     def _refresh(self, full_refresh: bool = True) -> None:
         """Memperbarui tampilan viewer PDF dan lapisan overlay secara komprehensif.
 
+        Pada ``full_refresh`` rasterisasi dijadwalkan ke pekerja latar
+        belakang. Jika pixmap belum ada di cache, placeholder resolusi rendah
+        ditampilkan lebih dulu lalu diganti pixmap tajam saat tiba melalui
+        :meth:`_on_render_finished`.
+
         Args:
             full_refresh (bool): Jika True, melakukan rendering ulang pixmap.
 
@@ -75,65 +257,706 @@ class PDFController:
 
         p_idx: int = self.model.current_page
         page: fitz.Page = self.model.doc[p_idx]
-        vw: float
-        vw, _ = self.view.get_viewport_size()
         z: float = self.model.zoom_level
 
         # SINKRONISASI STATUS LAYER
         self._overlay_mgr.show_text_layer = app_state.get_visibility("text_layer")
         self._overlay_mgr.show_csv_layer = app_state.get_visibility("csv_layer")
 
-        # TAHAP 1: RENDERING RASTER (PIXMAP)
-        ox: float
-        oy: float
+        # TAHAP 1: RENDERING RASTER (PIXMAP) DARI CACHE / LATAR BELAKANG
         if full_refresh:
-            pix: fitz.Pixmap = page.get_pixmap(matrix=fitz.Matrix(z, z))
-            ox, oy = max(0, (vw - pix.width) / 2), self.model.padding
-            region: tuple[float, float, float, float] = (
-                0,
-                0,
-                max(vw, pix.width),
-                pix.height + (oy * 2),
-            )
-            self.view.display_page(pix, ox, oy, region)
-            self.view.draw_rulers(page.rect.width, page.rect.height, ox, oy, z)
+            self._zoom_timer.stop()
 
             # Ambil data CSV dari cache memori
             self._page_data_cache = self._overlay_mgr.get_csv_data(p_idx + 1)
+
+        if full_refresh and self.model.continuous:
+            self._refresh_continuous(p_idx, z)
+        elif full_refresh:
+            self._begin_paint_metric(p_idx, z)
+            pix_rect: fitz.IRect = (page.rect * fitz.Matrix(z, z)).irect
+            tiled: bool = self._tile_mgr.should_tile(pix_rect.width, pix_rect.height)
+            cached: PixmapData | None = (
+                None if tiled else pixmap_cache.get(self._pixmap_key(p_idx, z))
+            )
+            if tiled or cached is not None:
+                # Zoom tinggi (per tile) atau cache hit: tampil tanpa menunggu
+                self._render_mgr.cancel("page")
+                self._render_mgr.cancel("preview")
+                self._show_page(p_idx, page, z, cached)
+            else:
+                self._awaiting_sharp = (p_idx, z)
+                self._render_mgr.submit(p_idx, z)
+                self._show_placeholder(p_idx, page, z)
         else:
-            ox = max(0, (vw - (page.rect.width * z)) / 2)
-            oy = self.model.padding
+            self._redraw_overlays()
 
-        # TAHAP 2: RENDERING TEXT LAYER (CACHING)
-        if p_idx not in self._words_cache:
-            self._words_cache[p_idx] = page.get_text("words")
+        # TAHAP 4: SINKRONISASI UI & STATE
+        self._sync_ui_info(p_idx, page, z)
 
-        if self._overlay_mgr.show_text_layer:
-            self.view.draw_text_layer(self._words_cache[p_idx], ox, oy, z)
-        else:
-            self.view.clear_overlay_layer("text_layer")
+    def _redraw_overlays(self) -> None:
+        """Menggambar ulang overlay halaman yang ada di scene tanpa render pixmap.
 
-        # TAHAP 3: RENDERING CSV OVERLAY
-        if self._overlay_mgr.show_csv_layer:
-            self.view.draw_csv_layer(self._page_data_cache, ox, oy, z)
+        Layer yang data dan geometrinya tidak berubah tidak dibangun ulang
+        oleh view, sehingga pemanggilan ini murah jika tidak ada perubahan.
+        """
+        if self.model.continuous and self._layout is not None:
+            # TAHAP 2 & 3: OVERLAY untuk setiap halaman yang ada di scene
+            for shown in sorted(self._continuous_shown):
+                x, y, _, _ = self._layout.slots[shown]
+                self._draw_overlays(
+                    shown, self.model.doc[shown], x, y, self._view_zoom, True
+                )
         else:
-            self.view.clear_overlay_layer("csv_layer")
+            # TAHAP 2 & 3: OVERLAY mengikuti zoom yang sedang ditampilkan scene
+            page: fitz.Page = self.model.doc[self.model.current_page]
+            ox, oy, _ = self._page_geometry(page, self._view_zoom)
+            self._draw_overlays(self.model.current_page, page, ox, oy, self._view_zoom)
 
-        # TAHAP 4: SINKRONISASI UI & STATE
+    def _sync_ui_info(self, p_idx: int, page: fitz.Page, z: float) -> None:
+        """Memperbarui informasi halaman, zoom, dan status dokumen pada UI.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            page (fitz.Page): Halaman aktif.
+            z (float): Tingkat zoom yang ditampilkan pada UI.
+
+        """
         self.model.has_csv = os.path.exists(self.model.csv_path or "")
+        info: PageInfo = self._page_info_mgr.info(self.model.doc, p_idx)
         self.view.update_ui_info(
             p_idx + 1,
             self.model.total_pages,
             z,
-            bool(page.get_text().strip()),
-            page.rect.width,
-            page.rect.height,
+            info.has_text,
+            info.width,
+            info.height,
             self.model.has_csv,
         )
         self.view.set_grouping_control_state(self.model.doc is not None)
 
-        if self.model.selected_row_id:
-            self.view.update_highlight_only(self.model.selected_row_id)
+    def _show_page(
+        self, p_idx: int, page: fitz.Page, z: float, pix: PixmapData | None
+    ) -> None:
+        """Menampilkan halaman beserta penggaris dan overlay pada zoom tertentu.
+
+        Pixmap beresolusi lebih rendah (placeholder) diperbesar ke ukuran
+        halaman pada zoom ``z`` sehingga geometri halaman dan posisi overlay
+        sama persis dengan saat pixmap tajam tiba.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            page (fitz.Page): Halaman yang ditampilkan.
+            z (float): Tingkat zoom tampilan.
+            pix (Optional[PixmapData]): Pixmap halaman utuh, atau None
+                jika halaman dirender per tile.
+
+        """
+        ox, oy, region = self._page_geometry(page, z)
+        self._view_zoom = z
+        self._tiled = pix is None
+        sharp: bool = True
+        if self._tiled:
+            # Zoom tinggi: hanya tile di sekitar viewport yang dirender
+            self._wanted_tiles, self._shown_tiles = set(), set()
+            self.view.prepare_tiled_page(region)
+        else:
+            pix_w: int = (page.rect * fitz.Matrix(z, z)).irect.width
+            sharp = pix.width == pix_w
+            self.view.display_page(pix, ox, oy, region, pix_w / pix.width)
+            self._mark_paint(sharp)
+        if sharp:
+            self._awaiting_sharp = None
+        self.view.draw_rulers(page.rect.width, page.rect.height, ox, oy, z)
+        self._draw_overlays(p_idx, page, ox, oy, z)
+        if sharp:
+            self._request_tiles()
+            self._schedule_prefetch()
+
+    def _show_placeholder(self, p_idx: int, page: fitz.Page, z: float) -> None:
+        """Menampilkan render resolusi rendah selagi pixmap tajam dirender.
+
+        Thumbnail dari cache dipakai jika tersedia; jika tidak, render cepat
+        pada ``PREVIEW_ZOOM`` dijadwalkan dengan prioritas di atas render
+        resolusi penuh.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            page (fitz.Page): Halaman yang akan ditampilkan.
+            z (float): Tingkat zoom target.
+
+        """
+        if z <= PREVIEW_ZOOM * 2:
+            return  # Render penuh sudah cukup murah
+        thumb: PixmapData | None = pixmap_cache.get(
+            self._pixmap_key(p_idx, PREVIEW_ZOOM)
+        )
+        if thumb is not None:
+            self._render_mgr.cancel("preview")
+            self._show_page(p_idx, page, z, thumb)
+        else:
+            self._render_mgr.submit(p_idx, PREVIEW_ZOOM, "preview", priority=-1)
+
+    def _begin_paint_metric(self, p_idx: int, z: float) -> None:
+        """Memulai pencatatan waktu tampil untuk satu tampilan halaman.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            z (float): Tingkat zoom yang diminta.
+
+        """
+        self._paint_metric = {
+            "page": p_idx + 1,
+            "zoom": z,
+            "start": time.perf_counter(),
+            "first_paint_ms": None,
+            "sharp_ms": None,
+        }
+
+    def _mark_paint(self, sharp: bool) -> None:
+        """Mencatat waktu first paint dan, jika tajam, time-to-sharp.
+
+        Args:
+            sharp (bool): True jika yang tampil adalah resolusi penuh.
+
+        """
+        metric = self._paint_metric
+        if metric is None:
+            return
+        elapsed_ms: float = (time.perf_counter() - metric["start"]) * 1000
+        if metric["first_paint_ms"] is None:
+            metric["first_paint_ms"] = elapsed_ms
+        if sharp:
+            metric["sharp_ms"] = elapsed_ms
+            self.paint_metrics.append(metric)
+            self._paint_metric = None
+
+    def _draw_overlays(
+        self,
+        p_idx: int,
+        page: fitz.Page,
+        ox: float,
+        oy: float,
+        z: float,
+        continuous: bool = False,
+    ) -> None:
+        """Menggambar lapisan teks, CSV, dan highlight untuk satu halaman.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            page (fitz.Page): Halaman yang digambar.
+            ox (float): Offset horizontal halaman.
+            oy (float): Offset vertikal halaman.
+            z (float): Tingkat zoom.
+            continuous (bool): True jika overlay milik satu slot halaman pada
+                mode kontinu; item diberi tanda halaman agar bisa dilepas.
+
+        """
+        page_tag: int | None = p_idx if continuous else None
+
+        # Layer tersembunyi tidak dibangun; isinya dibiarkan di wadah layer
+        # yang tersembunyi dan diperbarui saat layer ditampilkan lagi.
+        self.view.set_layer_visible("text_layer", self._overlay_mgr.show_text_layer)
+        self.view.set_layer_visible("csv_layer", self._overlay_mgr.show_csv_layer)
+
+        # TAHAP 2: RENDERING TEXT LAYER (CACHING)
+        if self._overlay_mgr.show_text_layer:
+            if p_idx not in self._words_cache:
+                self._words_cache[p_idx] = BoxTable.from_words(page.get_text("words"))
+            words: BoxTable = self._words_cache[p_idx].coarse(self._lod_level(z))
+            self.view.draw_text_layer(words, ox, oy, z, page_tag)
+
+        # TAHAP 3: RENDERING CSV OVERLAY
+        if self._overlay_mgr.show_csv_layer:
+            csv_data: BoxTable = (
+                self._overlay_mgr.get_csv_data(p_idx + 1)
+                if continuous
+                else self._page_data_cache
+            )
+            self.view.draw_csv_layer(csv_data, ox, oy, z, page_tag)
+
+        # LAYER HASIL PENCARIAN (tabel kosong menghapus layer halaman ini)
+        self.view.draw_search_layer(self._search_table(p_idx), ox, oy, z, page_tag)
+        if self._search_hits and self._search_hits[self._search_pos].page == p_idx:
+            self.view.focus_search_hit(
+                self._search_pos, page_tag, self._pending_search_focus
+            )
+            self._pending_search_focus = False
+
+        if not continuous:
+            if self.model.selected_row_id:
+                self.view.update_highlight_only(
+                    self.model.selected_row_id, self._get_grouped_ids()
+                )
+        elif self._pending_highlight and p_idx == self.model.current_page:
+            # Mode kontinu: pusatkan highlight hanya setelah navigasi eksplisit
+            self._pending_highlight = False
+            if self.model.selected_row_id:
+                self.view.update_highlight_only(
+                    self.model.selected_row_id, self._get_grouped_ids()
+                )
+
+    def _lod_level(self, z: float) -> str:
+        """Menentukan tingkat detail layer teks untuk zoom tertentu.
+
+        Args:
+            z (float): Tingkat zoom.
+
+        Returns:
+            str: ``"page"``, ``"block"``, ``"line"``, atau ``"word"``.
+
+        """
+        for threshold, level in self.lod_thresholds:
+            if z < threshold:
+                return level
+        return "word"
+
+    def _page_sizes(self) -> list[tuple[float, float]]:
+        """Mengambil ukuran seluruh halaman dokumen dalam poin PDF.
+
+        Halaman yang belum dipindai memakai ukuran sementara; slot mode
+        kontinu disusun ulang oleh :meth:`_relayout_continuous` saat ukuran
+        sebenarnya tiba.
+
+        Returns:
+            List[Tuple[float, float]]: Lebar dan tinggi setiap halaman.
+
+        """
+        return self._page_info_mgr.sizes(self.model.doc)
+
+    def set_continuous(self, enabled: bool) -> None:
+        """Mengaktifkan atau menonaktifkan mode scroll kontinu.
+
+        Args:
+            enabled (bool): True untuk menampilkan seluruh halaman berurutan.
+
+        """
+        self.model.continuous = enabled
+        self._layout = None
+        self._refresh(full_refresh=True)
+
+    def _refresh_continuous(self, p_idx: int, z: float, offset: float = 0.0) -> None:
+        """Menyusun scene mode kontinu lalu menggulir ke halaman aktif.
+
+        Scene hanya dibangun ulang jika zoom atau lebar viewport berubah;
+        navigasi halaman cukup menggulir ke slot halaman tujuan.
+
+        Args:
+            p_idx (int): Indeks halaman aktif (0-indexed).
+            z (float): Tingkat zoom.
+            offset (float): Posisi gulir di dalam halaman aktif sebagai
+                pecahan tinggi halaman (0 = tepi atas).
+
+        """
+        vw: float
+        vw, _ = self.view.get_viewport_size()
+        if self._layout is None or self._layout.zoom != z or self._layout_vw != vw:
+            self._render_mgr.cancel("page")
+            self._render_mgr.cancel("preview")
+            self._layout = ContinuousLayout(
+                self._page_sizes(), z, self.model.padding, vw
+            )
+            self._layout_vw = vw
+            self._view_zoom = z
+            self._tiled = False
+            self._continuous_wanted, self._continuous_shown = set(), set()
+            self._continuous_tiles, self._continuous_tiles_shown = set(), set()
+            self.view.prepare_continuous_scene(self._layout.slots, self._layout.region)
+
+        _, y, _, h = self._layout.slots[p_idx]
+        self.view.scroll_to(y + offset * h - self.model.padding)
+        self._jump_y = self.view.get_visible_rect()[1]
+        self._draw_continuous_rulers(p_idx)
+        self._update_continuous()
+        if self._pending_highlight and p_idx in self._continuous_shown:
+            self._pending_highlight = False
+            if self.model.selected_row_id:
+                self.view.update_highlight_only(
+                    self.model.selected_row_id, self._get_grouped_ids()
+                )
+
+    def _draw_continuous_rulers(self, p_idx: int) -> None:
+        """Menyelaraskan penggaris dengan slot halaman aktif mode kontinu.
+
+        Args:
+            p_idx (int): Indeks halaman aktif (0-indexed).
+
+        """
+        x, y, _, _ = self._layout.slots[p_idx]
+        w, h = self._layout.sizes[p_idx]
+        self.view.draw_rulers(w, h, x, y, self._view_zoom)
+
+    def _relayout_continuous(self) -> None:
+        """Menyusun ulang slot mode kontinu dengan ukuran halaman terbaru.
+
+        Posisi gulir dipertahankan relatif terhadap halaman aktif sehingga
+        isi yang sedang dibaca tidak melompat.
+        """
+        if not self.model.continuous or self._layout is None or not self.model.doc:
+            return
+        if self._zoom_timer.isActive():
+            return  # Render ulang zoom akan menyusun slot dengan ukuran terbaru
+        p_idx: int = self.model.current_page
+        _, y, _, h = self._layout.slots[p_idx]
+        vy: float = self.view.get_visible_rect()[1] + self.model.padding
+        offset: float = (vy - y) / h if h else 0.0
+        self._layout = None
+        self._refresh_continuous(p_idx, self._view_zoom, offset)
+
+    def _update_continuous(self) -> None:
+        """Memuat halaman di sekitar viewport dan melepas yang sudah jauh.
+
+        Halaman dalam jarak satu tinggi viewport di atas dan di bawah area
+        visibel diberi pixmap dan overlay; halaman lain hanya tampil sebagai
+        placeholder yang digambar view, sehingga jumlah item scene dan memori
+        tetap terbatas berapa pun panjang dokumen. Halaman yang pada zoom
+        aktif melewati ambang mode tile hanya dirender tile-nya yang dekat
+        viewport, sama seperti mode satu halaman.
+        """
+        if not self.model.continuous or self._layout is None or not self.model.doc:
+            return
+        if self._zoom_timer.isActive():
+            return  # Scene sedang dalam pratinjau zoom; tunggu render ulang
+        layout: ContinuousLayout = self._layout
+        z: float = self._view_zoom
+        _, vy, _, vh = self.view.get_visible_rect()
+
+        # Halaman aktif mengikuti posisi scroll (kecuali tepat setelah lompat)
+        if self._jump_y is None or abs(vy - self._jump_y) > 1:
+            self._jump_y = None
+            top_page: int = layout.page_at(vy + self.model.padding)
+            if top_page != self.model.current_page:
+                self.model.current_page = top_page
+                self._page_data_cache = self._overlay_mgr.get_csv_data(top_page + 1)
+                self._draw_continuous_rulers(top_page)
+                self._sync_ui_info(top_page, self.model.doc[top_page], z)
+
+        wanted: list[int] = layout.pages_in_range(vy - vh, vy + 2 * vh)
+        center: float = vy + vh / 2
+        wanted.sort(key=lambda i: abs(layout.slots[i][1] - center))
+        self._continuous_wanted = set(wanted)
+        self._continuous_shown &= self._continuous_wanted
+        self.view.release_pages(self._continuous_wanted)
+
+        self._render_mgr.cancel("continuous")
+        visible: tuple[float, float, float, float] = self.view.get_visible_rect()
+        tiles: list[tuple[int, int, int]] = []
+        for p_idx in wanted:
+            x, y, pw, ph = layout.slots[p_idx]
+            if self._tile_mgr.should_tile(pw, ph):
+                tiles += [
+                    (p_idx, *tile)
+                    for tile in self._tile_mgr.visible_tiles(visible, x, y, pw, ph)
+                ]
+                if p_idx not in self._continuous_shown:
+                    self._show_continuous_page(p_idx, None)
+                continue
+            if p_idx in self._continuous_shown:
+                continue
+            cached: PixmapData | None = pixmap_cache.get(self._pixmap_key(p_idx, z))
+            if cached is not None:
+                self._show_continuous_page(p_idx, cached)
+            else:
+                self._render_mgr.submit(p_idx, z, "continuous", supersede=False)
+        self._request_continuous_tiles(tiles)
+
+    def _request_continuous_tiles(self, tiles: list[tuple[int, int, int]]) -> None:
+        """Menampilkan atau menjadwalkan tile halaman zoom tinggi mode kontinu.
+
+        Args:
+            tiles (List[Tuple[int, int, int]]): Tile (halaman, kolom, baris)
+                yang dibutuhkan, terdekat dengan viewport lebih dulu.
+
+        """
+        z: float = self._view_zoom
+        self._continuous_tiles = set(tiles)
+        self._continuous_tiles_shown &= self._continuous_tiles
+        self.view.prune_tiles(self._continuous_tiles)
+        for key in tiles:
+            if key in self._continuous_tiles_shown:
+                continue
+            p_idx, tile = key[0], key[1:]
+            cached: PixmapData | None = pixmap_cache.get(self._tile_key(p_idx, z, tile))
+            if cached is not None:
+                self._show_continuous_tile(p_idx, tile, cached)
+            else:
+                self._render_mgr.submit(
+                    p_idx,
+                    z,
+                    "continuous",
+                    "tile",
+                    supersede=False,
+                    tile=tile,
+                    clip=self._tile_mgr.clip_for(tile, z),
+                )
+
+    def _show_continuous_tile(
+        self, p_idx: int, tile: tuple[int, int], pix: PixmapData
+    ) -> None:
+        """Menempatkan satu tile pada slot halamannya di mode kontinu.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            tile (Tuple[int, int]): Indeks tile (kolom, baris).
+            pix (PixmapData): Pixmap tile.
+
+        """
+        x, y, _, _ = self._layout.slots[p_idx]
+        tx, ty = self._tile_mgr.tile_origin(tile)
+        key: tuple[int, int, int] = (p_idx, *tile)
+        self.view.display_tile(key, pix, x + tx, y + ty)
+        self._continuous_tiles_shown.add(key)
+
+    def _show_continuous_page(self, p_idx: int, pix: PixmapData | None) -> None:
+        """Menempatkan pixmap dan overlay satu halaman pada slot mode kontinu.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            pix (Optional[PixmapData]): Pixmap halaman, atau None jika
+                halaman dirender per tile.
+
+        """
+        x, y, _, _ = self._layout.slots[p_idx]
+        if pix is not None:
+            self.view.display_page_item(p_idx, pix, x, y)
+        self._continuous_shown.add(p_idx)
+        self._draw_overlays(p_idx, self.model.doc[p_idx], x, y, self._view_zoom, True)
+
+    def _on_render_finished(self, job: RenderJob) -> None:
+        """Menerima pixmap dari pekerja render dan menampilkannya.
+
+        Hasil dari permintaan yang sudah digantikan (misal karena pengguna
+        membalik halaman dengan cepat) dibuang sehingga tampilan selalu
+        berakhir pada halaman yang terakhir diminta.
+
+        Args:
+            job (RenderJob): Pekerjaan render yang telah selesai.
+
+        """
+        if job.path != self.model.file_path:
+            return
+        if job.error is not None:
+            self._on_render_failed(job)
+            return
+        if job.kind == "words":
+            self._words_cache.setdefault(job.page_index, job.result)
+            return
+        if job.kind == "meta":
+            if self._page_info_mgr.store(job):
+                self._index_page(job.page_index, job.result.words)
+                info: PageInfo = job.result.info
+                if self._layout is not None and self._layout.sizes[job.page_index] != (
+                    info.width,
+                    info.height,
+                ):
+                    # Slot disusun dengan ukuran sementara; perbarui sekali
+                    # setelah hasil pindai beruntun berhenti tiba
+                    self._relayout_timer.start()
+                if job.page_index == self.model.current_page:
+                    # Ganti placeholder ukuran dengan status teks hasil pindai
+                    self._sync_ui_info(
+                        job.page_index,
+                        self.model.doc[job.page_index],
+                        self.model.zoom_level,
+                    )
+            return
+        if job.kind == "tile":
+            self._on_tile_finished(job)
+            return
+        pixmap_cache.put(self._pixmap_key(job.page_index, job.zoom), job.result)
+        if job.channel == "preview":
+            self._on_preview_finished(job)
+            return
+        if job.channel == "continuous":
+            if (
+                self.model.continuous
+                and job.zoom == self._view_zoom
+                and job.page_index in self._continuous_wanted
+                and job.page_index not in self._continuous_shown
+            ):
+                self._show_continuous_page(job.page_index, job.result)
+            return
+        if job.channel != "page" or not self._render_mgr.is_current(job):
+            return
+        if (
+            job.page_index != self.model.current_page
+            or job.zoom != self.model.zoom_level
+        ):
+            return
+
+        page: fitz.Page = self.model.doc[job.page_index]
+        self._show_page(job.page_index, page, job.zoom, job.result)
+
+    def _on_render_failed(self, job: RenderJob) -> None:
+        """Melaporkan render yang gagal dan kembali ke placeholder halaman.
+
+        Jika render resolusi penuh halaman aktif gagal, render resolusi
+        rendah (dari cache atau dijadwalkan ulang) tetap ditampilkan agar
+        halaman tidak kosong.
+
+        Args:
+            job (RenderJob): Pekerjaan render yang gagal.
+
+        """
+        self.view.show_status_message(
+            f"Render halaman {job.page_index + 1} gagal: {job.error}"
+        )
+        if job.channel != "page" or not self._render_mgr.is_current(job):
+            return
+        if self._awaiting_sharp != (job.page_index, self.model.zoom_level):
+            return
+        thumb: PixmapData | None = pixmap_cache.get(
+            self._pixmap_key(job.page_index, PREVIEW_ZOOM)
+        )
+        if thumb is not None:
+            page: fitz.Page = self.model.doc[job.page_index]
+            self._show_page(job.page_index, page, self.model.zoom_level, thumb)
+        elif job.zoom != PREVIEW_ZOOM:
+            self._render_mgr.submit(
+                job.page_index, PREVIEW_ZOOM, "preview", priority=-1
+            )
+
+    def _on_preview_finished(self, job: RenderJob) -> None:
+        """Menampilkan placeholder resolusi rendah bila pixmap tajam belum tiba.
+
+        Args:
+            job (RenderJob): Pekerjaan render cepat yang telah selesai.
+
+        """
+        if not self._render_mgr.is_current(job):
+            return
+        if self._awaiting_sharp != (job.page_index, self.model.zoom_level):
+            return
+        page: fitz.Page = self.model.doc[job.page_index]
+        self._show_page(job.page_index, page, self.model.zoom_level, job.result)
+
+    def _tile_key(self, p_idx: int, z: float, tile: tuple[int, int]) -> tuple:
+        """Menyusun kunci cache untuk satu tile halaman.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            z (float): Tingkat zoom.
+            tile (Tuple[int, int]): Indeks tile (kolom, baris).
+
+        Returns:
+            Tuple: Kunci cache pixmap tile.
+
+        """
+        t = self._tile_mgr.tile_size
+        return self._pixmap_key(p_idx, z, f"tile{t}:{tile[0]},{tile[1]}")
+
+    def _request_tiles(self) -> None:
+        """Menampilkan atau menjadwalkan tile yang beririsan dengan viewport.
+
+        Tile di luar area viewport (plus margin) dibuang dari scene sehingga
+        memori tetap sebanding dengan ukuran viewport.
+        """
+        if not self._tiled or not self.model.doc:
+            return
+        p_idx: int = self.model.current_page
+        page: fitz.Page = self.model.doc[p_idx]
+        z: float = self._view_zoom
+        ox, oy, _ = self._page_geometry(page, z)
+        pix_rect: fitz.IRect = (page.rect * fitz.Matrix(z, z)).irect
+
+        tiles = self._tile_mgr.visible_tiles(
+            self.view.get_visible_rect(), ox, oy, pix_rect.width, pix_rect.height
+        )
+        self._wanted_tiles = set(tiles)
+        self._shown_tiles &= self._wanted_tiles
+        self.view.prune_tiles(self._wanted_tiles)
+
+        self._render_mgr.cancel("tile")
+        for tile in tiles:
+            if tile in self._shown_tiles:
+                continue
+            cached: PixmapData | None = pixmap_cache.get(self._tile_key(p_idx, z, tile))
+            if cached is not None:
+                self._show_tile(tile, cached, ox, oy)
+            else:
+                self._render_mgr.submit(
+                    p_idx,
+                    z,
+                    "tile",
+                    "tile",
+                    supersede=False,
+                    tile=tile,
+                    clip=self._tile_mgr.clip_for(tile, z),
+                )
+
+    def _show_tile(
+        self, tile: tuple[int, int], pix: PixmapData, ox: float, oy: float
+    ) -> None:
+        """Meneruskan tile ke view pada posisi yang dihitung dari indeksnya.
+
+        Posisi tidak diambil dari origin pixmap agar tidak bergantung pada
+        metadata hasil render.
+
+        Args:
+            tile (Tuple[int, int]): Indeks tile (kolom, baris).
+            pix (PixmapData): Pixmap tile.
+            ox (float): Offset horizontal halaman.
+            oy (float): Offset vertikal halaman.
+
+        """
+        tx, ty = self._tile_mgr.tile_origin(tile)
+        self.view.display_tile(tile, pix, ox + tx, oy + ty)
+        self._shown_tiles.add(tile)
+        self._mark_paint(self._wanted_tiles <= self._shown_tiles)
+
+    def _on_tile_finished(self, job: RenderJob) -> None:
+        """Menyimpan tile hasil render dan menampilkannya bila masih relevan.
+
+        Args:
+            job (RenderJob): Pekerjaan tile yang telah selesai.
+
+        """
+        pixmap_cache.put(self._tile_key(job.page_index, job.zoom, job.tile), job.result)
+        if job.channel == "continuous":
+            key: tuple[int, int, int] = (job.page_index, *job.tile)
+            if (
+                self.model.continuous
+                and self._layout is not None
+                and job.zoom == self._view_zoom
+                and key in self._continuous_tiles
+                and key not in self._continuous_tiles_shown
+            ):
+                self._show_continuous_tile(job.page_index, job.tile, job.result)
+            return
+        if (
+            not self._tiled
+            or job.page_index != self.model.current_page
+            or job.zoom != self._view_zoom
+            or job.tile not in self._wanted_tiles
+            or job.tile in self._shown_tiles
+        ):
+            return
+        page: fitz.Page = self.model.doc[job.page_index]
+        ox, oy, _ = self._page_geometry(page, job.zoom)
+        self._show_tile(job.tile, job.result, ox, oy)
+
+    def _on_viewport_scrolled(self) -> None:
+        """Meminta tile atau halaman kontinu baru saat area viewport bergeser."""
+        self._request_tiles()
+        self._update_continuous()
+
+    def _schedule_prefetch(self) -> None:
+        """Menjadwalkan render dan ekstraksi teks halaman tetangga.
+
+        Pada mode tile hanya teks yang di-prefetch; pixmap halaman utuh pada
+        zoom setinggi itu justru yang ingin dihindari.
+        """
+        z: float = self.model.zoom_level
+        tiled: bool = self._tiled
+        self._prefetch_mgr.schedule(
+            self.model.current_page,
+            z,
+            self.model.total_pages,
+            need_pixmap=lambda i: (
+                not tiled and self._pixmap_key(i, z) not in pixmap_cache
+            ),
+            need_words=lambda i: i not in self._words_cache,
+        )
 
     def _on_global_state_changed(self, tag: str, is_visible: bool) -> None:
         """Update visibilitas layer berdasarkan sinyal dari App State.
@@ -147,8 +970,10 @@ class PDFController:
             self._overlay_mgr.show_text_layer = is_visible
         elif tag == "csv_layer":
             self._overlay_mgr.show_csv_layer = is_visible
-        self._refresh(full_refresh=False)
-        print(f"[DEBUG] Global state changed: {tag} set to {is_visible}")
+        self.view.set_layer_visible(tag, is_visible)
+        if is_visible and self.model.doc:
+            # Hanya membangun isi yang belum ada atau sudah usang
+            self._redraw_overlays()
 
     def open_document(self, path: str) -> None:
         """Memuat dokumen dan melakukan pre-indexing CSV untuk performa.
@@ -163,13 +988,29 @@ class PDFController:
             self.model.file_path = path
             self.model.csv_path = path.rsplit(".", 1)[0] + ".csv"
             self._words_cache = {}
-
-            if os.path.exists(self.model.csv_path):
+            self._spatial_mgr.clear()
+            self._line_group_mgr.clear()
+            self._layout = None
+            self._doc_key = (os.path.abspath(path), os.path.getmtime(path))
+            self._render_mgr.open(path)
+            self._page_info_mgr.start(self.model.total_pages)
+
+            has_csv: bool = os.path.exists(self.model.csv_path)
+            if has_csv:
                 self._overlay_mgr.load_csv_to_cache(self.model.csv_path)
+            # Indeks pencarian memakai kolom teks CSV bila ada, selain itu kata PDF
+            self._search_index = SearchIndex("csv_layer" if has_csv else "text_layer")
+            self._set_search_hits([])
 
             self.view.set_application_title(fname)
             self._refresh(full_refresh=True)
 
+    def shutdown(self) -> None:
+        """Menghentikan pekerja latar belakang saat jendela dokumen ditutup."""
+        self._render_mgr.shutdown()
+        for job in self._export_jobs:
+            job.cancel()
+
     def save_csv_data(self, headers: list[str], data: list[list[Any]]) -> None:
         """Menyimpan data dan langsung memperbarui cache overlay.
 
@@ -191,9 +1032,13 @@ class PDFController:
                 writer.writerows(data)
 
             self._overlay_mgr.load_csv_to_cache(self.model.csv_path)
+            self._spatial_mgr.clear()
+            self._line_group_mgr.clear()
             self._page_data_cache = self._overlay_mgr.get_csv_data(
                 self.model.current_page + 1
             )
+            if self._search_index.source == "csv_layer":
+                self._rebuild_csv_search_index()
             self._refresh(full_refresh=False)
         except Exception as e:
             print(f"[ERROR] Auto-save gagal: {e}")
@@ -207,6 +1052,7 @@ class PDFController:
         """
         if self._doc_mgr.move_page(delta):
             self.model.selected_row_id = None
+            self._band_ids = set()
             self._refresh(full_refresh=True)
 
     def jump_to_page(self, page_num: int) -> None:
@@ -217,20 +1063,30 @@ class PDFController:
 
         """
         if self.model.doc and 0 < page_num <= self.model.total_pages:
+            self._prefetch_mgr.cancel_if_far(page_num - 1, self.model.zoom_level)
             self.model.current_page = page_num - 1
             self.model.selected_row_id = None
+            self._band_ids = set()
             self._refresh(full_refresh=True)
 
     def set_zoom(self, direction: str) -> None:
         """Mengatur level zoom dokumen berdasarkan arah yang diberikan.
 
+        Zoom langsung diterapkan sebagai transformasi view di atas pixmap
+        yang sedang tampil (pratinjau). Render tajam pada zoom akhir baru
+        dijalankan setelah tidak ada input selama ``ZOOM_DEBOUNCE_MS``.
+
         Args:
             direction (str): Arah zoom, 'in' atau 'out'.
 
         """
         self._doc_mgr.set_zoom(direction)
-        self._refresh(full_refresh=True)
-        print(f"Zoom level sekarang: {self.model.zoom_level}")
+        self._prefetch_mgr.cancel()
+        if self.model.doc:
+            p_idx: int = self.model.current_page
+            self.view.preview_zoom(self.model.zoom_level / self._view_zoom)
+            self._sync_ui_info(p_idx, self.model.doc[p_idx], self.model.zoom_level)
+        self._zoom_timer.start()
 
     def open_csv_table(self) -> None:
         """Membaca data dari file CSV dan menampilkannya pada panel tabel di UI."""
@@ -258,10 +1114,13 @@ class PDFController:
                 return
             target_page: int = int(row_data[1]) - 1
             self.model.selected_row_id = row_id
+            self._band_ids = set()
 
             if target_page == self.model.current_page:
-                self.view.update_highlight_only(row_id)
+                self.view.update_highlight_only(row_id, self._get_grouped_ids())
             else:
+                self._prefetch_mgr.cancel_if_far(target_page, self.model.zoom_level)
+                self._pending_highlight = True
                 self.model.current_page = target_page
                 self._refresh(full_refresh=True)
         except Exception as e:
@@ -275,7 +1134,263 @@ class PDFController:
 
         """
         self.model.selected_row_id = str(row_id)
-        self.view.update_highlight_only(row_id)
+        self._band_ids = set()
+        self.view.update_highlight_only(row_id, self._get_grouped_ids())
+
+    def _layer_boxes(self, tag: str, p_idx: int) -> BoxTable:
+        """Mengambil data kotak satu layer untuk halaman tertentu.
+
+        Args:
+            tag (str): Identitas layer, "csv_layer" atau "text_layer".
+            p_idx (int): Indeks halaman (0-indexed).
+
+        Returns:
+            BoxTable: Baris CSV atau kata PDF halaman tersebut.
+
+        """
+        if tag == "csv_layer":
+            return self._overlay_mgr.get_csv_data(p_idx + 1)
+        if p_idx not in self._words_cache:
+            page: fitz.Page = self.model.doc[p_idx]
+            self._words_cache[p_idx] = BoxTable.from_words(page.get_text("words"))
+        return self._words_cache[p_idx]
+
+    def hit_test(
+        self, p_idx: int, x: float, y: float, tag: str = "csv_layer"
+    ) -> Any | None:
+        """Mencari kotak teratas pada titik tertentu melalui indeks spasial.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            x (float): Posisi horizontal dalam poin PDF.
+            y (float): Posisi vertikal dalam poin PDF.
+            tag (str): Identitas layer yang diperiksa.
+
+        Returns:
+            Optional[Any]: Data kotak (baris CSV atau kata), atau None.
+
+        """
+        if not self.model.doc:
+            return None
+        boxes: BoxTable = self._layer_boxes(tag, p_idx)
+        hits: list[int] = self._spatial_mgr.index_for((tag, p_idx), boxes).query_point(
+            x, y
+        )
+        if not hits:
+            return None
+        if tag == "csv_layer":
+            # Kotak terpilih digambar paling atas, jadi didahulukan
+            sel_id: str = str(self.model.selected_row_id)
+            for i in hits:
+                if boxes.id_str(i) == sel_id:
+                    return boxes[i]
+        return boxes[hits[-1]]
+
+    def rows_in_rect(
+        self,
+        p_idx: int,
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+        tag: str = "csv_layer",
+    ) -> list[Any]:
+        """Mencari seluruh kotak yang beririsan dengan persegi tertentu.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            x0 (float): Batas kiri dalam poin PDF.
+            y0 (float): Batas atas dalam poin PDF.
+            x1 (float): Batas kanan dalam poin PDF.
+            y1 (float): Batas bawah dalam poin PDF.
+            tag (str): Identitas layer yang diperiksa.
+
+        Returns:
+            List[Any]: Data kotak yang beririsan, urut sesuai sumbernya.
+
+        """
+        if not self.model.doc:
+            return []
+        boxes: BoxTable = self._layer_boxes(tag, p_idx)
+        index = self._spatial_mgr.index_for((tag, p_idx), boxes)
+        return [boxes[i] for i in index.query_rect(x0, y0, x1, y1)]
+
+    def hover_info(self, p_idx: int, x: float, y: float) -> str | None:
+        """Menyusun teks informasi untuk kotak overlay di bawah kursor.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            x (float): Posisi horizontal dalam poin PDF.
+            y (float): Posisi vertikal dalam poin PDF.
+
+        Returns:
+            Optional[str]: Teks dan koordinat kotak, atau None jika tidak ada
+            kotak dari layer yang sedang tampil.
+
+        """
+        for tag, visible in (
+            ("csv_layer", self._overlay_mgr.show_csv_layer),
+            ("text_layer", self._overlay_mgr.show_text_layer),
+        ):
+            box: Any | None = self.hit_test(p_idx, x, y, tag) if visible else None
+            if box is not None:
+                return (
+                    f"Teks: {box[4]}\nx0: {box[0]:.2f}\nx1: {box[2]:.2f}"
+                    f"\ntop: {box[1]:.2f}\nbottom: {box[3]:.2f}"
+                )
+        return None
+
+    def _on_overlay_point_click(self, p_idx: int, x: float, y: float) -> None:
+        """Memilih baris CSV pada titik klik di halaman PDF.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            x (float): Posisi horizontal dalam poin PDF.
+            y (float): Posisi vertikal dalam poin PDF.
+
+        """
+        if not self._overlay_mgr.show_csv_layer:
+            return
+        row: Any | None = self.hit_test(p_idx, x, y)
+        if row is not None and row[5]:
+            self._on_overlay_click(row[5])
+
+    def _on_overlay_band_select(
+        self, p_idx: int, x0: float, y0: float, x1: float, y1: float
+    ) -> None:
+        """Memilih seluruh baris CSV di dalam area rubber-band.
+
+        Baris paling atas-kiri menjadi baris aktif; sisanya ditandai seperti
+        kelompok baris.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            x0 (float): Batas kiri dalam poin PDF.
+            y0 (float): Batas atas dalam poin PDF.
+            x1 (float): Batas kanan dalam poin PDF.
+            y1 (float): Batas bawah dalam poin PDF.
+
+        """
+        if not self._overlay_mgr.show_csv_layer:
+            return
+        rows: list[Any] = self.rows_in_rect(p_idx, x0, y0, x1, y1)
+        if not rows:
+            return
+        rows.sort(key=lambda r: (r[1], r[0]))
+        self.model.selected_row_id = str(rows[0][5])
+        self._band_ids = {str(r[5]) for r in rows}
+        self.view.update_highlight_only(
+            self.model.selected_row_id, self._get_grouped_ids()
+        )
+
+    def _index_page(self, p_idx: int, words: BoxTable) -> None:
+        """Menambahkan satu halaman hasil pemindaian ke indeks pencarian.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            words (BoxTable): Kata halaman hasil pemindaian.
+
+        """
+        if self._search_index.source == "csv_layer":
+            words = self._overlay_mgr.get_csv_data(p_idx + 1)
+        self._search_index.add_page(p_idx, words)
+
+    def _rebuild_csv_search_index(self) -> None:
+        """Membangun ulang indeks pencarian dari CSV yang baru disimpan."""
+        self._search_index = SearchIndex("csv_layer")
+        for page_num in self._overlay_mgr.csv_pages():
+            self._search_index.add_page(
+                page_num - 1, self._overlay_mgr.get_csv_data(page_num)
+            )
+        self._set_search_hits([])
+
+    def search(self, query: str) -> None:
+        """Mencari teks pada dokumen lalu menyorot hasil pertama.
+
+        Halaman yang belum selesai dipindai belum ikut dalam hasil.
+
+        Args:
+            query (str): Kueri frasa; kata berakhiran ``*`` sebagai awalan.
+
+        """
+        self._set_search_hits(self._search_index.search(query))
+        if self._search_hits:
+            self._focus_search_hit()
+        elif self.model.doc:
+            self._redraw_overlays()
+
+    def step_search(self, delta: int) -> None:
+        """Berpindah ke hasil pencarian berikutnya atau sebelumnya.
+
+        Args:
+            delta (int): Arah perpindahan (+1 atau -1), berputar di ujung.
+
+        """
+        if self._search_hits:
+            self._search_pos = (self._search_pos + delta) % len(self._search_hits)
+            self._focus_search_hit()
+
+    def _set_search_hits(self, hits: list[SearchHit]) -> None:
+        """Mengganti hasil pencarian aktif dan memperbarui navigasinya."""
+        self._search_hits = hits
+        self._search_pages = [hit.page for hit in hits]
+        self._search_pos = 0
+        self._search_tables = {}
+        self.view.update_search_info(1 if hits else 0, len(hits))
+
+    def _focus_search_hit(self) -> None:
+        """Menampilkan halaman hasil pencarian aktif dan memusatkannya."""
+        hit: SearchHit = self._search_hits[self._search_pos]
+        self.view.update_search_info(self._search_pos + 1, len(self._search_hits))
+        self._pending_search_focus = True
+        page_changed: bool = hit.page != self.model.current_page
+        if page_changed:
+            self._prefetch_mgr.cancel_if_far(hit.page, self.model.zoom_level)
+            self.model.current_page = hit.page
+            self._refresh(full_refresh=True)
+        if not self._pending_search_focus:
+            return  # Halaman tampil dari cache dan sudah difokuskan
+
+        if self.model.continuous:
+            shown: bool = hit.page in self._continuous_shown
+        else:
+            shown = not page_changed
+        if shown:
+            # Halaman sudah tampil: cukup perbarui sorotan layer hasil
+            self._redraw_overlays()
+        # Jika belum, sorotan dan fokus menyusul saat pixmap halaman tiba
+
+    def _search_table(self, p_idx: int) -> BoxTable:
+        """Menyusun kotak hasil pencarian satu halaman.
+
+        Setiap kotak diberi ID nomor hasil sehingga hasil aktif dapat disorot
+        dengan mekanisme status yang sama seperti layer CSV.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+
+        Returns:
+            BoxTable: Kotak hasil pencarian halaman, atau tabel kosong.
+
+        """
+        table: BoxTable | None = self._search_tables.get(p_idx)
+        if table is None:
+            lo: int = bisect_left(self._search_pages, p_idx)
+            hi: int = bisect_right(self._search_pages, p_idx)
+            if lo == hi:
+                return EMPTY_TABLE
+            source: BoxTable = self._layer_boxes(self._search_index.source, p_idx)
+            ids: list[int] = []
+            units: list[int] = []
+            for k in range(lo, hi):
+                for unit in self._search_hits[k].units:
+                    ids.append(k)
+                    units.append(unit)
+            table = BoxTable(
+                source.coords[units], [""] * len(units), ids=np.array(ids, np.int64)
+            )
+            self._search_tables[p_idx] = table
+        return table
 
     def _get_grouped_ids(self) -> set[str]:
         """Menghitung ID baris yang masuk dalam kelompok horizontal yang sama.
@@ -284,6 +1399,8 @@ class PDFController:
             Set[str]: Kumpulan ID yang berada dalam satu baris horizontal.
 
         """
+        if self._band_ids:
+            return set(self._band_ids)
         if (
             not hasattr(self.view, "parent_view")
             or not self.view.parent_view.toolbar.chk_group.isChecked()
@@ -292,29 +1409,52 @@ class PDFController:
         if not self.model.selected_row_id:
             return set()
 
-        target: list[Any] | None = next(
-            (
-                d
-                for d in self._page_data_cache
-                if str(d[5]) == str(self.model.selected_row_id)
-            ),
-            None,
-        )
-        if not target:
+        table: BoxTable = self._page_data_cache
+        targets: list[int] = table.indices_for_ids([self.model.selected_row_id])
+        if not targets:
             return set()
 
-        t_sumbu: float = (target[1] + target[3]) / 2
-        grouped_ids: set[str] = set()
-        for d in self._page_data_cache:
-            curr_sumbu: float = (d[1] + d[3]) / 2
-            if abs(curr_sumbu - t_sumbu) <= self._group_tolerance:
-                grouped_ids.add(str(d[5]))
+        # Pencarian rentang biner pada indeks baris terurut
+        group: np.ndarray = self._line_index().group_of(
+            min(targets), self._group_tolerance
+        )
+        grouped_ids: set[str] = {table.id_str(i) for i in group.tolist()}
         return grouped_ids
 
+    def _line_index(self) -> LineGroupIndex:
+        """Mengambil indeks pengelompokan baris untuk data CSV halaman aktif.
+
+        Returns:
+            LineGroupIndex: Indeks yang dibangun ulang hanya jika data halaman
+            aktif berganti.
+
+        """
+        return self._line_group_mgr.index_for(
+            self.model.current_page, self._page_data_cache
+        )
+
+    def cluster_lines(self) -> list[list[str]]:
+        """Mengelompokkan seluruh baris CSV halaman aktif sekaligus.
+
+        Kelompok memakai toleransi yang sama dengan fitur pengelompokan di
+        toolbar; kotak yang sumbunya berdekatan secara berantai digabung.
+
+        Returns:
+            List[List[str]]: ID baris per kelompok, dari atas ke bawah.
+
+        """
+        table: BoxTable = self._page_data_cache
+        return [
+            [table.id_str(i) for i in group.tolist()]
+            for group in self._line_index().clusters(self._group_tolerance)
+        ]
+
     def _on_toggle_line_grouping(self) -> None:
         """Memperbarui highlight saat fitur pengelompokan baris diaktifkan."""
         if self.model.selected_row_id:
-            self.view.update_highlight_only(self.model.selected_row_id)
+            self.view.update_highlight_only(
+                self.model.selected_row_id, self._get_grouped_ids()
+            )
 
     def _on_update_tolerance(self, val: str | float | int) -> None:
         """Memperbarui nilai toleransi untuk perhitungan pengelompokan baris.
@@ -326,16 +1466,24 @@ class PDFController:
         try:
             self._group_tolerance = float(str(val).replace(",", "."))
             if self.model.selected_row_id:
-                self.view.update_highlight_only(self.model.selected_row_id)
+                self.view.update_highlight_only(
+                    self.model.selected_row_id, self._get_grouped_ids()
+                )
         except ValueError:
             pass
 
-    def start_export(self, path: str, range_str: str) -> None:
-        """Memulai proses ekstraksi teks dari PDF ke file CSV.
+    def start_export(self, path: str, range_str: str, fmt: str | None = None) -> None:
+        """Memulai ekstraksi teks dari PDF ke file di latar belakang.
+
+        Ekspor berjalan sebagai job terpisah sehingga UI tetap responsif;
+        progres, jeda, dan pembatalan ditangani oleh view.
 
         Args:
-            path (str): Lokasi penyimpanan file CSV hasil ekspor.
+            path (str): Lokasi penyimpanan file hasil ekspor.
             range_str (str): String format rentang halaman.
+            fmt (Optional[str]): Format keluaran (``"csv"``, ``"parquet"``,
+                ``"arrow"``, ``"jsonl"``, ``"sqlite"``); None untuk memilih
+                dari ekstensi path.
 
         """
         if not self.model.doc:
@@ -344,5 +1492,30 @@ class PDFController:
             range_str, self.model.total_pages
         )
         if indices is not None:
-            self._export_mgr.to_csv(self.model.doc, path, indices, self.view)
+            job: ExportJob = self._export_mgr.start(
+                self.model.doc, path, indices, self._page_info_mgr.table, fmt
+            )
+            self._export_jobs.append(job)
+            self.view.track_export_job(job, self._on_export_finished)
+
+    def _on_export_finished(self, job: ExportJob) -> None:
+        """Menutup job ekspor yang berakhir dan menyegarkan tampilan.
+
+        Args:
+            job (ExportJob): Job yang selesai, dibatalkan, atau gagal.
+
+        """
+        if job in self._export_jobs:
+            self._export_jobs.remove(job)
+        name: str = os.path.basename(job.filepath)
+        if job.state == "failed":
+            self.view.show_status_message(f"Ekspor {name} gagal: {job.error}")
+        elif job.state == "cancelled":
+            self.view.show_status_message(f"Ekspor {name} dibatalkan")
+        else:
+            self.view.show_status_message(
+                f"Ekspor {name} selesai: {job.rows_written} baris "
+                f"dalam {job.elapsed:.1f} s"
+            )
+        if job.state == "done" and self.model.doc:
             self._refresh(full_refresh=False)
@@ -1,13 +1,15 @@
 import csv
 import os
 
+from model.box_table import EMPTY_TABLE, BoxTable
+
 
 class OverlayManager:
     def __init__(self):
         self.show_text_layer = False
         self.show_csv_layer = False
         self.csv_path = None
-        self._csv_cache = {}  # Cache: {halaman: [data_list]}
+        self._csv_cache = {}  # Cache: {halaman: BoxTable}
 
     def load_csv_to_cache(self, path):
         """Membaca CSV satu kali dan menyimpannya dalam memori berdasarkan halaman."""
@@ -15,17 +17,18 @@ class OverlayManager:
             return
         self.csv_path = path
         self._csv_cache = {}
+        pages = {}
 
         try:
             with open(path, encoding="utf-8-sig", newline="") as f:
                 reader = csv.DictReader(f, delimiter=";", quotechar='"')
                 for row in reader:
                     p_num = int(row["halaman"])
-                    if p_num not in self._csv_cache:
-                        self._csv_cache[p_num] = []
+                    if p_num not in pages:
+                        pages[p_num] = []
 
                     # Simpan data yang sudah dikonversi
-                    self._csv_cache[p_num].append(
+                    pages[p_num].append(
                         (
                             float(row["x0"].replace(",", ".")),
                             float(row["top"].replace(",", ".")),
@@ -35,9 +38,15 @@ class OverlayManager:
                             row["nomor"],
                         )
                     )
+            # Simpan per halaman dalam bentuk kolom (BoxTable)
+            self._csv_cache = {p: BoxTable.from_rows(r) for p, r in pages.items()}
         except Exception as e:
             print(f"Error caching CSV: {e}")
 
     def get_csv_data(self, page_num):
         """Mendapatkan data dari cache (Sangat Cepat)."""
-        return self._csv_cache.get(page_num, [])
+        return self._csv_cache.get(page_num, EMPTY_TABLE)
+
+    def csv_pages(self):
+        """Nomor halaman (mulai dari 1) yang memiliki data CSV, berurutan."""
+        return sorted(self._csv_cache)
@@ -0,0 +1,190 @@
+"""Modul pemindaian metadata halaman di latar belakang.
+
+Saat dokumen dibuka, setiap halaman dipindai sekali oleh ``RenderManager``
+dengan prioritas rendah (setelah render halaman dan prefetch) untuk mengisi
+``PageInfoTable``: ukuran, rotasi, keberadaan teks, jumlah blok teks,
+jumlah gambar, dan jumlah kata. Pemindaian berjalan di proses pekerja
+render sehingga ekstraksi teks tidak pernah memegang GIL thread GUI.
+Status bar, navigasi, dan ekspor membaca tabel ini alih-alih
+mengekstrak ulang teks halaman. Kata hasil pemindaian yang sama juga
+diteruskan ke indeks pencarian.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import fitz  # PyMuPDF
+import numpy as np
+
+from model.box_table import BoxTable
+from model.page_info import UNKNOWN, PageInfo, PageInfoTable
+
+if TYPE_CHECKING:
+    # render_mgr memakai scan_page dari modul ini
+    from .render_mgr import RenderJob, RenderManager
+
+CHANNEL: str = "meta"
+
+# Prioritas antrean pemindaian; di belakang render halaman (0) dan prefetch (1)
+SCAN_PRIORITY: int = 5
+
+# Prioritas pemindaian halaman yang sedang ditampilkan tetapi belum dipindai
+URGENT_SCAN_PRIORITY: int = 0
+
+# Flag get_text("dict") tanpa blok gambar: gambar tidak didekode sama sekali.
+# Dipakai pemindaian dan ekspor agar jumlah blok teks keduanya sama.
+LEAN_TEXT_FLAGS: int = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+
+class PageScan(NamedTuple):
+    """Hasil pemindaian satu halaman.
+
+    Attributes:
+        info (PageInfo): Metadata halaman.
+        words (BoxTable): Kata halaman, setara ``get_text("words")``.
+
+    """
+
+    info: PageInfo
+    words: BoxTable
+
+
+def scan_page(page: fitz.Page) -> PageScan:
+    """Membaca metadata dan kata satu halaman PDF dengan satu ekstraksi.
+
+    Args:
+        page (fitz.Page): Halaman yang dipindai.
+
+    Returns:
+        PageScan: Metadata dan tabel kata halaman.
+
+    """
+    # Satu TextPage untuk kata dan blok dengan flag yang sama seperti
+    # ekstraksi ekspor, sehingga ``text_blocks`` sama dengan jumlah blok
+    # get_text("dict") yang dibaca ekspor
+    textpage: fitz.TextPage = page.get_textpage(flags=LEAN_TEXT_FLAGS)
+    words: list = textpage.extractWORDS()
+    info = PageInfo(
+        page.rect.width,
+        page.rect.height,
+        page.rotation,
+        # Setara get_text().strip(): halaman berisi spasi saja bukan sandwich
+        any(w[4].strip() for w in words),
+        len(textpage.extractBLOCKS()),
+        len(page.get_images(full=False)),
+        len(words),
+    )
+    return PageScan(info, BoxTable.from_words(words))
+
+
+class PageInfoManager:
+    """Pemilik tabel metadata dokumen aktif dan penjadwal pemindaiannya.
+
+    Attributes:
+        table (PageInfoTable): Metadata seluruh halaman dokumen aktif.
+
+    """
+
+    def __init__(self, render_mgr: RenderManager) -> None:
+        """Inisialisasi manajer tanpa dokumen.
+
+        Args:
+            render_mgr (RenderManager): Pekerja latar belakang untuk pemindaian.
+
+        """
+        self._render_mgr: RenderManager = render_mgr
+        self._urgent: set[int] = set()  # Halaman yang pemindaiannya didahulukan
+        self.table: PageInfoTable = PageInfoTable(0)
+
+    def start(self, total_pages: int) -> None:
+        """Membuat tabel baru dan menjadwalkan pemindaian seluruh halaman.
+
+        Pemindaian sebelumnya (dokumen lama) otomatis menjadi basi.
+
+        Args:
+            total_pages (int): Jumlah halaman dokumen yang baru dibuka.
+
+        """
+        self.table = PageInfoTable(total_pages)
+        self._urgent.clear()
+        self._render_mgr.cancel(CHANNEL)
+        for p_idx in range(total_pages):
+            self._render_mgr.submit(
+                p_idx, 0.0, CHANNEL, "meta", priority=SCAN_PRIORITY, supersede=False
+            )
+
+    def store(self, job: RenderJob) -> bool:
+        """Menyimpan hasil pemindaian satu halaman dari pekerja.
+
+        Args:
+            job (RenderJob): Pekerjaan ``meta`` yang telah selesai.
+
+        Returns:
+            bool: True jika halaman baru pertama kali tersimpan; hasil
+                ganda (pemindaian yang didahulukan) bernilai False.
+
+        """
+        if job.page_index >= len(self.table) or self.table.is_scanned(job.page_index):
+            return False
+        self.table.set_row(job.page_index, job.result.info)
+        return True
+
+    def info(self, doc: fitz.Document, p_idx: int) -> PageInfo:
+        """Mengambil metadata halaman tanpa mengekstrak teks di thread pemanggil.
+
+        Halaman yang belum dipindai dikembalikan sebagai placeholder berisi
+        ukuran dan rotasi saja (``has_text`` None), dan pemindaiannya
+        didahulukan di antrean pekerja. Pemanggil memperbarui tampilan saat
+        hasil ``meta`` halaman itu tiba.
+
+        Args:
+            doc (fitz.Document): Dokumen aktif.
+            p_idx (int): Indeks halaman (0-indexed).
+
+        Returns:
+            PageInfo: Metadata halaman atau placeholder ukurannya.
+
+        """
+        if not self.table.is_scanned(p_idx):
+            if self.table.state[p_idx] == UNKNOWN:
+                page: fitz.Page = doc[p_idx]
+                self.table.set_size(
+                    p_idx, page.rect.width, page.rect.height, page.rotation
+                )
+            if p_idx not in self._urgent:
+                self._urgent.add(p_idx)
+                self._render_mgr.submit(
+                    p_idx,
+                    0.0,
+                    CHANNEL,
+                    "meta",
+                    priority=URGENT_SCAN_PRIORITY,
+                    supersede=False,
+                )
+        return self.table.row(p_idx)
+
+    def sizes(self, doc: fitz.Document) -> list[tuple[float, float]]:
+        """Mengambil ukuran seluruh halaman dalam poin PDF tanpa memuat halaman.
+
+        Halaman yang ukurannya belum diketahui memakai ukuran sementara
+        (ukuran halaman pertama yang sudah diketahui) hingga hasil
+        pemindaiannya tiba, sehingga dokumen ribuan halaman tidak dibaca
+        satu per satu di thread pemanggil.
+
+        Args:
+            doc (fitz.Document): Dokumen aktif.
+
+        Returns:
+            List[Tuple[float, float]]: Lebar dan tinggi setiap halaman.
+
+        """
+        known: np.ndarray = self.table.state != UNKNOWN
+        if len(known) and not known.any():
+            page: fitz.Page = doc[0]
+            self.table.set_size(0, page.rect.width, page.rect.height, page.rotation)
+            known[0] = True
+        sizes: np.ndarray = self.table.sizes
+        if not known.all():
+            sizes = np.where(known[:, None], sizes, sizes[known.argmax()])
+        return [(w, h) for w, h in sizes.tolist()]
@@ -0,0 +1,121 @@
+"""Modul prefetch halaman tetangga di latar belakang.
+
+Setelah halaman aktif tampil, halaman berikutnya dan sebelumnya dirender
+serta diekstrak teksnya lebih awal melalui ``RenderManager`` sehingga
+navigasi ``change_page(+1)`` dapat dilayani langsung dari cache. Pekerjaan
+prefetch dijalankan di proses pekerja render dengan prioritas lebih rendah
+dari halaman aktif, sehingga rasterisasi dan ekstraksi kata tetangga tidak
+memegang GIL thread GUI.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from .render_mgr import RenderManager
+
+CHANNEL: str = "prefetch"
+
+
+class PrefetchManager:
+    """Penjadwal prefetch untuk N halaman berikutnya dan M halaman sebelumnya.
+
+    Setiap penjadwalan baru menggantikan generasi prefetch sebelumnya,
+    sehingga antrean lama otomatis dibatalkan. Pembatalan eksplisit
+    dilakukan saat pengguna melompat jauh atau mengubah zoom.
+
+    Attributes:
+        ahead (int): Jumlah halaman setelah halaman aktif yang di-prefetch.
+        behind (int): Jumlah halaman sebelum halaman aktif yang di-prefetch.
+
+    """
+
+    def __init__(
+        self, render_mgr: RenderManager, ahead: int = 2, behind: int = 1
+    ) -> None:
+        """Inisialisasi penjadwal prefetch.
+
+        Args:
+            render_mgr (RenderManager): Pekerja render latar belakang.
+            ahead (int): Jumlah halaman berikutnya yang di-prefetch.
+            behind (int): Jumlah halaman sebelumnya yang di-prefetch.
+
+        """
+        self.ahead: int = ahead
+        self.behind: int = behind
+        self._render_mgr: RenderManager = render_mgr
+        self._center: int | None = None
+        self._zoom: float | None = None
+
+    def plan(self, center: int, total: int) -> list[int]:
+        """Menyusun urutan halaman prefetch, yang terdekat lebih dulu.
+
+        Args:
+            center (int): Indeks halaman aktif (0-indexed).
+            total (int): Total halaman dokumen.
+
+        Returns:
+            List[int]: Indeks halaman yang akan di-prefetch.
+
+        """
+        pages: list[int] = []
+        for dist in range(1, max(self.ahead, self.behind) + 1):
+            if dist <= self.ahead and center + dist < total:
+                pages.append(center + dist)
+            if dist <= self.behind and center - dist >= 0:
+                pages.append(center - dist)
+        return pages
+
+    def schedule(
+        self,
+        center: int,
+        zoom: float,
+        total: int,
+        need_pixmap: Callable[[int], bool],
+        need_words: Callable[[int], bool],
+    ) -> None:
+        """Menjadwalkan prefetch pixmap dan teks di sekitar halaman aktif.
+
+        Pixmap dan ``BoxTable`` kata dihasilkan di proses pekerja render;
+        thread GUI hanya menerima hasil jadi melalui ``job_finished``.
+
+        Args:
+            center (int): Indeks halaman aktif (0-indexed).
+            zoom (float): Tingkat zoom saat ini.
+            total (int): Total halaman dokumen.
+            need_pixmap (Callable[[int], bool]): True jika pixmap halaman
+                belum ada di cache.
+            need_words (Callable[[int], bool]): True jika data kata halaman
+                belum ada di cache.
+
+        """
+        self.cancel()
+        self._center, self._zoom = center, zoom
+        for p_idx in self.plan(center, total):
+            if need_pixmap(p_idx):
+                self._render_mgr.submit(
+                    p_idx, zoom, CHANNEL, "pixmap", priority=1, supersede=False
+                )
+            if need_words(p_idx):
+                self._render_mgr.submit(
+                    p_idx, zoom, CHANNEL, "words", priority=1, supersede=False
+                )
+
+    def cancel_if_far(self, target: int, zoom: float) -> None:
+        """Membatalkan prefetch jika target berada di luar jendela prefetch.
+
+        Args:
+            target (int): Indeks halaman tujuan (0-indexed).
+            zoom (float): Tingkat zoom tujuan.
+
+        """
+        if self._center is None:
+            return
+        far = not (self._center - self.behind <= target <= self._center + self.ahead)
+        if far or zoom != self._zoom:
+            self.cancel()
+
+    def cancel(self) -> None:
+        """Membatalkan seluruh pekerjaan prefetch yang masih tertunda."""
+        self._render_mgr.cancel(CHANNEL)
+        self._center = self._zoom = None
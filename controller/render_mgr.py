@@ -0,0 +1,311 @@
+"""Modul manajer render latar belakang untuk halaman PDF.
+
+Modul ini memindahkan rasterisasi halaman (``page.get_pixmap``) keluar dari
+thread GUI. PyMuPDF menahan GIL selama rasterisasi, sehingga pekerjaan
+dijalankan di pool proses (konteks ``spawn``) melalui
+:mod:`controller.render_worker`; setiap proses membuka handle
+``fitz.Document`` dan menyimpan ``fitz.DisplayList`` per halaman miliknya
+sendiri. Thread dispatcher hanya menunggu hasil proses (tanpa memegang GIL)
+lalu mengirimnya ke thread GUI melalui sinyal Qt (queued connection). Pixmap
+tiba sebagai ``PixmapData`` yang byte sampelnya langsung menjadi buffer
+QImage, tanpa salinan tambahan di proses GUI.
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from . import render_worker
+from .render_worker import DEFAULT_DISPLAY_LIST_BUDGET
+
+
+class RenderJob:
+    """Deskripsi satu permintaan render beserta hasilnya.
+
+    Attributes:
+        ticket (int): Nomor urut unik permintaan (makin besar makin baru).
+        generation (int): Generasi saluran saat permintaan dibuat. Pekerjaan
+            menjadi basi (stale) ketika generasi salurannya sudah berganti.
+        channel (str): Saluran permintaan, misal "page" atau "prefetch".
+        kind (str): Jenis pekerjaan, "pixmap", "tile", "words", atau "meta".
+        path (str): Path dokumen saat permintaan dibuat.
+        page_index (int): Indeks halaman (0-indexed).
+        zoom (float): Faktor zoom rasterisasi.
+        priority (int): Prioritas antrean, makin kecil makin didahulukan.
+        tile (Optional[Tuple[int, int]]): Indeks (kolom, baris) untuk tile.
+        clip (Optional[fitz.Rect]): Area clip dalam poin PDF untuk tile.
+        result (Optional[Any]): Hasil pekerjaan (misal ``PixmapData``).
+        error (Optional[Exception]): Galat yang terjadi saat pekerjaan berjalan.
+
+    """
+
+    __slots__ = (
+        "ticket",
+        "generation",
+        "channel",
+        "kind",
+        "path",
+        "page_index",
+        "zoom",
+        "priority",
+        "tile",
+        "clip",
+        "result",
+        "error",
+    )
+
+    def __init__(
+        self,
+        ticket: int,
+        generation: int,
+        channel: str,
+        kind: str,
+        path: str,
+        page_index: int,
+        zoom: float,
+        priority: int = 0,
+        tile: tuple[int, int] | None = None,
+        clip: fitz.Rect | None = None,
+    ) -> None:
+        """Inisialisasi deskripsi pekerjaan render.
+
+        Args:
+            ticket (int): Nomor urut unik permintaan.
+            generation (int): Generasi saluran saat permintaan dibuat.
+            channel (str): Saluran permintaan.
+            kind (str): Jenis pekerjaan.
+            path (str): Path dokumen sumber.
+            page_index (int): Indeks halaman (0-indexed).
+            zoom (float): Faktor zoom rasterisasi.
+            priority (int): Prioritas antrean.
+            tile (Optional[Tuple[int, int]]): Indeks tile (kolom, baris).
+            clip (Optional[fitz.Rect]): Area clip dalam poin PDF.
+
+        """
+        self.ticket: int = ticket
+        self.generation: int = generation
+        self.channel: str = channel
+        self.kind: str = kind
+        self.path: str = path
+        self.page_index: int = page_index
+        self.zoom: float = zoom
+        self.priority: int = priority
+        self.tile: tuple[int, int] | None = tile
+        self.clip: fitz.Rect | None = clip
+        self.result: Any | None = None
+        self.error: Exception | None = None
+
+
+class RenderManager(QObject):
+    """Pengelola pool proses untuk rasterisasi halaman di latar belakang.
+
+    Permintaan dimasukkan ke antrean prioritas dan diteruskan oleh thread
+    dispatcher ke pool proses pekerja, satu pekerjaan per proses pada satu
+    waktu. Setiap saluran memiliki generasi; permintaan dari generasi lama
+    dilewati sebelum dikirim ke proses, dan hasilnya dapat diperiksa kembali
+    melalui :meth:`is_current` saat tiba di thread GUI.
+
+    Attributes:
+        job_finished (pyqtSignal): Sinyal berisi ``RenderJob`` yang selesai.
+
+    """
+
+    job_finished = pyqtSignal(object)
+
+    def __init__(
+        self, workers: int = 1, display_list_budget: int = DEFAULT_DISPLAY_LIST_BUDGET
+    ) -> None:
+        """Inisialisasi antrean, pool proses, dan thread dispatcher.
+
+        Args:
+            workers (int): Jumlah proses pekerja yang dijalankan.
+            display_list_budget (int): Jumlah DisplayList maksimum per proses.
+
+        """
+        super().__init__()
+        self._display_list_stats: dict[int, dict[str, Any]] = {}  # {pid: stats}
+        self._path: str = ""
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._tickets = itertools.count(1)
+        self._latest: dict[str, int] = {}  # {channel: generasi terbaru}
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+        workers = max(1, workers)
+        self._pool = ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=render_worker.init_worker,
+            initargs=(display_list_budget,),
+        )
+        # Panaskan proses sekarang agar render pertama tidak menunggu spawn
+        for _ in range(workers):
+            self._pool.submit(render_worker.ping)
+
+        for i in range(workers):
+            t = threading.Thread(
+                target=self._worker_loop, name=f"pdf-render-{i}", daemon=True
+            )
+            t.start()
+            self._threads.append(t)
+
+    def open(self, path: str) -> None:
+        """Mengganti dokumen sumber untuk permintaan berikutnya.
+
+        Proses pekerja akan membuka ulang handle dokumennya secara malas
+        (lazy) saat menerima pekerjaan dengan path baru.
+
+        Args:
+            path (str): Path file PDF.
+
+        """
+        self._path = path
+        with self._lock:
+            self._latest.clear()
+
+    def submit(
+        self,
+        page_index: int,
+        zoom: float,
+        channel: str = "page",
+        kind: str = "pixmap",
+        priority: int = 0,
+        supersede: bool = True,
+        tile: tuple[int, int] | None = None,
+        clip: fitz.Rect | None = None,
+    ) -> RenderJob:
+        """Menjadwalkan pekerjaan render halaman.
+
+        Args:
+            page_index (int): Indeks halaman (0-indexed).
+            zoom (float): Faktor zoom rasterisasi.
+            channel (str): Saluran permintaan untuk deteksi hasil basi.
+            kind (str): Jenis pekerjaan.
+            priority (int): Prioritas antrean, makin kecil makin didahulukan.
+            supersede (bool): Jika True, permintaan ini memulai generasi baru
+                sehingga permintaan lama pada saluran yang sama menjadi basi.
+                Jika False, permintaan bergabung dengan generasi saat ini.
+            tile (Optional[Tuple[int, int]]): Indeks tile (kolom, baris).
+            clip (Optional[fitz.Rect]): Area clip dalam poin PDF.
+
+        Returns:
+            RenderJob: Objek pekerjaan yang dijadwalkan.
+
+        """
+        ticket = next(self._tickets)
+        with self._lock:
+            if supersede or channel not in self._latest:
+                self._latest[channel] = ticket
+            generation = self._latest[channel]
+        job = RenderJob(
+            ticket,
+            generation,
+            channel,
+            kind,
+            self._path,
+            page_index,
+            zoom,
+            priority,
+            tile,
+            clip,
+        )
+        self._queue.put((priority, ticket, job))
+        return job
+
+    def is_current(self, job: RenderJob) -> bool:
+        """Memeriksa apakah pekerjaan masih merupakan permintaan terbaru.
+
+        Args:
+            job (RenderJob): Pekerjaan yang diperiksa.
+
+        Returns:
+            bool: True jika belum digantikan oleh permintaan lebih baru.
+
+        """
+        with self._lock:
+            return self._latest.get(job.channel) == job.generation
+
+    def cancel(self, channel: str) -> None:
+        """Membatalkan seluruh permintaan yang tertunda pada suatu saluran.
+
+        Args:
+            channel (str): Saluran permintaan yang dibatalkan.
+
+        """
+        with self._lock:
+            self._latest[channel] = next(self._tickets)
+
+    def display_list_stats(self) -> dict[str, Any]:
+        """Menggabungkan statistik cache DisplayList dari seluruh proses.
+
+        Returns:
+            Dict[str, Any]: Jumlah hit, miss, eviction, entri, dan rasio hit.
+
+        """
+        with self._lock:
+            stats = list(self._display_list_stats.values())
+        merged: dict[str, Any] = {
+            k: sum(s[k] for s in stats)
+            for k in ("hits", "misses", "evictions", "entries", "size", "budget")
+        }
+        lookups = merged["hits"] + merged["misses"]
+        merged["hit_rate"] = merged["hits"] / lookups if lookups else 0.0
+        return merged
+
+    def shutdown(self) -> None:
+        """Menghentikan thread dispatcher dan pool proses pekerja."""
+        with self._lock:
+            self._latest.clear()
+        for _ in self._threads:
+            self._queue.put((float("inf"), next(self._tickets), None))
+        self._threads = []
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _worker_loop(self) -> None:
+        """Perulangan utama thread dispatcher."""
+        while True:
+            _, _, job = self._queue.get()
+            if job is None:
+                break
+            if not self.is_current(job):
+                continue  # Permintaan basi, lewati tanpa render
+
+            try:
+                job.result = self._execute(job)
+            except Exception as e:
+                job.error = e
+            self.job_finished.emit(job)
+
+    def _execute(self, job: RenderJob) -> Any:
+        """Menjalankan pekerjaan di proses pekerja dan menunggu hasilnya.
+
+        Args:
+            job (RenderJob): Pekerjaan yang dijalankan.
+
+        Returns:
+            Any: Hasil pekerjaan (``PixmapData``, ``BoxTable``, atau
+                ``PageScan``).
+
+        """
+        clip = tuple(job.clip) if job.clip is not None else None
+        future = self._pool.submit(
+            render_worker.run_task,
+            job.kind,
+            job.path,
+            job.page_index,
+            job.zoom,
+            clip,
+        )
+        # Menunggu future melepas GIL sehingga thread GUI tetap responsif
+        result, stats, pid = future.result()
+        with self._lock:
+            self._display_list_stats[pid] = stats
+        return result
@@ -0,0 +1,156 @@
+"""Modul pekerja render yang berjalan di proses terpisah.
+
+PyMuPDF menahan GIL selama rasterisasi dan ekstraksi teks, sehingga thread
+pekerja tetap membekukan thread GUI. Fungsi di modul ini dijalankan oleh
+pool proses ``RenderManager``; setiap proses membuka handle
+``fitz.Document`` miliknya sendiri dan menyimpan ``fitz.DisplayList`` per
+halaman. Pixmap dikirim kembali sebagai byte sampel (``PixmapData``) yang
+langsung dipakai sebagai buffer QImage di proses GUI, tanpa disusun ulang
+menjadi ``fitz.Pixmap``. Modul ini tidak bergantung pada Qt.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, NamedTuple
+
+import fitz  # PyMuPDF
+
+from model.box_table import BoxTable
+
+from .cache_mgr import LRUCache
+from .page_info_mgr import scan_page
+
+# Jumlah DisplayList maksimum yang disimpan per proses pekerja
+DEFAULT_DISPLAY_LIST_BUDGET: int = 32
+
+
+class PixmapData(NamedTuple):
+    """Sampel pixmap yang dapat dikirim antar-proses.
+
+    Atributnya mengikuti nama atribut ``fitz.Pixmap`` (``width``,
+    ``height``, ``stride``, ``alpha``, ``x``, ``y``) sehingga view dan cache
+    dapat memakainya tanpa menyalin ``samples`` ke pixmap baru.
+
+    Attributes:
+        width (int): Lebar pixmap dalam piksel.
+        height (int): Tinggi pixmap dalam piksel.
+        n (int): Jumlah komponen per piksel (termasuk alpha).
+        alpha (bool): True jika pixmap memiliki kanal alpha.
+        x (int): Koordinat x asal pixmap (``pix.x``), bukan nol untuk clip.
+        y (int): Koordinat y asal pixmap (``pix.y``).
+        samples (bytes): Data piksel baris demi baris.
+
+    """
+
+    width: int
+    height: int
+    n: int
+    alpha: bool
+    x: int
+    y: int
+    samples: bytes
+
+    @property
+    def stride(self) -> int:
+        """Jumlah byte per baris piksel."""
+        return self.width * self.n
+
+
+class _WorkerState:
+    """Handle dokumen dan cache DisplayList milik satu proses pekerja."""
+
+    def __init__(self, budget: int) -> None:
+        """Inisialisasi state tanpa dokumen terbuka.
+
+        Args:
+            budget (int): Jumlah DisplayList maksimum yang disimpan.
+
+        """
+        self.display_lists: LRUCache = LRUCache(budget)
+        self.path: str | None = None
+        self.doc: fitz.Document | None = None
+
+    def document(self, path: str) -> fitz.Document:
+        """Mengambil handle dokumen, membuka ulang bila path berganti."""
+        if self.path != path:
+            if self.doc is not None:
+                self.doc.close()
+            self.display_lists.clear()
+            self.doc = fitz.open(path)
+            self.path = path
+        return self.doc
+
+    def display_list(self, page_index: int) -> fitz.DisplayList:
+        """Mengambil DisplayList halaman dari cache atau membuatnya."""
+        dl: fitz.DisplayList | None = self.display_lists.get(page_index)
+        if dl is None:
+            dl = self.doc[page_index].get_displaylist()
+            self.display_lists.put(page_index, dl)
+        return dl
+
+
+_state: _WorkerState | None = None
+
+
+def init_worker(budget: int = DEFAULT_DISPLAY_LIST_BUDGET) -> None:
+    """Menyiapkan state proses pekerja (initializer pool).
+
+    Args:
+        budget (int): Jumlah DisplayList maksimum per proses.
+
+    """
+    global _state
+    _state = _WorkerState(budget)
+
+
+def ping() -> int:
+    """Tugas kosong untuk memanaskan proses pekerja.
+
+    Returns:
+        int: PID proses pekerja.
+
+    """
+    return os.getpid()
+
+
+def run_task(
+    kind: str,
+    path: str,
+    page_index: int,
+    zoom: float,
+    clip: tuple[float, float, float, float] | None = None,
+) -> tuple[Any, dict[str, Any], int]:
+    """Menjalankan satu pekerjaan render di proses pekerja.
+
+    Args:
+        kind (str): Jenis pekerjaan, "pixmap", "tile", "words", atau "meta".
+        path (str): Path dokumen sumber.
+        page_index (int): Indeks halaman (0-indexed).
+        zoom (float): Faktor zoom rasterisasi.
+        clip (Optional[Tuple[float, float, float, float]]): Area clip tile
+            dalam poin PDF.
+
+    Returns:
+        Tuple[Any, Dict[str, Any], int]: Hasil pekerjaan (``PixmapData``,
+            ``BoxTable``, atau ``PageScan``), statistik cache DisplayList,
+            dan PID proses.
+
+    """
+    state: _WorkerState = _state or _WorkerState(DEFAULT_DISPLAY_LIST_BUDGET)
+    doc: fitz.Document = state.document(path)
+    result: Any
+    if kind in ("pixmap", "tile"):
+        matrix = fitz.Matrix(zoom, zoom)
+        dl = state.display_list(page_index)
+        pix = dl.get_pixmap(matrix=matrix, clip=fitz.Rect(clip) if clip else None)
+        result = PixmapData(
+            pix.width, pix.height, pix.n, bool(pix.alpha), pix.x, pix.y, pix.samples
+        )
+    elif kind == "words":
+        result = BoxTable.from_words(doc[page_index].get_text("words"))
+    elif kind == "meta":
+        result = scan_page(doc[page_index])
+    else:
+        raise ValueError(f"Jenis pekerjaan tidak dikenal: {kind}")
+    return result, state.display_lists.stats(), os.getpid()
@@ -0,0 +1,188 @@
+"""Modul pencarian teks penuh berbasis indeks terbalik (inverted index).
+
+Setiap halaman dipecah menjadi token (huruf/angka, tanpa membedakan huruf
+besar-kecil). Untuk setiap token disimpan daftar posisi kemunculan yang
+dikodekan sebagai ``halaman << POS_BITS | posisi`` dalam ``array('q')``,
+sehingga indeks dokumen ribuan halaman tetap ringkas. Pencarian frasa
+cukup berupa irisan array posisi yang digeser, dan pencarian awalan
+memakai pencarian biner pada kosakata terurut.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_left
+from typing import NamedTuple
+
+import numpy as np
+
+from model.box_table import BoxTable
+
+# Jumlah bit posisi token dalam satu halaman pada kode posting
+POS_BITS: int = 20
+POS_MASK: int = (1 << POS_BITS) - 1
+
+# Batas jumlah hasil agar kueri awalan yang sangat umum tetap cepat
+MAX_HITS: int = 10000
+
+TOKEN_RE: re.Pattern[str] = re.compile(r"\w+")
+
+_EMPTY: np.ndarray = np.zeros(0, dtype=np.int64)
+
+
+def tokenize(text: str) -> list[str]:
+    """Memecah teks menjadi token huruf/angka yang dinormalisasi.
+
+    Args:
+        text (str): Teks sumber.
+
+    Returns:
+        List[str]: Token dalam huruf kecil (casefold).
+
+    """
+    return TOKEN_RE.findall(text.casefold())
+
+
+class SearchHit(NamedTuple):
+    """Satu hasil pencarian.
+
+    Attributes:
+        page (int): Indeks halaman (0-indexed).
+        units (Tuple[int, ...]): Indeks kotak (kata atau baris CSV) pada
+            tabel sumber halaman yang memuat hasil.
+
+    """
+
+    page: int
+    units: tuple[int, ...]
+
+
+class SearchIndex:
+    """Indeks terbalik atas kata PDF atau kolom ``teks`` CSV seluruh halaman.
+
+    Halaman ditambahkan satu per satu (misal dari pemindaian latar belakang)
+    dan langsung dapat dicari; halaman yang belum diindeks belum muncul di
+    hasil.
+
+    Attributes:
+        source (str): Sumber teks, ``"text_layer"`` atau ``"csv_layer"``.
+
+    """
+
+    def __init__(self, source: str = "text_layer") -> None:
+        """Inisialisasi indeks kosong.
+
+        Args:
+            source (str): Layer sumber teks yang diindeks.
+
+        """
+        self.source: str = source
+        self._postings: dict[str, array] = {}
+        self._units: dict[int, np.ndarray] = {}  # {halaman: posisi -> kotak}
+        self._vocab: list[str] | None = None  # Kosakata terurut, dibangun malas
+        self._sorted: dict[str, np.ndarray] = {}  # Posting terurut per token
+
+    @property
+    def page_count(self) -> int:
+        """Jumlah halaman yang sudah diindeks."""
+        return len(self._units)
+
+    def has_page(self, p_idx: int) -> bool:
+        """Memeriksa apakah halaman sudah diindeks."""
+        return p_idx in self._units
+
+    def add_page(self, p_idx: int, table: BoxTable) -> None:
+        """Menambahkan teks satu halaman ke indeks.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            table (BoxTable): Kata PDF atau baris CSV halaman tersebut.
+
+        """
+        if p_idx in self._units:
+            return
+        base: int = p_idx << POS_BITS
+        unit_of: list[int] = []
+        postings = self._postings
+        for unit in range(len(table)):
+            for token in tokenize(table.text(unit)):
+                codes = postings.get(token)
+                if codes is None:
+                    codes = postings[token] = array("q")
+                    self._vocab = None
+                codes.append(base | len(unit_of))
+                unit_of.append(unit)
+        self._units[p_idx] = np.array(unit_of, dtype=np.int32)
+
+    def _token_codes(self, token: str) -> np.ndarray:
+        """Mengambil posting terurut satu token, disimpan hingga token bertambah."""
+        codes = self._postings.get(token)
+        if not codes:
+            return _EMPTY
+        cached = self._sorted.get(token)
+        if cached is None or len(cached) != len(codes):
+            # Salinan dari buffer array('q'); halaman bisa masuk tidak berurutan
+            cached = np.sort(np.frombuffer(codes, dtype=np.int64))
+            self._sorted[token] = cached
+        return cached
+
+    def _codes(self, token: str, prefix: bool) -> np.ndarray:
+        """Mengambil kode posting terurut untuk token atau awalan token."""
+        if not prefix:
+            return self._token_codes(token)
+
+        if self._vocab is None:
+            self._vocab = sorted(self._postings)
+        lo: int = bisect_left(self._vocab, token)
+        hi: int = bisect_left(self._vocab, token + "\U0010ffff")
+        if hi - lo <= 1:
+            return self._token_codes(self._vocab[lo]) if lo < hi else _EMPTY
+        parts = [self._token_codes(t) for t in self._vocab[lo:hi]]
+        return np.sort(np.concatenate(parts))
+
+    def search(self, query: str, limit: int = MAX_HITS) -> list[SearchHit]:
+        """Mencari frasa dalam indeks.
+
+        Setiap kata kueri harus muncul berurutan (frasa). Kata yang diakhiri
+        ``*`` dicocokkan sebagai awalan, selebihnya harus sama persis
+        (tanpa membedakan huruf besar-kecil).
+
+        Args:
+            query (str): Teks kueri, misal ``nilai 1.234`` atau ``"tot*"``.
+            limit (int): Jumlah hasil maksimum.
+
+        Returns:
+            List[SearchHit]: Hasil berurutan menurut halaman lalu posisi.
+
+        """
+        terms: list[tuple[str, bool]] = []
+        words: list[str] = query.replace('"', " ").split()
+        for word in words:
+            tokens = tokenize(word)
+            last: int = len(tokens) - 1
+            terms += [
+                (t, word.endswith("*") and j == last) for j, t in enumerate(tokens)
+            ]
+        if not terms:
+            return []
+
+        # Posisi awal frasa: posting token ke-k digeser mundur k posisi
+        starts: np.ndarray | None = None
+        for k, (token, prefix) in enumerate(terms):
+            shifted = self._codes(token, prefix) - k
+            starts = (
+                shifted
+                if starts is None
+                else np.intersect1d(starts, shifted, assume_unique=True)
+            )
+            if not len(starts):
+                return []
+
+        hits: list[SearchHit] = []
+        n: int = len(terms)
+        for code in starts[:limit].tolist():
+            page, pos = code >> POS_BITS, code & POS_MASK
+            units = self._units[page][pos : pos + n].tolist()
+            hits.append(SearchHit(page, tuple(dict.fromkeys(units))))
+        return hits
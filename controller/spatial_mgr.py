@@ -0,0 +1,161 @@
+"""Modul indeks spasial untuk hit-test kotak kata dan baris CSV.
+
+Setiap halaman memiliki grid seragam atas kotak-kotaknya dalam koordinat
+PDF (poin). Pencarian titik hanya memeriksa satu sel grid dan pencarian
+persegi hanya sel yang beririsan, sehingga klik, hover, dan seleksi
+rubber-band tidak lagi bergantung pada jumlah item di scene.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+from model.box_table import BoxTable
+
+from .cache_mgr import LRUCache
+
+# Ukuran sel minimum dalam poin PDF
+MIN_CELL_SIZE: float = 8.0
+
+# Jumlah indeks (layer, halaman) maksimum yang disimpan
+SPATIAL_INDEX_BUDGET: int = 16
+
+
+class GridIndex:
+    """Grid seragam atas kotak ``(x0, top, x1, bottom)`` dalam poin PDF.
+
+    Attributes:
+        cell (float): Sisi sel grid dalam poin PDF.
+
+    """
+
+    def __init__(
+        self, boxes: BoxTable | Sequence[Sequence[Any]], cell: float = 0.0
+    ) -> None:
+        """Membangun grid dari daftar kotak.
+
+        Args:
+            boxes (Union[BoxTable, Sequence[Sequence[Any]]]): Tabel kotak, atau
+                data dengan empat elemen pertama berupa koordinat kotak.
+            cell (float): Sisi sel; 0 untuk menghitung dari tinggi median
+                kotak (kira-kira empat baris teks per sel).
+
+        """
+        if isinstance(boxes, BoxTable):
+            coords = boxes.coords
+        else:
+            coords = np.array([b[:4] for b in boxes], dtype=np.float64)
+        self._coords: np.ndarray = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+
+        if cell <= 0:
+            heights = self._coords[:, 3] - self._coords[:, 1]
+            median = float(np.median(heights)) if len(heights) else 0.0
+            cell = max(MIN_CELL_SIZE, median * 4)
+        self.cell: float = cell
+
+        # Rentang sel setiap kotak dihitung sekaligus
+        spans = np.floor(self._coords / cell).astype(np.int64).tolist()
+        self._cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for i, (cx0, cy0, cx1, cy1) in enumerate(spans):
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    self._cells[(cx, cy)].append(i)
+
+    def __len__(self) -> int:
+        """Jumlah kotak yang diindeks."""
+        return len(self._coords)
+
+    def _col(self, v: float) -> int:
+        """Mengubah koordinat menjadi indeks sel."""
+        return math.floor(v / self.cell)
+
+    def _filter(
+        self, candidates: Iterable[int], x0: float, y0: float, x1: float, y1: float
+    ) -> list[int]:
+        """Menyaring kandidat yang benar-benar beririsan dengan persegi."""
+        idx = np.fromiter(candidates, dtype=np.int64)
+        if not len(idx):
+            return []
+        b = self._coords[idx]
+        mask = (b[:, 0] <= x1) & (b[:, 2] >= x0) & (b[:, 1] <= y1) & (b[:, 3] >= y0)
+        return np.sort(idx[mask]).tolist()
+
+    def query_point(self, x: float, y: float) -> list[int]:
+        """Mencari kotak yang memuat sebuah titik.
+
+        Args:
+            x (float): Posisi horizontal dalam poin PDF.
+            y (float): Posisi vertikal dalam poin PDF.
+
+        Returns:
+            List[int]: Indeks kotak yang memuat titik, berurutan naik.
+
+        """
+        candidates = self._cells.get((self._col(x), self._col(y)), ())
+        return self._filter(candidates, x, y, x, y)
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> list[int]:
+        """Mencari kotak yang beririsan dengan sebuah persegi.
+
+        Args:
+            x0 (float): Batas kiri dalam poin PDF.
+            y0 (float): Batas atas dalam poin PDF.
+            x1 (float): Batas kanan dalam poin PDF.
+            y1 (float): Batas bawah dalam poin PDF.
+
+        Returns:
+            List[int]: Indeks kotak yang beririsan, berurutan naik.
+
+        """
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        candidates: set[int] = set()
+        for cx in range(self._col(x0), self._col(x1) + 1):
+            for cy in range(self._col(y0), self._col(y1) + 1):
+                candidates.update(self._cells.get((cx, cy), ()))
+        return self._filter(candidates, x0, y0, x1, y1)
+
+
+class SpatialIndexManager:
+    """Penyimpan indeks grid per halaman dan per layer.
+
+    Indeks dibangun malas saat pertama kali dibutuhkan dan dibangun ulang
+    otomatis jika objek daftar sumbernya berganti (misal CSV dimuat ulang).
+    Hanya indeks yang terakhir dipakai yang disimpan (LRU), sehingga memori
+    tidak bertambah seiring jumlah halaman yang pernah dibuka.
+    """
+
+    def __init__(self, budget: int = SPATIAL_INDEX_BUDGET) -> None:
+        """Inisialisasi penyimpan indeks kosong.
+
+        Args:
+            budget (int): Jumlah indeks maksimum yang disimpan.
+
+        """
+        self._indexes: LRUCache = LRUCache(budget)
+
+    def index_for(self, key: Hashable, boxes: Sequence[Any]) -> GridIndex:
+        """Mengambil indeks untuk data tertentu, membangunnya bila perlu.
+
+        Args:
+            key (Hashable): Kunci indeks, misal ``("csv_layer", halaman)``.
+            boxes (Sequence[Any]): Daftar kotak sumber indeks.
+
+        Returns:
+            GridIndex: Indeks grid atas ``boxes``.
+
+        """
+        entry: tuple[Sequence[Any], GridIndex] | None = self._indexes.get(key)
+        if entry is None or entry[0] is not boxes:
+            entry = (boxes, GridIndex(boxes))
+            self._indexes.put(key, entry)
+        return entry[1]
+
+    def clear(self) -> None:
+        """Menghapus seluruh indeks, misal saat dokumen atau CSV dimuat ulang."""
+        self._indexes.clear()
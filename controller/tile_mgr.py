@@ -0,0 +1,129 @@
+"""Modul perhitungan grid tile untuk rendering halaman pada zoom tinggi.
+
+Pada zoom tinggi satu pixmap halaman utuh bisa mencapai ratusan megabyte.
+Modul ini membagi halaman menjadi tile berukuran tetap dan menentukan tile
+mana saja yang beririsan dengan area viewport, sehingga memori yang dipakai
+sebanding dengan ukuran viewport, bukan dengan kuadrat zoom.
+"""
+
+from __future__ import annotations
+
+import math
+
+import fitz  # PyMuPDF
+
+# Halaman dengan jumlah piksel di atas batas ini dirender per tile (~8 MP)
+TILE_MODE_MIN_PIXELS: int = 8_000_000
+
+
+class TileManager:
+    """Kalkulator grid tile dan area visibel dalam koordinat piksel halaman.
+
+    Attributes:
+        tile_size (int): Sisi tile dalam piksel.
+        margin (int): Tambahan area di sekitar viewport yang ikut dirender
+            agar scroll pendek tidak memperlihatkan area kosong.
+        min_pixels (int): Ambang jumlah piksel halaman untuk mode tile.
+
+    """
+
+    def __init__(
+        self,
+        tile_size: int = 512,
+        margin: int = 256,
+        min_pixels: int = TILE_MODE_MIN_PIXELS,
+    ) -> None:
+        """Inisialisasi parameter grid tile.
+
+        Args:
+            tile_size (int): Sisi tile dalam piksel.
+            margin (int): Margin di sekitar viewport dalam piksel.
+            min_pixels (int): Ambang jumlah piksel untuk mode tile.
+
+        """
+        self.tile_size: int = tile_size
+        self.margin: int = margin
+        self.min_pixels: int = min_pixels
+
+    def should_tile(self, pix_w: int, pix_h: int) -> bool:
+        """Menentukan apakah halaman perlu dirender per tile.
+
+        Args:
+            pix_w (int): Lebar halaman dalam piksel pada zoom aktif.
+            pix_h (int): Tinggi halaman dalam piksel pada zoom aktif.
+
+        Returns:
+            bool: True jika ukuran halaman melebihi ambang mode tile.
+
+        """
+        return pix_w * pix_h > self.min_pixels
+
+    def visible_tiles(
+        self,
+        visible: tuple[float, float, float, float],
+        ox: float,
+        oy: float,
+        pix_w: int,
+        pix_h: int,
+    ) -> list[tuple[int, int]]:
+        """Mencari tile yang beririsan dengan area visibel ditambah margin.
+
+        Args:
+            visible (Tuple[float, float, float, float]): Area visibel pada
+                scene (x, y, w, h).
+            ox (float): Offset horizontal halaman pada scene.
+            oy (float): Offset vertikal halaman pada scene.
+            pix_w (int): Lebar halaman dalam piksel.
+            pix_h (int): Tinggi halaman dalam piksel.
+
+        Returns:
+            List[Tuple[int, int]]: Pasangan (kolom, baris) tile, diurutkan
+            dari yang terdekat dengan pusat area visibel.
+
+        """
+        t = self.tile_size
+        vx, vy, vw, vh = visible
+        x0 = max(0.0, vx - ox - self.margin)
+        y0 = max(0.0, vy - oy - self.margin)
+        x1 = min(float(pix_w), vx - ox + vw + self.margin)
+        y1 = min(float(pix_h), vy - oy + vh + self.margin)
+        if x1 <= x0 or y1 <= y0:
+            return []
+
+        cols = range(int(x0 // t), math.ceil(x1 / t))
+        rows = range(int(y0 // t), math.ceil(y1 / t))
+        cx, cy = vx - ox + vw / 2, vy - oy + vh / 2
+        tiles = [(c, r) for r in rows for c in cols]
+        tiles.sort(
+            key=lambda cr: abs((cr[0] + 0.5) * t - cx) + abs((cr[1] + 0.5) * t - cy)
+        )
+        return tiles
+
+    def tile_origin(self, tile: tuple[int, int]) -> tuple[int, int]:
+        """Menghitung posisi sudut kiri atas tile dalam piksel halaman.
+
+        Args:
+            tile (Tuple[int, int]): Pasangan (kolom, baris) tile.
+
+        Returns:
+            Tuple[int, int]: Posisi (x, y) relatif terhadap sudut halaman
+            pada zoom aktif.
+
+        """
+        col, row = tile
+        return col * self.tile_size, row * self.tile_size
+
+    def clip_for(self, tile: tuple[int, int], zoom: float) -> fitz.Rect:
+        """Mengubah indeks tile menjadi area clip dalam koordinat halaman.
+
+        Args:
+            tile (Tuple[int, int]): Pasangan (kolom, baris) tile.
+            zoom (float): Tingkat zoom.
+
+        Returns:
+            fitz.Rect: Area clip dalam poin PDF untuk ``get_pixmap(clip=...)``.
+
+        """
+        t = self.tile_size
+        col, row = tile
+        return fitz.Rect(col * t, row * t, (col + 1) * t, (row + 1) * t) / zoom
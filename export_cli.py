@@ -0,0 +1,414 @@
+"""Titik masuk baris perintah untuk ekspor massal teks PDF tanpa GUI.
+
+Memakai ``ExportManager`` yang sama dengan aplikasi, tanpa mengimpor PyQt6,
+sehingga dapat dijalankan di server Linux headless. Setiap file PDF
+diekspor oleh satu proses di pool pekerja. Dengan ``-o``, struktur
+direktori masukan (relatif terhadap direktori atau awalan pola glob yang
+diberikan) dicerminkan di bawah direktori keluaran. File yang keluarannya
+masih mutakhir (menurut mtime atau hash SHA-256 sumber yang tercatat di
+manifest) dilewati.
+
+Contoh:
+    python export_cli.py "arsip/**/*.pdf" -f parquet -o hasil -p 1-10 -j 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, NamedTuple
+
+import fitz  # PyMuPDF
+
+from controller.export_mgr import ExportJob, ExportManager
+from controller.export_writers import WRITERS, resolve_writer
+
+MANIFEST_NAME: str = ".export_manifest.json"
+
+# Ukuran blok baca saat menghitung hash file sumber
+HASH_BLOCK: int = 1 << 20
+
+
+class FileResult(NamedTuple):
+    """Hasil ekspor satu file PDF.
+
+    Attributes:
+        source (str): Path PDF sumber.
+        output (str): Path file keluaran.
+        state (str): ``"done"``, ``"skipped"``, ``"cancelled"``, atau
+            ``"failed"``.
+        pages (int): Jumlah halaman yang diekspor.
+        rows (int): Jumlah span yang ditulis.
+        seconds (float): Durasi ekspor file.
+        entry (Optional[Dict[str, Any]]): Catatan manifest untuk file ini.
+        error (str): Pesan galat bila gagal.
+
+    """
+
+    source: str
+    output: str
+    state: str
+    pages: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    entry: dict[str, Any] | None = None
+    error: str = ""
+
+
+def file_sha256(path: str) -> str:
+    """Menghitung hash SHA-256 isi file secara bertahap.
+
+    Args:
+        path (str): Path file.
+
+    Returns:
+        str: Hash dalam heksadesimal.
+
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def input_root(pattern: str) -> str:
+    """Mencari direktori dasar pola glob: komponen awal tanpa wildcard.
+
+    Args:
+        pattern (str): Path file, direktori, atau pola glob.
+
+    Returns:
+        str: Path absolut direktori dasar pola.
+
+    """
+    if os.path.isdir(pattern):
+        return os.path.abspath(pattern)
+    if not glob.has_magic(pattern):
+        return os.path.dirname(os.path.abspath(pattern))
+    parts: list[str] = []
+    for part in os.path.normpath(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    prefix: str = os.sep.join(parts)
+    if not prefix:
+        prefix = os.sep if os.path.isabs(pattern) else os.curdir
+    return os.path.abspath(prefix)
+
+
+def expand_inputs(patterns: list[str]) -> dict[str, str]:
+    """Mengurai pola glob (mendukung ``**``) menjadi daftar PDF unik.
+
+    Args:
+        patterns (List[str]): Path atau pola glob; direktori berarti
+            seluruh PDF di dalamnya.
+
+    Returns:
+        Dict[str, str]: Path absolut PDF (terurut) beserta direktori dasar
+            pola pertama yang mencakupnya.
+
+    """
+    roots: dict[str, str] = {}
+    for pattern in patterns:
+        root: str = input_root(pattern)
+        if os.path.isdir(pattern):
+            # Filter ekstensi di bawah tidak peka huruf, misal ".PDF"
+            pattern = os.path.join(pattern, "**", "*")
+        for path in glob.glob(pattern, recursive=True):
+            if os.path.isfile(path) and path.lower().endswith(".pdf"):
+                roots.setdefault(os.path.abspath(path), root)
+    return dict(sorted(roots.items()))
+
+
+def output_path(source: str, out_dir: str | None, fmt: str, root: str = "") -> str:
+    """Menentukan path keluaran: nama PDF dengan ekstensi format.
+
+    Args:
+        source (str): Path PDF sumber.
+        out_dir (Optional[str]): Direktori keluaran; None untuk di samping PDF.
+        fmt (str): Kunci ``WRITERS``.
+        root (str): Direktori dasar masukan; subdirektori sumber relatif
+            terhadapnya dicerminkan di bawah ``out_dir``.
+
+    Returns:
+        str: Path absolut file keluaran.
+
+    """
+    stem: str = os.path.splitext(os.path.basename(source))[0]
+    folder: str = os.path.dirname(source)
+    if out_dir:
+        folder = os.path.join(out_dir, os.path.relpath(folder, root or folder))
+    return os.path.abspath(os.path.join(folder, stem + WRITERS[fmt].extensions[0]))
+
+
+def find_collisions(targets: dict[str, str]) -> dict[str, list[str]]:
+    """Mencari file keluaran yang akan ditulis oleh lebih dari satu sumber.
+
+    Args:
+        targets (Dict[str, str]): Pemetaan path sumber ke path keluaran.
+
+    Returns:
+        Dict[str, List[str]]: Path keluaran bentrok beserta sumber-sumbernya.
+
+    """
+    by_output: dict[str, list[str]] = {}
+    for source, output in targets.items():
+        # normcase: di Windows nama file tidak membedakan huruf besar/kecil
+        by_output.setdefault(os.path.normcase(output), []).append(source)
+    return {
+        targets[sources[0]]: sources
+        for sources in by_output.values()
+        if len(sources) > 1
+    }
+
+
+def is_current(
+    source: str, output: str, entry: dict[str, Any] | None, options: dict[str, Any]
+) -> tuple[bool, dict[str, Any]]:
+    """Memeriksa apakah keluaran masih mutakhir terhadap sumbernya.
+
+    Args:
+        source (str): Path PDF sumber.
+        output (str): Path file keluaran.
+        entry (Optional[Dict[str, Any]]): Catatan manifest sebelumnya.
+        options (Dict[str, Any]): Opsi ekspor (``pages``, ``format``,
+            ``skip``).
+
+    Returns:
+        Tuple[bool, Dict[str, Any]]: Status mutakhir dan catatan manifest
+            baru untuk sumber saat ini.
+
+    """
+    stat = os.stat(source)
+    fresh: dict[str, Any] = {
+        "source": source,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "pages": options["pages"],
+        "format": options["format"],
+    }
+    if options["skip"] == "hash":
+        fresh["sha256"] = file_sha256(source)
+    if options["skip"] == "none" or not os.path.exists(output):
+        return False, fresh
+
+    if entry is None:
+        # Belum tercatat (misal diekspor dari GUI): cukup bandingkan mtime
+        return (
+            options["skip"] == "mtime" and os.path.getmtime(output) >= stat.st_mtime
+        ), fresh
+    same_options: bool = (
+        entry.get("pages") == fresh["pages"] and entry.get("format") == fresh["format"]
+    )
+    if options["skip"] == "hash":
+        return same_options and entry.get("sha256") == fresh["sha256"], fresh
+    return (
+        same_options
+        and entry.get("size") == fresh["size"]
+        and entry.get("mtime") == fresh["mtime"]
+    ), fresh
+
+
+def export_file(
+    source: str, output: str, entry: dict[str, Any] | None, options: dict[str, Any]
+) -> FileResult:
+    """Mengekspor satu file PDF di proses pekerja.
+
+    Args:
+        source (str): Path PDF sumber.
+        output (str): Path file keluaran.
+        entry (Optional[Dict[str, Any]]): Catatan manifest sebelumnya.
+        options (Dict[str, Any]): Opsi ekspor (``pages``, ``format``,
+            ``skip``).
+
+    Returns:
+        FileResult: Ringkasan hasil ekspor file.
+
+    """
+    start: float = time.perf_counter()
+    try:
+        current, fresh = is_current(source, output, entry, options)
+        if current:
+            return FileResult(source, output, "skipped", entry=entry or fresh)
+
+        # Pool CLI sudah paralel per file; ekstraksi di dalam file serial
+        manager = ExportManager(workers=1)
+        with fitz.open(source) as doc:
+            indices: list[int] | None = manager.parse_ranges(
+                options["pages"] or f"1-{len(doc)}", len(doc)
+            )
+            if indices is None:
+                raise ValueError(f"Rentang halaman tidak valid: {options['pages']}")
+            job = ExportJob(output, source, len(indices))
+            manager.export(doc, output, indices, job=job, fmt=options["format"])
+        return FileResult(
+            source,
+            output,
+            job.state,
+            len(indices),
+            job.rows_written,
+            time.perf_counter() - start,
+            fresh,
+            str(job.error or ""),
+        )
+    except Exception as e:
+        return FileResult(
+            source, output, "failed", seconds=time.perf_counter() - start, error=str(e)
+        )
+
+
+def load_manifest(path: str) -> dict[str, dict[str, Any]]:
+    """Membaca manifest ekspor, kosong bila belum ada atau rusak."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path: str, manifest: dict[str, dict[str, Any]]) -> None:
+    """Menulis manifest ekspor secara atomik."""
+    tmp: str = path + ".part"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Mengurai argumen baris perintah."""
+    parser = argparse.ArgumentParser(
+        description="Ekspor massal teks PDF tanpa GUI.",
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="File, direktori, atau pola glob PDF (mendukung **)"
+    )
+    parser.add_argument(
+        "-o", "--output-dir", help="Direktori keluaran (bawaan: di samping PDF)"
+    )
+    parser.add_argument(
+        "-f", "--format", choices=list(WRITERS), default="csv", help="Format keluaran"
+    )
+    parser.add_argument(
+        "-p",
+        "--pages",
+        default="",
+        help="Rentang halaman, misal 1,3,5-10 (bawaan: semua)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Jumlah file yang diekspor bersamaan",
+    )
+    parser.add_argument(
+        "--skip",
+        choices=("mtime", "hash", "none"),
+        default="mtime",
+        help="Cara mendeteksi keluaran yang masih mutakhir",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Menjalankan ekspor massal dan mencetak ringkasan throughput.
+
+    Args:
+        argv (Optional[List[str]]): Argumen; None untuk ``sys.argv``.
+
+    Returns:
+        int: Kode keluar, 1 jika ada file yang gagal, 2 jika beberapa
+            sumber menuju file keluaran yang sama.
+
+    """
+    args = parse_args(argv)
+    roots: dict[str, str] = expand_inputs(args.inputs)
+    if not roots:
+        print("Tidak ada file PDF yang cocok.", file=sys.stderr)
+        return 1
+    options: dict[str, Any] = {
+        "pages": args.pages,
+        "format": args.format,
+        "skip": args.skip,
+    }
+
+    outputs: dict[str, str] = {
+        source: resolve_writer(
+            output_path(source, args.output_dir, args.format, root), args.format
+        ).filepath
+        for source, root in roots.items()
+    }
+    collisions: dict[str, list[str]] = find_collisions(outputs)
+    if collisions:
+        for output, sources in collisions.items():
+            print(
+                f"Keluaran bentrok: {output} <- {', '.join(sources)}", file=sys.stderr
+            )
+        return 2
+
+    # Satu manifest per direktori keluaran
+    manifests: dict[str, dict[str, dict[str, Any]]] = {}
+    targets: list[tuple[str, str, str]] = []
+    for source, output in outputs.items():
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        manifest_path: str = os.path.join(os.path.dirname(output), MANIFEST_NAME)
+        if manifest_path not in manifests:
+            manifests[manifest_path] = load_manifest(manifest_path)
+        targets.append((source, output, manifest_path))
+
+    results: list[FileResult] = []
+    started: float = time.perf_counter()
+    with ProcessPoolExecutor(max(1, args.jobs)) as pool:
+        futures = {
+            pool.submit(
+                export_file, source, output, manifests[mpath].get(output), options
+            ): mpath
+            for source, output, mpath in targets
+        }
+        for n, future in enumerate(as_completed(futures), start=1):
+            result: FileResult = future.result()
+            results.append(result)
+            if result.state in ("done", "skipped"):
+                manifests[futures[future]][result.output] = result.entry
+            if result.error:
+                detail: str = result.error
+            elif result.state == "skipped":
+                detail = "masih mutakhir"
+            else:
+                detail = (
+                    f"{result.pages} hlm, {result.rows} span, {result.seconds:.2f} s"
+                )
+            print(
+                f"[{n}/{len(targets)}] {result.state:<8} "
+                f"{os.path.basename(result.source)} -> {result.output} ({detail})"
+            )
+    elapsed: float = time.perf_counter() - started
+
+    for path, manifest in manifests.items():
+        save_manifest(path, manifest)
+
+    done = [r for r in results if r.state == "done"]
+    failed = [r for r in results if r.state not in ("done", "skipped")]
+    pages: int = sum(r.pages for r in done)
+    rows: int = sum(r.rows for r in done)
+    per_sec: float = 1 / elapsed if elapsed > 0 else 0.0
+    print(
+        f"\n{len(done)} diekspor, {len(results) - len(done) - len(failed)} dilewati, "
+        f"{len(failed)} gagal dalam {elapsed:.2f} s"
+    )
+    print(
+        f"{len(done) * per_sec:.2f} file/s, {pages * per_sec:.1f} hlm/s, "
+        f"{rows * per_sec:,.0f} span/s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
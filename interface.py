@@ -7,6 +7,7 @@ framework GUI tertentu (seperti PyQt6 atau PySide).
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 
@@ -18,15 +19,116 @@ class PDFViewInterface:
     """
 
     def display_page(
-        self, pix: Any, ox: float, oy: float, region: tuple[float, float, float, float]
+        self,
+        pix: Any,
+        ox: float,
+        oy: float,
+        region: tuple[float, float, float, float],
+        scale: float = 1.0,
     ) -> None:
         """Menampilkan pixmap halaman PDF pada area viewport.
 
         Args:
-            pix (Any): Objek pixmap hasil render (biasanya fitz.Pixmap).
+            pix (Any): Objek pixmap hasil render (``PixmapData`` atau fitz.Pixmap).
             ox (float): Offset horizontal (X) untuk posisi halaman.
             oy (float): Offset vertikal (Y) untuk posisi halaman.
             region (Tuple[float, float, float, float]): Area render (x, y, w, h).
+            scale (float): Faktor pembesaran pixmap; lebih dari 1 untuk
+                placeholder resolusi rendah.
+
+        """
+        raise NotImplementedError()
+
+    def prepare_tiled_page(self, region: tuple[float, float, float, float]) -> None:
+        """Menyiapkan area halaman kosong yang akan diisi tile secara bertahap.
+
+        Args:
+            region (Tuple[float, float, float, float]): Area render (x, y, w, h).
+
+        """
+        raise NotImplementedError()
+
+    def display_tile(self, tile: tuple[int, ...], pix: Any, x: float, y: float) -> None:
+        """Menampilkan satu tile halaman sebagai item scene terpisah.
+
+        Args:
+            tile (Tuple[int, ...]): Kunci tile, (kolom, baris) atau pada mode
+                kontinu (halaman, kolom, baris).
+            pix (Any): Pixmap tile hasil render (``PixmapData`` atau fitz.Pixmap).
+            x (float): Posisi horizontal tile pada scene.
+            y (float): Posisi vertikal tile pada scene.
+
+        """
+        raise NotImplementedError()
+
+    def prune_tiles(self, keep: set[tuple[int, ...]]) -> None:
+        """Membuang tile yang tidak lagi berada di sekitar viewport.
+
+        Args:
+            keep (Set[Tuple[int, ...]]): Kunci tile yang dipertahankan.
+
+        """
+        raise NotImplementedError()
+
+    def prepare_continuous_scene(
+        self,
+        slots: list[tuple[float, float, float, float]],
+        region: tuple[float, float, float, float],
+    ) -> None:
+        """Menyiapkan scene mode kontinu tanpa item halaman.
+
+        Args:
+            slots (List[Tuple[float, float, float, float]]): Area (x, y, w, h)
+                setiap halaman pada scene.
+            region (Tuple[float, float, float, float]): Area scene keseluruhan.
+
+        """
+        raise NotImplementedError()
+
+    def display_page_item(self, page: int, pix: Any, x: float, y: float) -> None:
+        """Menampilkan pixmap satu halaman pada slotnya di mode kontinu.
+
+        Args:
+            page (int): Indeks halaman (0-indexed).
+            pix (Any): Pixmap halaman hasil render (``PixmapData`` atau fitz.Pixmap).
+            x (float): Posisi horizontal slot pada scene.
+            y (float): Posisi vertikal slot pada scene.
+
+        """
+        raise NotImplementedError()
+
+    def release_pages(self, keep: set[int]) -> None:
+        """Melepas pixmap dan overlay halaman yang jauh dari viewport.
+
+        Args:
+            keep (Set[int]): Indeks halaman yang dipertahankan.
+
+        """
+        raise NotImplementedError()
+
+    def scroll_to(self, y: float) -> None:
+        """Menggulir viewport secara vertikal ke posisi scene tertentu.
+
+        Args:
+            y (float): Posisi vertikal pada scene.
+
+        """
+        raise NotImplementedError()
+
+    def get_visible_rect(self) -> tuple[float, float, float, float]:
+        """Mengambil area scene yang sedang terlihat di viewport.
+
+        Returns:
+            Tuple[float, float, float, float]: Area visibel (x, y, w, h).
+
+        """
+        raise NotImplementedError()
+
+    def preview_zoom(self, scale: float) -> None:
+        """Menerapkan pratinjau zoom instan sebagai transformasi tampilan.
+
+        Args:
+            scale (float): Rasio zoom target terhadap zoom hasil render.
 
         """
         raise NotImplementedError()
@@ -47,38 +149,64 @@ class PDFViewInterface:
         raise NotImplementedError()
 
     def draw_text_layer(
-        self, words: list[Any], ox: float, oy: float, zoom: float
+        self,
+        words: Any,
+        ox: float,
+        oy: float,
+        zoom: float,
+        page: int | None = None,
     ) -> None:
         """Menggambar lapisan teks transparan di atas halaman PDF.
 
         Args:
-            words (List[Any]): Daftar data kata (koordinat dan teks) dari PDF.
+            words (BoxTable): Tabel kolom kata (koordinat dan teks) dari PDF.
             ox (float): Offset horizontal halaman.
             oy (float): Offset vertikal halaman.
             zoom (float): Tingkat zoom saat ini.
+            page (Optional[int]): Indeks halaman pemilik overlay pada mode
+                kontinu; None untuk mode satu halaman.
 
         """
         raise NotImplementedError()
 
     def draw_csv_layer(
-        self, data: list[Any], ox: float, oy: float, zoom: float
+        self,
+        data: Any,
+        ox: float,
+        oy: float,
+        zoom: float,
+        page: int | None = None,
     ) -> None:
         """Menggambar lapisan overlay berdasarkan data CSV.
 
         Args:
-            data (List[Any]): Daftar data koordinat dari cache CSV.
+            data (BoxTable): Tabel kolom baris CSV halaman dari cache.
             ox (float): Offset horizontal halaman.
             oy (float): Offset vertikal halaman.
             zoom (float): Tingkat zoom saat ini.
+            page (Optional[int]): Indeks halaman pemilik overlay pada mode
+                kontinu; None untuk mode satu halaman.
 
         """
         raise NotImplementedError()
 
-    def clear_overlay_layer(self, tag: str) -> None:
+    def clear_overlay_layer(self, tag: str, page: int | None = None) -> None:
         """Menghapus lapisan overlay tertentu secara selektif.
 
         Args:
             tag (str): Identitas layer yang akan dihapus (misal: "text_layer").
+            page (Optional[int]): Batasi penghapusan pada satu halaman; None
+                untuk seluruh halaman.
+
+        """
+        raise NotImplementedError()
+
+    def set_layer_visible(self, tag: str, visible: bool) -> None:
+        """Menampilkan atau menyembunyikan satu layer overlay tanpa membangun ulang.
+
+        Args:
+            tag (str): Identitas layer (misal: "csv_layer").
+            visible (bool): Status visibilitas layer yang diinginkan.
 
         """
         raise NotImplementedError()
@@ -88,7 +216,7 @@ class PDFViewInterface:
         page_num: int,
         total: int,
         zoom: float,
-        is_sandwich: bool,
+        is_sandwich: bool | None,
         width: float,
         height: float,
         has_csv: bool,
@@ -99,7 +227,8 @@ class PDFViewInterface:
             page_num (int): Nomor halaman saat ini.
             total (int): Total halaman dokumen.
             zoom (float): Tingkat zoom saat ini.
-            is_sandwich (bool): Status apakah halaman memiliki teks (sandwich PDF).
+            is_sandwich (Optional[bool]): Status apakah halaman memiliki teks
+                (sandwich PDF), None selama halaman belum dipindai.
             width (float): Lebar halaman dalam poin.
             height (float): Tinggi halaman dalam poin.
             has_csv (bool): Status keberadaan file CSV terkait.
@@ -125,6 +254,26 @@ class PDFViewInterface:
         """
         raise NotImplementedError()
 
+    def show_status_message(self, text: str) -> None:
+        """Menampilkan pesan singkat (hasil atau galat) di status bar.
+
+        Args:
+            text (str): Pesan yang ditampilkan.
+
+        """
+        raise NotImplementedError()
+
+    def track_export_job(self, job: Any, on_finished: Callable[[Any], None]) -> None:
+        """Menampilkan progres job ekspor latar belakang hingga selesai.
+
+        Args:
+            job (Any): Job ekspor yang sedang berjalan (ExportJob).
+            on_finished (Callable[[Any], None]): Dipanggil di thread
+                GUI setelah job berakhir.
+
+        """
+        raise NotImplementedError()
+
     def set_application_title(self, filename: str) -> None:
         """Mengubah judul aplikasi berdasarkan dokumen yang sedang aktif.
 
@@ -134,11 +283,60 @@ class PDFViewInterface:
         """
         raise NotImplementedError()
 
-    def update_highlight_only(self, selected_id: str | int) -> None:
+    def update_highlight_only(
+        self, selected_id: str | int, grouped_ids: set[str]
+    ) -> None:
         """Memperbarui sorotan (highlight) visual tanpa merender ulang halaman.
 
         Args:
             selected_id (Union[str, int]): ID elemen yang dipilih untuk disorot.
+            grouped_ids (Set[str]): ID baris yang satu kelompok dengan pilihan.
+
+        """
+        raise NotImplementedError()
+
+    def draw_search_layer(
+        self,
+        data: Any,
+        ox: float,
+        oy: float,
+        zoom: float,
+        page: int | None = None,
+    ) -> None:
+        """Menggambar kotak hasil pencarian satu halaman.
+
+        Args:
+            data (BoxTable): Kotak hasil dengan ID nomor hasil; tabel kosong
+                menghapus layer hasil halaman tersebut.
+            ox (float): Offset horizontal halaman.
+            oy (float): Offset vertikal halaman.
+            zoom (float): Tingkat zoom saat ini.
+            page (Optional[int]): Indeks halaman pemilik overlay pada mode
+                kontinu; None untuk mode satu halaman.
+
+        """
+        raise NotImplementedError()
+
+    def focus_search_hit(
+        self, hit_id: int, page: int | None = None, center: bool = True
+    ) -> None:
+        """Menyorot hasil pencarian aktif dan (opsional) memusatkan tampilan.
+
+        Args:
+            hit_id (int): Nomor hasil pencarian yang disorot.
+            page (Optional[int]): Indeks halaman pada mode kontinu; None untuk
+                mode satu halaman.
+            center (bool): True untuk memusatkan viewport pada hasil.
+
+        """
+        raise NotImplementedError()
+
+    def update_search_info(self, current: int, total: int) -> None:
+        """Memperbarui penunjuk posisi hasil pencarian pada navigasi.
+
+        Args:
+            current (int): Nomor hasil aktif (mulai dari 1), 0 jika tidak ada.
+            total (int): Jumlah seluruh hasil.
 
         """
         raise NotImplementedError()
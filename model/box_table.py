@@ -0,0 +1,306 @@
+"""Modul penyimpanan kolumnar untuk kotak kata PDF dan baris overlay CSV.
+
+Setiap halaman disimpan sebagai beberapa array NumPy (koordinat float32,
+ID integer, nomor blok/baris) ditambah seluruh teks yang digabung menjadi
+satu string dengan array offset. Dibandingkan daftar tuple Python, memori
+per kotak turun dari ratusan byte menjadi puluhan byte, dan operasi atas
+seluruh kotak (indeks, pengelompokan, gambar) cukup berupa operasi vektor.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+import numpy as np
+
+
+def _is_canonical_int(value: str) -> bool:
+    """Memeriksa apakah string sama persis dengan ``str(int(value))``."""
+    try:
+        return str(int(value)) == value
+    except ValueError:
+        return False
+
+
+class BoxTable:
+    """Tabel kotak satu halaman dalam bentuk kolom.
+
+    Akses per indeks (``table[i]``) tetap menghasilkan tuple seperti data
+    asal sehingga kode yang hanya membaca satu-dua baris tidak perlu diubah;
+    jalur panas (render, indeks spasial, pengelompokan) memakai kolomnya.
+
+    Attributes:
+        coords (np.ndarray): Array float32 berbentuk (n, 4) berisi
+            ``x0, top, x1, bottom`` dalam poin PDF.
+        ids (Optional[np.ndarray]): ID baris CSV (int64 jika semua ID berupa
+            bilangan bulat kanonis seperti ``"7"``, selain itu string apa
+            adanya, misal ``"007"``); None untuk kata PDF.
+        blocks (Optional[np.ndarray]): Nomor blok PyMuPDF setiap kata (int32).
+        lines (Optional[np.ndarray]): Nomor baris PyMuPDF setiap kata (int32).
+        level (str): Tingkat detail kotak: ``"word"`` untuk data asli, atau
+            ``"line"``, ``"block"``, ``"page"`` untuk hasil :meth:`coarse`.
+
+    """
+
+    __slots__ = (
+        "coords",
+        "ids",
+        "blocks",
+        "lines",
+        "level",
+        "_text",
+        "_offsets",
+        "_id_index",
+        "_coarse",
+    )
+
+    def __init__(
+        self,
+        coords: np.ndarray,
+        texts: Sequence[str],
+        ids: np.ndarray | None = None,
+        blocks: np.ndarray | None = None,
+        lines: np.ndarray | None = None,
+        level: str = "word",
+    ) -> None:
+        """Inisialisasi tabel dari kolom yang sudah terbentuk.
+
+        Args:
+            coords (np.ndarray): Koordinat berbentuk (n, 4).
+            texts (Sequence[str]): Teks setiap kotak.
+            ids (Optional[np.ndarray]): ID baris CSV.
+            blocks (Optional[np.ndarray]): Nomor blok setiap kata.
+            lines (Optional[np.ndarray]): Nomor baris setiap kata.
+            level (str): Tingkat detail kotak dalam tabel.
+
+        """
+        self.coords: np.ndarray = np.asarray(coords, dtype=np.float32).reshape(-1, 4)
+        self.ids: np.ndarray | None = ids
+        self.blocks: np.ndarray | None = blocks
+        self.lines: np.ndarray | None = lines
+        self.level: str = level
+
+        # Teks digabung menjadi satu string; offset menandai batas tiap kotak
+        self._text: str = "".join(texts)
+        offsets = np.zeros(len(texts) + 1, dtype=np.int32)
+        np.cumsum([len(t) for t in texts], out=offsets[1:])
+        self._offsets: np.ndarray = offsets
+        self._id_index: dict[str, list[int]] | None = None  # Dibangun saat perlu
+        self._coarse: dict[str, BoxTable] = {}
+
+    @classmethod
+    def from_words(cls, words: Sequence[Sequence[Any]]) -> BoxTable:
+        """Membuat tabel dari hasil ``page.get_text("words")``.
+
+        Args:
+            words (Sequence[Sequence[Any]]): Tuple ``(x0, y0, x1, y1, teks,
+                blok, baris, nomor_kata)`` dari PyMuPDF.
+
+        Returns:
+            BoxTable: Tabel kata satu halaman.
+
+        """
+        return cls(
+            np.array([w[:4] for w in words], dtype=np.float32),
+            [w[4] for w in words],
+            blocks=np.array([w[5] for w in words], dtype=np.int32),
+            lines=np.array([w[6] for w in words], dtype=np.int32),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> BoxTable:
+        """Membuat tabel dari baris CSV overlay.
+
+        Args:
+            rows (Sequence[Sequence[Any]]): Tuple ``(x0, top, x1, bottom,
+                teks, nomor)``.
+
+        Returns:
+            BoxTable: Tabel baris CSV satu halaman.
+
+        """
+        raw_ids = [str(r[5]) for r in rows]
+        if all(_is_canonical_int(v) for v in raw_ids):
+            ids = np.array([int(v) for v in raw_ids], dtype=np.int64)
+        else:
+            # Simpan apa adanya agar ID seperti "007" tidak berubah menjadi "7"
+            ids = np.array(raw_ids, dtype=str)
+        return cls(
+            np.array([r[:4] for r in rows], dtype=np.float32),
+            [r[4] for r in rows],
+            ids=ids,
+        )
+
+    def __len__(self) -> int:
+        """Jumlah kotak dalam tabel."""
+        return len(self.coords)
+
+    def __getitem__(self, i: int) -> tuple[Any, ...]:
+        """Mengambil satu kotak sebagai tuple seperti data asalnya.
+
+        Args:
+            i (int): Indeks kotak.
+
+        Returns:
+            Tuple: ``(x0, top, x1, bottom, teks, nomor)`` untuk CSV atau
+            ``(x0, y0, x1, y1, teks, blok, baris)`` untuk kata.
+
+        """
+        if i < 0:
+            i += len(self)
+        x0, y0, x1, y1 = self.coords[i].tolist()
+        if self.ids is not None:
+            return (x0, y0, x1, y1, self.text(i), self.id_str(i))
+        if self.blocks is not None and self.lines is not None:
+            return (
+                x0,
+                y0,
+                x1,
+                y1,
+                self.text(i),
+                int(self.blocks[i]),
+                int(self.lines[i]),
+            )
+        return (x0, y0, x1, y1, self.text(i))
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        """Iterasi tuple per kotak (jalur lambat, hindari pada data besar)."""
+        return (self[i] for i in range(len(self)))
+
+    def text(self, i: int) -> str:
+        """Mengambil teks kotak ke-i dari string gabungan.
+
+        Args:
+            i (int): Indeks kotak.
+
+        Returns:
+            str: Teks kotak.
+
+        """
+        return self._text[self._offsets[i] : self._offsets[i + 1]]
+
+    def id_str(self, i: int) -> str:
+        """Mengambil ID baris ke-i sebagai string.
+
+        Args:
+            i (int): Indeks kotak.
+
+        Returns:
+            str: ID baris, atau string kosong jika tabel tidak memiliki ID.
+
+        """
+        return "" if self.ids is None else str(self.ids[i])
+
+    def mask_for_ids(self, row_ids: Iterable[Any]) -> np.ndarray:
+        """Membuat mask boolean untuk kotak dengan ID tertentu.
+
+        Args:
+            row_ids (Iterable[Any]): ID yang dicari (string atau angka).
+
+        Returns:
+            np.ndarray: Mask boolean sepanjang tabel.
+
+        """
+        if self.ids is None:
+            return np.zeros(len(self), dtype=bool)
+        if self.ids.dtype.kind == "i":
+            # Cocokkan bentuk string yang sama seperti indices_for_ids
+            wanted = [int(v) for v in map(str, row_ids) if _is_canonical_int(v)]
+        else:
+            wanted = [str(v) for v in row_ids]
+        if not wanted:
+            return np.zeros(len(self), dtype=bool)
+        return np.isin(self.ids, np.array(wanted, dtype=self.ids.dtype))
+
+    def indices_for_ids(self, row_ids: Iterable[Any]) -> list[int]:
+        """Mencari indeks kotak untuk sejumlah kecil ID tanpa memindai tabel.
+
+        Peta ID ke indeks dibangun sekali saat pertama kali dibutuhkan,
+        sehingga setiap pencarian berikutnya sebanding dengan jumlah ID.
+
+        Args:
+            row_ids (Iterable[Any]): ID yang dicari (string atau angka).
+
+        Returns:
+            List[int]: Indeks kotak yang cocok, tanpa urutan tertentu.
+
+        """
+        if self.ids is None:
+            return []
+        if self._id_index is None:
+            index: dict[str, list[int]] = {}
+            for i, rid in enumerate(self.ids.tolist()):
+                index.setdefault(str(rid), []).append(i)
+            self._id_index = index
+        found: list[int] = []
+        for rid in row_ids:
+            found.extend(self._id_index.get(str(rid), ()))
+        return found
+
+    def index_of(self, row_id: Any) -> int | None:
+        """Mencari indeks kotak pertama dengan ID tertentu.
+
+        Args:
+            row_id (Any): ID baris yang dicari.
+
+        Returns:
+            Optional[int]: Indeks kotak, atau None jika tidak ditemukan.
+
+        """
+        hits = np.flatnonzero(self.mask_for_ids([row_id]))
+        return int(hits[0]) if len(hits) else None
+
+    def coarse(self, level: str) -> BoxTable:
+        """Menggabungkan kotak kata menjadi kotak baris, blok, atau halaman.
+
+        Pengelompokan memakai nomor blok/baris dari ``get_text("words")``;
+        setiap kelompok menjadi satu kotak pembungkus. Hasil disimpan pada
+        tabel sehingga perpindahan tingkat zoom tidak menghitung ulang.
+
+        Args:
+            level (str): ``"line"``, ``"block"``, atau ``"page"``.
+
+        Returns:
+            BoxTable: Tabel kotak gabungan tanpa teks, atau tabel ini sendiri
+            jika ``level`` adalah ``"word"`` atau nomor blok/baris tidak ada.
+
+        """
+        if level == "word" or self.blocks is None or self.lines is None:
+            return self
+        cached = self._coarse.get(level)
+        if cached is not None:
+            return cached
+
+        n: int = len(self)
+        if level == "line":
+            keys = np.stack([self.blocks, self.lines], axis=1)
+            _, group = np.unique(keys, axis=0, return_inverse=True)
+        elif level == "block":
+            _, group = np.unique(self.blocks, return_inverse=True)
+        else:
+            group = np.zeros(n, dtype=np.intp)
+        group = group.reshape(-1)
+        count: int = int(group.max()) + 1 if n else 0
+
+        coords = np.empty((count, 4), dtype=np.float32)
+        coords[:, :2] = np.inf
+        coords[:, 2:] = -np.inf
+        np.minimum.at(coords[:, 0], group, self.coords[:, 0])
+        np.minimum.at(coords[:, 1], group, self.coords[:, 1])
+        np.maximum.at(coords[:, 2], group, self.coords[:, 2])
+        np.maximum.at(coords[:, 3], group, self.coords[:, 3])
+
+        cached = BoxTable(coords, [""] * count, level=level)
+        self._coarse[level] = cached
+        return cached
+
+    @property
+    def nbytes(self) -> int:
+        """Perkiraan memori kolom tabel dalam byte."""
+        arrays = (self.coords, self.ids, self.blocks, self.lines, self._offsets)
+        return sum(a.nbytes for a in arrays if a is not None) + len(self._text)
+
+
+# Tabel kosong bersama untuk halaman tanpa data
+EMPTY_TABLE: BoxTable = BoxTable(np.zeros((0, 4), dtype=np.float32), [])
@@ -22,6 +22,7 @@ class PDFDocumentModel:
         total_pages (int): Jumlah total halaman dalam dokumen.
         zoom_level (float): Faktor perbesaran tampilan (1.0 = 100%).
         padding (int): Jarak luar antar elemen tampilan dalam piksel.
+        continuous (bool): True jika halaman ditampilkan dalam mode scroll kontinu.
         csv_path (Optional[str]): Path file CSV hasil audit/overlay.
         is_sandwich (bool): Status apakah dokumen memiliki layer teks (sandwich PDF).
         has_csv (bool): Status apakah data CSV telah dimuat ke dalam model.
@@ -41,6 +42,7 @@ class PDFDocumentModel:
         self.total_pages: int = 0
         self.zoom_level: float = 1.0
         self.padding: int = 30
+        self.continuous: bool = False
 
         # Status Overlay & Audit
         self.csv_path: str | None = None
@@ -0,0 +1,151 @@
+"""Modul tabel metadata halaman untuk satu dokumen PDF.
+
+Metadata setiap halaman (ukuran, rotasi, keberadaan teks, jumlah blok teks,
+jumlah gambar, dan jumlah kata) disimpan sebagai kolom NumPy sehingga dokumen ribuan
+halaman cukup memakai beberapa puluh kilobyte. Tabel diisi bertahap oleh
+pemindaian latar belakang; baris yang belum dipindai ditandai lewat
+kolom ``state``.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+# Status baris tabel
+UNKNOWN: int = 0  # Belum ada data sama sekali
+SIZED: int = 1  # Ukuran dan rotasi sudah diketahui
+SCANNED: int = 2  # Seluruh kolom sudah terisi
+
+
+class PageInfo(NamedTuple):
+    """Metadata satu halaman PDF.
+
+    Attributes:
+        width (float): Lebar halaman dalam poin PDF (sudah memperhitungkan rotasi).
+        height (float): Tinggi halaman dalam poin PDF.
+        rotation (int): Rotasi halaman dalam derajat.
+        has_text (Optional[bool]): True jika halaman memiliki kata tidak
+            kosong (sandwich), None jika halaman belum dipindai.
+        text_blocks (int): Jumlah blok teks, termasuk yang hanya berisi spasi.
+        image_count (int): Jumlah gambar yang dirujuk halaman.
+        word_count (int): Jumlah kata hasil ekstraksi teks.
+
+    """
+
+    width: float
+    height: float
+    rotation: int
+    has_text: bool | None
+    text_blocks: int
+    image_count: int
+    word_count: int
+
+
+class PageInfoTable:
+    """Tabel kolom metadata seluruh halaman satu dokumen.
+
+    Attributes:
+        sizes (np.ndarray): Array float64 (n, 2) berisi lebar dan tinggi.
+        rotation (np.ndarray): Rotasi setiap halaman (int16).
+        has_text (np.ndarray): Penanda layer teks setiap halaman (bool).
+        text_blocks (np.ndarray): Jumlah blok teks setiap halaman (int32).
+        image_count (np.ndarray): Jumlah gambar setiap halaman (int32).
+        word_count (np.ndarray): Jumlah kata setiap halaman (int32).
+        state (np.ndarray): Status baris: UNKNOWN, SIZED, atau SCANNED (uint8).
+
+    """
+
+    def __init__(self, total_pages: int) -> None:
+        """Inisialisasi tabel kosong untuk sejumlah halaman.
+
+        Args:
+            total_pages (int): Jumlah halaman dokumen.
+
+        """
+        self.sizes: np.ndarray = np.zeros((total_pages, 2), dtype=np.float64)
+        self.rotation: np.ndarray = np.zeros(total_pages, dtype=np.int16)
+        self.has_text: np.ndarray = np.zeros(total_pages, dtype=bool)
+        self.text_blocks: np.ndarray = np.zeros(total_pages, dtype=np.int32)
+        self.image_count: np.ndarray = np.zeros(total_pages, dtype=np.int32)
+        self.word_count: np.ndarray = np.zeros(total_pages, dtype=np.int32)
+        self.state: np.ndarray = np.zeros(total_pages, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        """Jumlah halaman dalam tabel."""
+        return len(self.state)
+
+    def set_size(self, p_idx: int, width: float, height: float, rotation: int) -> None:
+        """Mengisi ukuran dan rotasi satu halaman tanpa ekstraksi teks.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            width (float): Lebar halaman dalam poin PDF.
+            height (float): Tinggi halaman dalam poin PDF.
+            rotation (int): Rotasi halaman dalam derajat.
+
+        """
+        self.sizes[p_idx] = (width, height)
+        self.rotation[p_idx] = rotation
+        self.state[p_idx] = max(int(self.state[p_idx]), SIZED)
+
+    def set_row(self, p_idx: int, info: PageInfo) -> None:
+        """Mengisi seluruh kolom satu halaman.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+            info (PageInfo): Metadata hasil pemindaian halaman.
+
+        """
+        self.set_size(p_idx, info.width, info.height, info.rotation)
+        self.has_text[p_idx] = info.has_text
+        self.text_blocks[p_idx] = info.text_blocks
+        self.image_count[p_idx] = info.image_count
+        self.word_count[p_idx] = info.word_count
+        self.state[p_idx] = SCANNED
+
+    def row(self, p_idx: int) -> PageInfo:
+        """Mengambil metadata satu halaman.
+
+        Args:
+            p_idx (int): Indeks halaman (0-indexed).
+
+        Returns:
+            PageInfo: Metadata halaman; ``has_text`` bernilai None dan kolom
+            jumlah bernilai nol bila halaman belum dipindai.
+
+        """
+        w, h = self.sizes[p_idx].tolist()
+        return PageInfo(
+            w,
+            h,
+            int(self.rotation[p_idx]),
+            bool(self.has_text[p_idx]) if self.is_scanned(p_idx) else None,
+            int(self.text_blocks[p_idx]),
+            int(self.image_count[p_idx]),
+            int(self.word_count[p_idx]),
+        )
+
+    def is_scanned(self, p_idx: int) -> bool:
+        """Memeriksa apakah seluruh kolom halaman sudah terisi."""
+        return bool(self.state[p_idx] == SCANNED)
+
+    @property
+    def scanned_count(self) -> int:
+        """Jumlah halaman yang sudah dipindai penuh."""
+        return int(np.count_nonzero(self.state == SCANNED))
+
+    @property
+    def nbytes(self) -> int:
+        """Memori kolom tabel dalam byte."""
+        arrays = (
+            self.sizes,
+            self.rotation,
+            self.has_text,
+            self.text_blocks,
+            self.image_count,
+            self.word_count,
+            self.state,
+        )
+        return sum(a.nbytes for a in arrays)
@@ -0,0 +1,19 @@
+"""Fixture bersama untuk pengujian unit."""
+
+import fitz  # PyMuPDF
+import pytest
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """Membuat PDF kecil tiga halaman berisi teks dan garis."""
+    path = tmp_path / "contoh.pdf"
+    doc = fitz.open()
+    for p in range(3):
+        page = doc.new_page(width=300, height=300)
+        for i in range(12):
+            page.insert_text((20, 30 + i * 20), f"halaman {p + 1} baris {i} nilai")
+        page.draw_rect(fitz.Rect(10, 10, 290, 290), color=(0, 0, 1))
+    doc.save(path)
+    doc.close()
+    return str(path)
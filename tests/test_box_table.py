@@ -0,0 +1,62 @@
+"""Pengujian tabel kotak kolumnar untuk kata PDF dan baris CSV."""
+
+import fitz  # PyMuPDF
+import numpy as np
+
+from model.box_table import EMPTY_TABLE, BoxTable
+
+
+def test_from_words_roundtrips_get_text_words(sample_pdf):
+    with fitz.open(sample_pdf) as doc:
+        words = doc[0].get_text("words")
+    table = BoxTable.from_words(words)
+    assert len(table) == len(words)
+    for got, want in zip(table, words, strict=True):
+        assert got[4:] == (want[4], want[5], want[6])
+        assert np.allclose(got[:4], want[:4], atol=1e-3)
+
+
+def test_text_offsets_handle_empty_and_unicode():
+    rows = [(0, 0, 1, 1, "", 1), (0, 2, 1, 3, "héllo", 2), (0, 4, 1, 5, "x", 3)]
+    table = BoxTable.from_rows(rows)
+    assert [table.text(i) for i in range(3)] == ["", "héllo", "x"]
+    assert table[-1][4:] == ("x", "3")
+
+
+def test_integer_ids_are_matched_as_strings():
+    table = BoxTable.from_rows([(0, 0, 1, 1, "a", 7), (0, 0, 1, 1, "b", 8)])
+    assert table.ids.dtype.kind == "i"
+    assert table.id_str(0) == "7"
+    assert table.indices_for_ids(["8", 7]) == [1, 0]
+    assert table.mask_for_ids(["7"]).tolist() == [True, False]
+    assert table.index_of("8") == 1
+    # "07" bukan bentuk kanonis ID 7
+    assert table.index_of("07") is None
+
+
+def test_non_canonical_ids_are_kept_verbatim():
+    table = BoxTable.from_rows([(0, 0, 1, 1, "a", "007"), (0, 0, 1, 1, "b", "7")])
+    assert table.ids.dtype.kind == "U"
+    assert table.id_str(0) == "007"
+    assert table.indices_for_ids(["007"]) == [0]
+    assert table.mask_for_ids(["7"]).tolist() == [False, True]
+
+
+def test_coarse_line_and_page_boxes_enclose_words():
+    words = [
+        (10, 10, 20, 20, "a", 0, 0, 0),
+        (30, 12, 40, 22, "b", 0, 0, 1),
+        (10, 40, 25, 50, "c", 0, 1, 0),
+    ]
+    table = BoxTable.from_words(words)
+    lines = table.coarse("line")
+    assert lines.coords.tolist() == [[10, 10, 40, 22], [10, 40, 25, 50]]
+    assert table.coarse("line") is lines  # Disimpan di tabel
+    assert table.coarse("page").coords.tolist() == [[10, 10, 40, 50]]
+    assert table.coarse("word") is table
+
+
+def test_empty_table():
+    assert len(EMPTY_TABLE) == 0
+    assert EMPTY_TABLE.indices_for_ids(["1"]) == []
+    assert EMPTY_TABLE.mask_for_ids(["1"]).tolist() == []
@@ -0,0 +1,63 @@
+"""Pengujian cache LRU dan anggaran byte cache pixmap."""
+
+from controller.cache_mgr import LRUCache, PixmapCache
+from controller.render_worker import PixmapData
+
+
+def _pix(width, height, n=3):
+    return PixmapData(width, height, n, False, 0, 0, bytes(width * height * n))
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" menjadi yang terbaru
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_stats_count_hits_and_misses():
+    cache = LRUCache(4)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("x")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_pixmap_cache_budget_is_in_bytes():
+    cache = PixmapCache(10_000)
+    cache.put(1, _pix(40, 40))  # 4800 byte
+    cache.put(2, _pix(40, 40))
+    assert cache.stats()["size"] == 9600
+    cache.put(3, _pix(20, 20))  # 1200 byte, melewati anggaran
+    assert 1 not in cache
+    assert cache.stats()["size"] == 6000
+
+
+def test_pixmap_larger_than_budget_is_not_stored():
+    cache = PixmapCache(1000)
+    cache.put("besar", _pix(100, 100))
+    assert "besar" not in cache
+    assert cache.stats()["size"] == 0
+
+
+def test_replacing_key_does_not_double_count():
+    cache = PixmapCache(10_000)
+    cache.put("a", _pix(40, 40))
+    cache.put("a", _pix(20, 20))
+    assert cache.stats()["size"] == 1200
+    assert cache.stats()["entries"] == 1
+
+
+def test_set_budget_shrinks_immediately():
+    cache = PixmapCache(10_000)
+    for key in range(4):
+        cache.put(key, _pix(20, 20))
+    cache.set_budget(2500)
+    assert cache.stats()["entries"] == 2
+    assert 3 in cache and 2 in cache
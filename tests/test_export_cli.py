@@ -0,0 +1,102 @@
+"""Pengujian pencerminan direktori dan penanganan tabrakan nama CLI ekspor."""
+
+import os
+import shutil
+
+from export_cli import (
+    expand_inputs,
+    find_collisions,
+    input_root,
+    is_current,
+    main,
+    output_path,
+)
+
+
+def _tree(tmp_path, sample_pdf, *names):
+    """Menyalin ``sample_pdf`` ke path relatif di bawah ``tmp_path/arsip``."""
+    base = tmp_path / "arsip"
+    for name in names:
+        target = base / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(sample_pdf, target)
+    return base
+
+
+def test_input_root_stops_at_first_wildcard(tmp_path):
+    base = tmp_path / "arsip"
+    (base / "a").mkdir(parents=True)
+    assert input_root(str(base)) == str(base)
+    assert input_root(str(base / "a" / "x.pdf")) == str(base / "a")
+    assert input_root(str(base / "**" / "*.pdf")) == str(base)
+    assert input_root(str(base / "a*" / "*.pdf")) == str(base)
+
+
+def test_expand_inputs_keeps_first_matching_root(tmp_path, sample_pdf):
+    base = _tree(tmp_path, sample_pdf, "x.pdf", "sub/y.PDF", "sub/catatan.txt")
+    roots = expand_inputs([str(base / "sub"), str(base)])
+    assert roots == {
+        str(base / "sub" / "y.PDF"): str(base / "sub"),
+        str(base / "x.pdf"): str(base),
+    }
+
+
+def test_output_path_mirrors_subdirectories(tmp_path):
+    root = str(tmp_path / "arsip")
+    source = os.path.join(root, "2024", "jan", "laporan.pdf")
+    out = str(tmp_path / "hasil")
+    assert output_path(source, out, "parquet", root) == os.path.join(
+        out, "2024", "jan", "laporan.parquet"
+    )
+    # Tanpa -o keluaran diletakkan di samping PDF
+    assert output_path(source, None, "csv", root) == os.path.join(
+        root, "2024", "jan", "laporan.csv"
+    )
+    # Tanpa root, file langsung di bawah direktori keluaran
+    assert output_path(source, out, "csv") == os.path.join(out, "laporan.csv")
+
+
+def test_find_collisions_groups_sources_by_output():
+    targets = {
+        "/a/laporan.pdf": "/out/laporan.csv",
+        "/b/laporan.pdf": "/out/laporan.csv",
+        "/c/lain.pdf": "/out/lain.csv",
+    }
+    assert find_collisions(targets) == {
+        "/out/laporan.csv": ["/a/laporan.pdf", "/b/laporan.pdf"]
+    }
+
+
+def test_main_rejects_colliding_outputs(tmp_path, sample_pdf, capsys):
+    base = _tree(tmp_path, sample_pdf, "a/laporan.pdf", "b/laporan.pdf")
+    out = tmp_path / "hasil"
+    # Dua pola dengan root berbeda: subdirektori tidak lagi membedakan nama
+    code = main([str(base / "a"), str(base / "b"), "-o", str(out), "-j", "1"])
+    assert code == 2
+    assert "Keluaran bentrok" in capsys.readouterr().err
+    assert not out.exists()
+
+
+def test_main_mirrors_tree_and_skips_current_outputs(tmp_path, sample_pdf, capsys):
+    base = _tree(tmp_path, sample_pdf, "a/laporan.pdf", "b/laporan.pdf")
+    out = tmp_path / "hasil"
+    args = [str(base / "**" / "*.pdf"), "-o", str(out), "-f", "jsonl", "-j", "1"]
+    assert main(args) == 0
+    for sub in ("a", "b"):
+        assert (out / sub / "laporan.jsonl").stat().st_size > 0
+        assert (out / sub / ".export_manifest.json").exists()
+
+    capsys.readouterr()
+    assert main(args) == 0
+    assert "2 dilewati" in capsys.readouterr().out
+
+
+def test_is_current_detects_changed_options(tmp_path, sample_pdf):
+    output = tmp_path / "contoh.csv"
+    output.write_text("x")
+    options = {"pages": "", "format": "csv", "skip": "mtime"}
+    _, entry = is_current(sample_pdf, str(output), None, options)
+    assert is_current(sample_pdf, str(output), entry, options)[0]
+    changed = dict(options, pages="1")
+    assert not is_current(sample_pdf, str(output), entry, changed)[0]
+    assert not is_current(sample_pdf, str(output), entry, dict(options, skip="none"))[0]
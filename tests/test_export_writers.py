@@ -0,0 +1,114 @@
+"""Pengujian round-trip writer ekspor dan pemilihan writer dari path."""
+
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from controller.export_writers import (
+    COLUMNS,
+    CsvWriter,
+    JsonLinesWriter,
+    SqliteWriter,
+    format_for_filter,
+    resolve_writer,
+)
+
+ROWS = [
+    [1, "Halo; dunia", 10.125, 50.5, 20.0, 30.0, "Helvetica", 11.0, 25.0],
+    [1, 'kutip "ganda"', 60.0, 90.25, 20.0, 30.0, "Helvetica-Bold", 11.0, 25.0],
+    [2, "ünïcode", 1.0, 2.0, 3.0, 4.0, "Helvetica", 9.5, 3.5],
+]
+
+
+def _write(writer, chunks):
+    """Menulis potongan ``(start, rows)`` lalu menutup writer."""
+    writer.open()
+    for start, rows in chunks:
+        writer.write(start, rows)
+    writer.close()
+    return writer.filepath
+
+
+def _expected():
+    return [[n, *row] for n, row in enumerate(ROWS, start=1)]
+
+
+CHUNKS = [(1, ROWS[:2]), (3, ROWS[2:])]
+
+
+def test_csv_roundtrip(tmp_path):
+    path = _write(CsvWriter(str(tmp_path / "out.csv")), CHUNKS)
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        header, *rows = list(csv.reader(f, delimiter=";"))
+    assert header == COLUMNS
+    assert rows == [[str(v) for v in row] for row in _expected()]
+
+
+def test_jsonl_roundtrip(tmp_path):
+    path = _write(JsonLinesWriter(str(tmp_path / "out.jsonl")), CHUNKS)
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records == [dict(zip(COLUMNS, row, strict=True)) for row in _expected()]
+
+
+def test_sqlite_roundtrip(tmp_path):
+    path = _write(SqliteWriter(str(tmp_path / "out.sqlite")), CHUNKS)
+    with sqlite3.connect(path) as conn:
+        names = [r[1] for r in conn.execute("PRAGMA table_info(spans)")]
+        rows = conn.execute("SELECT * FROM spans ORDER BY nomor").fetchall()
+    assert names == COLUMNS
+    assert [list(r) for r in rows] == _expected()
+
+
+def test_parquet_roundtrip_keeps_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = _write(resolve_writer(str(tmp_path / "out.parquet")), CHUNKS)
+    pf = pq.ParquetFile(path)
+    assert pf.metadata.num_row_groups == 2
+    table = pf.read()
+    assert table.column_names == COLUMNS
+    assert [list(r.values()) for r in table.to_pylist()] == _expected()
+
+
+def test_arrow_stream_roundtrip_with_font_deltas(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    path = _write(resolve_writer(str(tmp_path / "out.arrows")), CHUNKS)
+    with pa.ipc.open_stream(path) as reader:
+        table = reader.read_all()
+    assert table.column_names == COLUMNS
+    assert [list(r.values()) for r in table.to_pylist()] == _expected()
+
+
+def test_empty_chunk_writes_header_only(tmp_path):
+    path = _write(SqliteWriter(str(tmp_path / "kosong.db")), [(1, [])])
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM spans").fetchone() == (0,)
+
+
+@pytest.mark.parametrize(
+    ("path", "fmt", "cls", "final"),
+    [
+        ("a.jsonl", None, JsonLinesWriter, "a.jsonl"),
+        ("a.NDJSON", None, JsonLinesWriter, "a.NDJSON"),
+        ("a.txt", None, CsvWriter, "a.txt"),
+        ("a", "sqlite", SqliteWriter, "a.sqlite"),
+        ("a.db", "sqlite", SqliteWriter, "a.db"),
+        ("a.csv", "jsonl", JsonLinesWriter, "a.csv.jsonl"),
+    ],
+)
+def test_resolve_writer(path, fmt, cls, final):
+    writer = resolve_writer(path, fmt)
+    assert type(writer) is cls
+    assert writer.filepath == final
+
+
+def test_resolve_writer_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        resolve_writer("a.csv", "xlsx")
+
+
+def test_format_for_filter():
+    assert format_for_filter(JsonLinesWriter.description) == "jsonl"
+    assert format_for_filter("Semua file (*)") is None
@@ -0,0 +1,64 @@
+"""Pengujian indeks pengelompokan baris dibandingkan perulangan toleransi lama."""
+
+import random
+
+import pytest
+
+from controller.line_group_mgr import LineGroupIndex, LineGroupManager
+from model.box_table import BoxTable
+
+
+def _random_table(n, seed=7):
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        top = rnd.randrange(0, 400) / 4
+        height = rnd.randrange(8, 40) / 4
+        x0 = rnd.randrange(0, 500)
+        rows.append((x0, top, x0 + 30, top + height, f"kata{i}", i + 1))
+    return BoxTable.from_rows(rows)
+
+
+def _old_group(table, index, tolerance):
+    """Perulangan toleransi dari _get_grouped_ids sebelum ada indeks."""
+    target = table[index]
+    t_sumbu = (target[1] + target[3]) / 2
+    return {
+        i for i, d in enumerate(table) if abs((d[1] + d[3]) / 2 - t_sumbu) <= tolerance
+    }
+
+
+@pytest.mark.parametrize("tolerance", [0.0, 0.5, 2.0, 7.5])
+def test_group_of_matches_old_loop(tolerance):
+    table = _random_table(300)
+    index = LineGroupIndex(table)
+    for i in range(0, len(table), 7):
+        got = index.group_of(i, tolerance).tolist()
+        assert set(got) == _old_group(table, i, tolerance)
+        assert i in got
+
+
+def test_clusters_cover_every_box_once():
+    table = _random_table(120)
+    clusters = LineGroupIndex(table).clusters(2.0)
+    flat = sorted(i for c in clusters for i in c.tolist())
+    assert flat == list(range(len(table)))
+
+
+def test_empty_table_has_no_clusters():
+    table = BoxTable.from_rows([])
+    assert LineGroupIndex(table).clusters(2.0) == []
+
+
+def test_manager_rebuilds_on_new_table_and_is_bounded():
+    mgr = LineGroupManager(budget=2)
+    table = _random_table(10)
+    first = mgr.index_for(1, table)
+    assert mgr.index_for(1, table) is first
+    assert mgr.index_for(1, _random_table(10)) is not first
+
+    mgr.index_for(2, table)
+    mgr.index_for(3, table)
+    assert mgr._indexes.stats()["entries"] == 2
+    mgr.clear()
+    assert mgr._indexes.stats()["entries"] == 0
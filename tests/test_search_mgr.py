@@ -0,0 +1,70 @@
+"""Pengujian indeks terbalik pencarian teks dan pencarian awalan."""
+
+from controller.search_mgr import SearchHit, SearchIndex, tokenize
+from model.box_table import BoxTable
+
+
+def _rows(*texts):
+    return BoxTable.from_rows(
+        [(0, i * 10, 50, i * 10 + 8, t, i + 1) for i, t in enumerate(texts)]
+    )
+
+
+def _index():
+    index = SearchIndex("csv_layer")
+    index.add_page(0, _rows("Total nilai", "1.234", "subtotal"))
+    index.add_page(1, _rows("nilai total", "TOTAL akhir"))
+    return index
+
+
+def test_tokenize_casefolds_and_splits_punctuation():
+    assert tokenize("Nilai 1.234, ÄB") == ["nilai", "1", "234", "äb"]
+
+
+def test_exact_token_is_case_insensitive():
+    hits = _index().search("total")
+    assert hits == [SearchHit(0, (0,)), SearchHit(1, (0,)), SearchHit(1, (1,))]
+
+
+def test_phrase_requires_consecutive_tokens():
+    index = _index()
+    assert index.search("total nilai") == [SearchHit(0, (0,))]
+    assert index.search("nilai total") == [SearchHit(1, (0,))]
+    assert index.search("nilai akhir") == []
+
+
+def test_phrase_across_units_lists_each_unit_once():
+    # "1.234" menjadi dua token pada kotak yang sama
+    assert _index().search("1.234") == [SearchHit(0, (1,))]
+    assert _index().search("234 subtotal") == [SearchHit(0, (1, 2))]
+
+
+def test_prefix_lookup_uses_sorted_vocabulary():
+    index = _index()
+    assert {h.page for h in index.search("tot*")} == {0, 1}
+    assert index.search("sub*") == [SearchHit(0, (2,))]
+    assert index.search("zzz*") == []
+    # Token baru setelah kosakata dibangun tetap ditemukan
+    index.add_page(2, _rows("totalitas"))
+    assert SearchHit(2, (0,)) in index.search("totali*")
+
+
+def test_pages_added_out_of_order_are_sorted_by_page():
+    index = SearchIndex()
+    index.add_page(5, _rows("kata"))
+    index.add_page(2, _rows("kata"))
+    assert [h.page for h in index.search("kata")] == [2, 5]
+    assert index.page_count == 2 and index.has_page(5)
+
+
+def test_add_page_twice_does_not_duplicate_hits():
+    index = _index()
+    index.add_page(0, _rows("Total nilai"))
+    assert len(index.search("subtotal")) == 1
+
+
+def test_limit_and_empty_query():
+    index = _index()
+    assert len(index.search("total", limit=2)) == 2
+    assert index.search("  ") == []
+    assert index.search('"..."') == []
@@ -0,0 +1,47 @@
+"""Pengujian indeks grid spasial dan batas LRU penyimpannya."""
+
+from controller.spatial_mgr import GridIndex, SpatialIndexManager
+from model.box_table import BoxTable
+
+
+def _boxes():
+    words = [
+        (10, 10, 50, 20, "satu", 0, 0, 0),
+        (60, 10, 100, 20, "dua", 0, 0, 1),
+        (10, 200, 50, 210, "tiga", 0, 1, 0),
+    ]
+    return BoxTable.from_words(words)
+
+
+def test_query_point_and_rect():
+    index = GridIndex(_boxes())
+    assert index.query_point(30, 15) == [0]
+    assert index.query_point(55, 15) == []
+    assert index.query_rect(0, 0, 120, 30) == [0, 1]
+    assert index.query_rect(120, 300, 0, 0) == [0, 1, 2]  # Sudut terbalik
+
+
+def test_index_reused_until_source_changes():
+    mgr = SpatialIndexManager()
+    boxes = _boxes()
+    first = mgr.index_for(("text_layer", 0), boxes)
+    assert mgr.index_for(("text_layer", 0), boxes) is first
+    assert mgr.index_for(("text_layer", 0), _boxes()) is not first
+
+
+def test_indexes_bounded_by_budget():
+    mgr = SpatialIndexManager(budget=2)
+    boxes = _boxes()
+    first = mgr.index_for(("csv_layer", 0), boxes)
+    mgr.index_for(("csv_layer", 1), boxes)
+    mgr.index_for(("csv_layer", 2), boxes)
+    assert mgr._indexes.stats()["entries"] == 2
+    # Halaman 0 sudah dibuang sehingga indeksnya dibangun ulang
+    assert mgr.index_for(("csv_layer", 0), boxes) is not first
+
+
+def test_clear_drops_all_indexes():
+    mgr = SpatialIndexManager()
+    mgr.index_for(("csv_layer", 0), _boxes())
+    mgr.clear()
+    assert mgr._indexes.stats()["entries"] == 0
@@ -0,0 +1,62 @@
+"""Pengujian grid tile dan penempatan tile hasil render."""
+
+import numpy as np
+import pytest
+
+from controller import render_worker
+from controller.tile_mgr import TileManager
+
+
+def test_visible_tiles_covers_viewport_nearest_first():
+    mgr = TileManager(tile_size=100, margin=0)
+    tiles = mgr.visible_tiles((0, 0, 150, 150), 0, 0, 400, 400)
+    assert sorted(tiles) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert tiles[0] == (0, 0)  # Paling dekat dengan pusat (75, 75)
+
+
+def test_visible_tiles_outside_page_is_empty():
+    mgr = TileManager(tile_size=100, margin=0)
+    assert mgr.visible_tiles((500, 500, 100, 100), 0, 0, 400, 400) == []
+
+
+def test_should_tile_threshold():
+    mgr = TileManager(min_pixels=100)
+    assert mgr.should_tile(11, 10)
+    assert not mgr.should_tile(10, 10)
+
+
+def test_clip_for_scales_to_page_points():
+    mgr = TileManager(tile_size=512)
+    assert tuple(mgr.clip_for((1, 2), 2.0)) == (256, 512, 512, 768)
+
+
+@pytest.mark.parametrize("tile", [(0, 0), (1, 0), (0, 1), (1, 1)])
+def test_tile_origin_grid(tile):
+    mgr = TileManager(tile_size=512)
+    assert mgr.tile_origin(tile) == (tile[0] * 512, tile[1] * 512)
+
+
+def test_tiles_2x2_assemble_into_full_page(sample_pdf):
+    """Tile yang ditempatkan di tile_origin harus menyusun halaman utuh."""
+    render_worker.init_worker()
+    mgr = TileManager(tile_size=256)
+    zoom = 1.5  # 450 x 450 piksel: grid 2x2 dengan tile tepi terpotong
+    full, _, _ = render_worker.run_task("pixmap", sample_pdf, 0, zoom)
+    expected = np.frombuffer(full.samples, np.uint8).reshape(
+        full.height, full.width, -1
+    )
+
+    canvas = np.zeros_like(expected)
+    tiles = [(c, r) for r in range(2) for c in range(2)]
+    for tile in tiles:
+        data, _, _ = render_worker.run_task(
+            "tile", sample_pdf, 0, zoom, tuple(mgr.clip_for(tile, zoom))
+        )
+        x, y = mgr.tile_origin(tile)
+        assert (data.x, data.y) == (x, y)
+        block = np.frombuffer(data.samples, np.uint8).reshape(
+            data.height, data.width, -1
+        )
+        canvas[y : y + data.height, x : x + data.width] = block
+
+    assert np.array_equal(canvas, expected)
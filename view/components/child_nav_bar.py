@@ -29,7 +29,7 @@ class ChildNavBar(QWidget):
             QPushButton:hover {
                 background-color: #e9ecef;
             }
-            QPushButton:pressed {
+            QPushButton:pressed, QPushButton:checked {
                 background-color: #dee2e6;
             }
         """
@@ -91,11 +91,45 @@ class ChildNavBar(QWidget):
         self.btn_next.setFixedWidth(28)
         self.btn_next.clicked.connect(lambda: self.child.controller.change_page(1))
 
+        # --- BAGIAN MODE TAMPILAN ---
+        self.btn_continuous = QPushButton("Kontinu")
+        self.btn_continuous.setCheckable(True)
+        self.btn_continuous.setToolTip("Mode scroll kontinu seluruh halaman")
+        self.btn_continuous.setStyleSheet("font-size: 10px; padding: 2px 6px;")
+        self.btn_continuous.toggled.connect(self.child.controller.set_continuous)
+
+        # --- BAGIAN PENCARIAN ---
+        self.search_ent = QLineEdit()
+        self.search_ent.setFixedWidth(160)
+        self.search_ent.setPlaceholderText("Cari teks (awalan*)")
+        self.search_ent.setStyleSheet(self.pg_ent.styleSheet())
+        self.search_ent.returnPressed.connect(
+            lambda: self.child.controller.search(self.search_ent.text())
+        )
+
+        self.btn_hit_prev = QPushButton("▲")
+        self.btn_hit_prev.setFixedWidth(24)
+        self.btn_hit_prev.setToolTip("Hasil sebelumnya")
+        self.btn_hit_prev.clicked.connect(lambda: self.child.controller.step_search(-1))
+
+        self.lbl_hits = QLabel("0/0")
+        self.lbl_hits.setStyleSheet("font-size: 10px; color: #6c757d; border: none;")
+
+        self.btn_hit_next = QPushButton("▼")
+        self.btn_hit_next.setFixedWidth(24)
+        self.btn_hit_next.setToolTip("Hasil berikutnya")
+        self.btn_hit_next.clicked.connect(lambda: self.child.controller.step_search(1))
+
         # Tata Letak
         layout.addWidget(self.btn_zoom_out)
         layout.addWidget(self.lbl_zoom)
         layout.addWidget(self.btn_zoom_in)
+        layout.addWidget(self.btn_continuous)
         layout.addStretch()
+        layout.addWidget(self.search_ent)
+        layout.addWidget(self.btn_hit_prev)
+        layout.addWidget(self.lbl_hits)
+        layout.addWidget(self.btn_hit_next)
         layout.addWidget(self.btn_prev)
         layout.addWidget(self.pg_ent)
         layout.addWidget(self.lbl_total)
@@ -108,6 +142,9 @@ class ChildNavBar(QWidget):
         except Exception:
             pass
 
+    def update_search_info(self, current, total):
+        self.lbl_hits.setText(f"{current}/{total}")
+
     def update_info(self, current, total, zoom):
         self.pg_ent.setText(str(current))
         self.lbl_total.setText(f"/ {total}")
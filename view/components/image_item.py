@@ -0,0 +1,54 @@
+"""Modul item scene yang menggambar pixmap PyMuPDF tanpa salinan piksel."""
+
+from typing import override
+
+from PyQt6 import sip
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+
+class PixmapImageItem(QGraphicsItem):
+    """Item scene yang menggambar buffer piksel pixmap secara langsung.
+
+    QImage dibuat tanpa menyalin piksel: di atas ``pix.samples`` (byte
+    ``PixmapData`` yang diterima dari proses render) atau di atas
+    ``sip.voidptr(pix.samples_ptr)`` untuk fitz.Pixmap. QImage tersebut
+    hanya valid selama objek sumbernya masih hidup dan tidak diubah. Karena
+    itu item menyimpan referensi pixmap (``_pix``) bersama QImage-nya, dan
+    QImage tidak boleh diserahkan keluar item. Tidak ada konversi ke QPixmap; saat paint hanya
+    area yang terekspos yang digambar.
+    """
+
+    def __init__(self, pix, parent=None):
+        """Membuat item untuk pixmap awal ``pix``."""
+        super().__init__(parent)
+        self.smooth = False
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self.set_pix(pix)
+
+    def set_pix(self, pix):
+        """Mengganti buffer yang digambar tanpa membuat item baru."""
+        self.prepareGeometryChange()
+        self._pix = pix  # Wajib: QImage di bawah menunjuk langsung ke buffer ini
+        fmt = (
+            QImage.Format.Format_RGBA8888_Premultiplied  # Alpha MuPDF premultiplied
+            if pix.alpha
+            else QImage.Format.Format_RGB888
+        )
+        ptr = getattr(pix, "samples_ptr", None)
+        buffer = pix.samples if ptr is None else sip.voidptr(ptr)
+        self._image = QImage(buffer, pix.width, pix.height, pix.stride, fmt)
+        self._rect = QRectF(0, 0, pix.width, pix.height)
+        self.update()
+
+    @override
+    def boundingRect(self):
+        return self._rect
+
+    @override
+    def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
+        if self.smooth:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        exposed = option.exposedRect.intersected(self._rect)
+        painter.drawImage(exposed, self._image, exposed)
@@ -0,0 +1,184 @@
+"""Modul item scene untuk layer overlay kotak (teks, CSV, hasil pencarian).
+
+Setiap layer per halaman digambar oleh satu ``OverlayLayerItem`` yang
+memegang seluruh kotaknya sebagai array NumPy dalam poin PDF.
+"""
+
+from typing import override
+
+import numpy as np
+from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtGui import QBrush, QColor, QPen
+from PyQt6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+# Status kotak overlay, juga menentukan urutan gambar (yang terakhir di atas)
+NORMAL = 0
+GROUPED = 1
+SELECTED = 2
+
+
+def _cosmetic_pen(color, width):
+    """Pena dengan tebal tetap dalam piksel layar, tidak ikut zoom."""
+    pen = QPen(color, width)
+    pen.setCosmetic(True)
+    return pen
+
+
+class OverlayLayerGroup(QGraphicsItem):
+    """Wadah tanpa isi untuk seluruh item satu layer overlay.
+
+    Menyembunyikan wadah menyembunyikan semua anaknya sekaligus, sehingga
+    tombol visibilitas layer cukup membalik satu flag tanpa membangun ulang.
+    """
+
+    def __init__(self, tag, parent=None):
+        """Membuat wadah layer tanpa isi untuk tag tertentu."""
+        super().__init__(parent)
+        self.tag = tag
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+
+    @override
+    def boundingRect(self):
+        return QRectF()
+
+    @override
+    def paint(self, painter, option, widget=None):
+        pass
+
+
+class OverlayLayerItem(QGraphicsItem):
+    """Satu item scene yang menggambar seluruh kotak satu layer overlay.
+
+    Kotak berasal dari BoxTable dan disimpan dalam poin PDF bersama array
+    status paralel (normal/grup/terpilih); zoom dan offset halaman hanya
+    berupa transformasi item. Seluruh kotak digambar dalam satu panggilan
+    ``paint()``; pemotongan terhadap area terekspos juga dilakukan secara
+    vektor sehingga QRectF hanya dibuat untuk kotak yang terlihat.
+    """
+
+    def __init__(self, parent=None):
+        """Membuat item kosong; kotak diisi lewat :meth:`set_boxes`."""
+        super().__init__(parent)
+        self.tag = None
+        self.page = None
+        self.table = None
+        self._geom = None  # (ox, oy, zoom) terakhir untuk deteksi perubahan
+        self.rects = np.zeros((0, 4))
+        self.states = np.zeros(0, dtype=np.uint8)
+        self._marked = {}  # {indeks kotak: status} untuk kotak non-normal
+        self._bounds = QRectF()
+        self._pens = {}
+        self._brush = QBrush()
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self.setZValue(1)
+
+    def set_boxes(self, table, tag, page, color):
+        """Mengisi ulang kotak layer dari BoxTable kata atau baris CSV."""
+        self.prepareGeometryChange()
+        self.tag, self.page, self.table = tag, page, table
+        self.rects = table.coords.astype(np.float64)  # Poin PDF, tanpa zoom
+        self.states = np.zeros(len(table), dtype=np.uint8)
+        self._marked = {}
+        self._geom = None
+
+        self._brush = QBrush(QColor(color.red(), color.green(), color.blue(), 60))
+        self._pens = {
+            # Tingkat detail "page" hanya berupa rona tanpa garis tepi
+            NORMAL: QPen(Qt.PenStyle.NoPen)
+            if table.level == "page"
+            else _cosmetic_pen(color, 1),
+            GROUPED: _cosmetic_pen(QColor("orange"), 2),
+            SELECTED: _cosmetic_pen(QColor("red"), 3),
+        }
+        self.update()
+
+    def set_geometry(self, ox, oy, zoom):
+        """Menempatkan layer pada halaman; kotak tidak dihitung ulang.
+
+        Zoom dan offset hanya mengubah transformasi item, sedangkan kotak
+        tetap dalam poin PDF dan pena kosmetik menjaga tebal garis.
+        """
+        if self._geom == (ox, oy, zoom):
+            return
+        self.prepareGeometryChange()
+        self._geom = (ox, oy, zoom)
+        self.setPos(ox, oy)
+        self.setScale(zoom)
+
+        if len(self.rects):
+            x0, y0 = self.rects[:, :2].min(axis=0).tolist()
+            x1, y1 = self.rects[:, 2:].max(axis=0).tolist()
+            pad = self._pad()  # Ruang tambahan untuk tebal pena
+            self._bounds = QRectF(x0, y0, x1 - x0, y1 - y0).adjusted(
+                -pad, -pad, pad, pad
+            )
+        else:
+            self._bounds = QRectF()
+
+    def shows(self, table):
+        """Memeriksa apakah item sudah memuat tabel yang sama."""
+        return self.table is table
+
+    def _pad(self):
+        # Pena kosmetik terlebar (3 piksel layar) dinyatakan dalam poin PDF
+        return 2.0 / max(self.scale(), 1e-6)
+
+    def _rect(self, i):
+        x0, y0, x1, y1 = self.rects[i].tolist()
+        return QRectF(x0, y0, x1 - x0, y1 - y0)
+
+    def scene_rect_for_ids(self, ids):
+        """Menghitung kotak scene yang mencakup semua kotak dengan ID tertentu.
+
+        Mengembalikan None jika tidak ada kotak yang cocok.
+        """
+        indices = self.table.indices_for_ids(ids)
+        if not indices:
+            return None
+        return self.mapRectToScene(
+            self._rect(min(indices)).united(self._rect(max(indices)))
+        )
+
+    def set_states(self, selected_id, grouped_ids):
+        """Memperbarui status kotak secara diff; mengembalikan kotak terpilih.
+
+        Hanya kotak yang statusnya berubah (terpilih/grup lama dan baru)
+        yang ditulis ulang dan digambar ulang. Kotak terpilih dikembalikan
+        dalam koordinat scene.
+        """
+        marked = dict.fromkeys(self.table.indices_for_ids(grouped_ids), GROUPED)
+        selected = self.table.indices_for_ids([selected_id])
+        marked.update(dict.fromkeys(selected, SELECTED))
+
+        changed = [i for i in self._marked if i not in marked]
+        changed += [i for i, st in marked.items() if self._marked.get(i) != st]
+        pad = self._pad()
+        for i in changed:
+            self.states[i] = marked.get(i, NORMAL)
+            self.update(self._rect(i).adjusted(-pad, -pad, pad, pad))
+        self._marked = marked
+        return self.mapRectToScene(self._rect(min(selected))) if selected else None
+
+    @override
+    def boundingRect(self):
+        return self._bounds
+
+    @override
+    def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
+        e = option.exposedRect
+        r = self.rects
+        visible = (
+            (r[:, 2] >= e.left())
+            & (r[:, 0] <= e.right())
+            & (r[:, 3] >= e.top())
+            & (r[:, 1] <= e.bottom())
+        )
+
+        painter.setBrush(self._brush)
+        for state in (NORMAL, GROUPED, SELECTED):
+            boxes = r[visible & (self.states == state)].tolist()
+            if boxes:
+                painter.setPen(self._pens[state])
+                painter.drawRects(
+                    [QRectF(x0, y0, x1 - x0, y1 - y0) for x0, y0, x1, y1 in boxes]
+                )
@@ -133,6 +133,25 @@ class CSVModel(QAbstractTableModel):
         self._headers: list[str] = headers
         self._data: list[list[Any]] = data
         self.marked_ids: set[str] = set()
+        self._row_of_id: dict[str, int] = {}
+        self.modelReset.connect(self._rebuild_row_index)
+        self._rebuild_row_index()
+
+    def _rebuild_row_index(self) -> None:
+        """Menyusun ulang peta ID (kolom pertama) ke nomor baris."""
+        self._row_of_id = {str(row[0]): i for i, row in enumerate(self._data) if row}
+
+    def row_of(self, row_id: str) -> int | None:
+        """Mencari nomor baris untuk ID tertentu.
+
+        Args:
+            row_id (str): ID baris (kolom pertama).
+
+        Returns:
+            Optional[int]: Nomor baris (0-indexed), atau None jika tidak ada.
+
+        """
+        return self._row_of_id.get(str(row_id))
 
     def rowCount(self, parent: QModelIndex | None = None) -> int:
         """Mendapatkan jumlah baris dalam model data.
@@ -186,6 +205,9 @@ class CSVModel(QAbstractTableModel):
 
         """
         if index.isValid() and role == Qt.ItemDataRole.EditRole:
+            if index.column() == 0:
+                self._row_of_id.pop(str(self._data[index.row()][0]), None)
+                self._row_of_id[str(value)] = index.row()
             self._data[index.row()][index.column()] = value
             self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
 
@@ -205,12 +227,22 @@ class CSVModel(QAbstractTableModel):
             ids (Iterable[str]): Kumpulan ID baris (kolom pertama) yang akan ditandai.
 
         """
-        self.marked_ids = set(ids) if ids else set()
-        self.dataChanged.emit(
-            self.index(0, 0),
-            self.index(self.rowCount() - 1, self.columnCount() - 1),
-            [Qt.ItemDataRole.BackgroundRole],
+        new_ids: set[str] = set(ids) if ids else set()
+        changed: set[str] = self.marked_ids ^ new_ids
+        self.marked_ids = new_ids
+        if not changed:
+            return
+
+        last_col: int = self.columnCount() - 1
+        rows: list[int] = sorted(
+            row for row in map(self.row_of, changed) if row is not None
         )
+        for row in rows:
+            self.dataChanged.emit(
+                self.index(row, 0),
+                self.index(row, last_col),
+                [Qt.ItemDataRole.BackgroundRole],
+            )
 
     def headerData(
         self,
@@ -344,21 +376,15 @@ class PyQt6CSVTableView(QWidget):
 
         """
         self.model.set_marked_ids(group_ids)
-        if target_sid:
-            try:
-                row_idx = int(target_sid) - 1
-                if 0 <= row_idx < self.model.rowCount():
-                    curr = self.table_view.currentIndex()
-                    if curr.isValid() and curr.row() == row_idx:
-                        return
-
-                    idx = self.model.index(
-                        row_idx, curr.column() if curr.isValid() else 0
-                    )
-                    self.table_view.selectionModel().blockSignals(True)
-                    self.table_view.setCurrentIndex(idx)
-                    self.table_view.selectRow(row_idx)
-                    self.table_view.scrollTo(idx)
-                    self.table_view.selectionModel().blockSignals(False)
-            except ValueError:
-                pass
+        row_idx = self.model.row_of(target_sid) if target_sid else None
+        if row_idx is not None:
+            curr = self.table_view.currentIndex()
+            if curr.isValid() and curr.row() == row_idx:
+                return
+
+            idx = self.model.index(row_idx, curr.column() if curr.isValid() else 0)
+            self.table_view.selectionModel().blockSignals(True)
+            self.table_view.setCurrentIndex(idx)
+            self.table_view.selectRow(row_idx)
+            self.table_view.scrollTo(idx)
+            self.table_view.selectionModel().blockSignals(False)
@@ -10,7 +10,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QAction, QResizeEvent
 from PyQt6.QtWidgets import (
     QApplication,
@@ -25,6 +25,12 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from controller.export_mgr import ExportJob
+from controller.export_writers import (
+    file_filters,
+    format_for_filter,
+    format_for_path,
+)
 from interface import PDFViewInterface
 from model.document_model import PDFDocumentModel
 
@@ -35,6 +41,12 @@ from .mdi_child import PDFMdiChild
 from .status_bar import PyQt6StatusBar
 from .toolbar import PyQt6Toolbar
 
+# Interval pembaruan progres job ekspor di status bar (ms)
+EXPORT_POLL_MS: int = 200
+
+# Lama pesan hasil/galat tampil di status bar (ms)
+STATUS_MESSAGE_MS: int = 10000
+
 
 class PyQt6PDFView(QMainWindow, PDFViewInterface):
     """Komponen View utama aplikasi berbasis PyQt6.
@@ -53,6 +65,9 @@ class PyQt6PDFView(QMainWindow, PDFViewInterface):
         csv_dock (QDockWidget): Panel dock untuk inspeksi data CSV.
         dock_coords (QDockWidget): Panel dock untuk koordinat real-time.
         layer_dock (QDockWidget): Panel dock untuk manajemen layer.
+        _export_jobs (List[Tuple[ExportJob, Callable, Any]]): Job ekspor yang
+            sedang dipantau beserta callback selesainya.
+        _export_timer (QTimer): Timer polling progres job ekspor.
 
     """
 
@@ -73,6 +88,11 @@ class PyQt6PDFView(QMainWindow, PDFViewInterface):
         self.controller_factory: Callable = controller_factory
         self.csv_table_widget: PyQt6CSVTableView | None = None
 
+        self._export_jobs: list[tuple[ExportJob, Callable, Any]] = []
+        self._export_timer: QTimer = QTimer(self)
+        self._export_timer.setInterval(EXPORT_POLL_MS)
+        self._export_timer.timeout.connect(self._poll_export_jobs)
+
         self._setup_ui()
         self._setup_dock_widget()
 
@@ -95,6 +115,8 @@ class PyQt6PDFView(QMainWindow, PDFViewInterface):
 
         self.status_bar: PyQt6StatusBar = PyQt6StatusBar(self)
         self.setStatusBar(self.status_bar)
+        self.status_bar.btn_export_pause.clicked.connect(self._on_export_pause)
+        self.status_bar.btn_export_cancel.clicked.connect(self._on_export_cancel)
 
     def _setup_menus(self) -> None:
         """Mengonfigurasi sistem menu bar."""
@@ -157,6 +179,7 @@ class PyQt6PDFView(QMainWindow, PDFViewInterface):
         """
         if window and isinstance(window, PDFMdiChild):
             window.controller._refresh(full_refresh=False)
+        self._poll_export_jobs()
 
     def _setup_dock_widget(self) -> None:
         """Menginisialisasi seluruh panel dock (panel samping)."""
@@ -212,7 +235,36 @@ class PyQt6PDFView(QMainWindow, PDFViewInterface):
 
         """
         self.status_bar.set_progress(v)
-        self.app.processEvents()
+
+    def track_export_job(
+        self,
+        job: ExportJob,
+        on_finished: Callable[[ExportJob], None],
+        owner: Any | None = None,
+    ) -> None:
+        """Memantau job ekspor latar belakang dan menampilkan progresnya.
+
+        Args:
+            job (ExportJob): Job yang sedang berjalan.
+            on_finished (Callable[[ExportJob], None]): Dipanggil di thread
+                GUI setelah job selesai, dibatalkan, atau gagal.
+            owner (Optional[Any]): Jendela dokumen pemilik job; progres dan
+                tombol jeda/batal status bar hanya berlaku untuk job milik
+                jendela aktif.
+
+        """
+        self._export_jobs.append((job, on_finished, owner))
+        self._export_timer.start()
+        self._poll_export_jobs()
+
+    def show_status_message(self, text: str) -> None:
+        """Menampilkan pesan singkat di status bar.
+
+        Args:
+            text (str): Pesan yang ditampilkan.
+
+        """
+        self.status_bar.showMessage(text, STATUS_MESSAGE_MS)
 
     def set_application_title(self, f: str) -> None:
         """Mengatur judul jendela aplikasi berdasarkan file yang dibuka.
@@ -252,7 +304,11 @@ class PyQt6PDFView(QMainWindow, PDFViewInterface):
             child.controller.open_csv_table()
 
     def _on_export_csv(self) -> None:
-        """Menangani dialog ekspor rentang halaman PDF ke CSV."""
+        """Menangani dialog ekspor rentang halaman PDF ke CSV atau format lain.
+
+        Ekstensi file yang diketik pengguna menentukan format; filter dialog
+        dipakai bila ekstensinya tidak dikenali.
+        """
         print("[DEBUG] Triggered Export CSV Dialog")
         child = self._get_active_child()
         if not child or not child.model.doc:
@@ -266,11 +322,46 @@ class PyQt6PDFView(QMainWindow, PDFViewInterface):
             f"1-{total}",
         )
         if ok:
-            path, _ = QFileDialog.getSaveFileName(
-                self, "Export CSV", "", "CSV Files (*.csv)"
+            path, selected = QFileDialog.getSaveFileName(
+                self, "Export", "", file_filters()
             )
             if path:
-                child.controller.start_export(path, range_str)
+                fmt: str | None = format_for_path(path) or format_for_filter(selected)
+                child.controller.start_export(path, range_str, fmt)
+
+    def _active_export_jobs(self) -> list[ExportJob]:
+        """Mengambil job ekspor yang dimiliki jendela dokumen aktif."""
+        active: PDFMdiChild | None = self._get_active_child()
+        return [job for job, _, owner in self._export_jobs if owner is active]
+
+    def _poll_export_jobs(self) -> None:
+        """Memperbarui status bar dari penghitung job dan menutup job selesai."""
+        running: list[tuple[ExportJob, Callable, Any]] = []
+        for job, on_finished, owner in self._export_jobs:
+            if job.finished:
+                on_finished(job)
+            else:
+                running.append((job, on_finished, owner))
+        self._export_jobs = running
+        self.status_bar.set_export_jobs(self._active_export_jobs())
+        if not running:
+            self._export_timer.stop()
+
+    def _on_export_pause(self) -> None:
+        """Menjeda job ekspor jendela aktif, atau melanjutkan yang dijeda."""
+        jobs: list[ExportJob] = self._active_export_jobs()
+        if any(job.paused for job in jobs):
+            for job in jobs:
+                job.resume()
+        else:
+            for job in jobs:
+                job.pause()
+        self._poll_export_jobs()
+
+    def _on_export_cancel(self) -> None:
+        """Membatalkan job ekspor milik jendela dokumen aktif."""
+        for job in self._active_export_jobs():
+            job.cancel()
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Menangani perubahan ukuran jendela aplikasi.
@@ -1,6 +1,5 @@
 # File: View/mdi_child.py
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QMdiSubWindow, QVBoxLayout, QWidget
 
 from controller.main_controller import PDFController
@@ -44,6 +43,11 @@ class PDFMdiChild(QMdiSubWindow):
             f"[DEBUG] UI setup complete for PDFMdiChild with Model ID: {id(self.model)}"
         )
 
+    def closeEvent(self, event):
+        """Menghentikan pekerja render latar belakang sebelum jendela ditutup."""
+        self.controller.shutdown()
+        super().closeEvent(event)
+
     @property
     def toolbar(self):
         """Akses ke toolbar utama aplikasi."""
@@ -68,28 +72,86 @@ class PDFMdiChild(QMdiSubWindow):
             f"[DEBUG] Updated progress to {v}% from MdiChild with Model ID: {id(self.model)}"
         )
 
+    def track_export_job(self, job, on_finished):
+        """Mendaftarkan job ekspor ke pemantau progres jendela utama."""
+        self.parent_view.track_export_job(job, on_finished, owner=self)
+
+    def show_status_message(self, text):
+        """Menampilkan pesan singkat di status bar jendela utama."""
+        self.parent_view.show_status_message(text)
+
     # --- IMPLEMENTASI INTERFACE UNTUK CONTROLLER ---
 
     def get_viewport_size(self):
         return self.viewport.width(), self.viewport.height()
 
-    def display_page(self, pix, ox, oy, region):
-        qimg = QImage(
-            pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888
-        )
-        self.viewport.set_background_pdf(QPixmap.fromImage(qimg), ox, oy, region)
+    def display_page(self, pix, ox, oy, region, scale=1.0):
+        """Menampilkan pixmap halaman tunggal sebagai latar scene."""
+        self.viewport.set_background_pdf(pix, ox, oy, region, scale)
+
+    def prepare_tiled_page(self, region):
+        """Menyiapkan scene kosong untuk halaman yang dirender per tile."""
+        self.viewport.set_tiled_background(region)
+
+    def display_tile(self, tile, pix, x, y):
+        """Menempatkan satu tile halaman pada posisi scene."""
+        self.viewport.add_tile(tile, pix, x, y)
+
+    def prune_tiles(self, keep):
+        """Membuang tile yang tidak lagi dekat viewport."""
+        self.viewport.prune_tiles(keep)
+
+    def prepare_continuous_scene(self, slots, region):
+        """Menyiapkan scene mode kontinu berisi slot seluruh halaman."""
+        self.viewport.set_continuous_scene(slots, region)
+
+    def display_page_item(self, page, pix, x, y):
+        """Menempatkan pixmap satu halaman pada slotnya di mode kontinu."""
+        self.viewport.add_page_item(page, pix, x, y)
+
+    def release_pages(self, keep):
+        """Melepas pixmap dan overlay halaman yang jauh dari viewport."""
+        self.viewport.release_pages(keep)
+
+    def scroll_to(self, y):
+        """Menggulir viewport ke posisi vertikal scene."""
+        self.viewport.scroll_to(y)
+
+    def get_visible_rect(self):
+        """Mengambil area scene yang sedang terlihat (x, y, w, h)."""
+        return self.viewport.visible_scene_rect()
+
+    def preview_zoom(self, scale):
+        """Menskalakan scene sementara selagi render zoom baru berjalan."""
+        self.viewport.preview_zoom(scale)
 
     def draw_rulers(self, dw, dh, ox, oy, z):
         self.viewport.update_rulers(dw, dh, ox, oy, z)
 
-    def draw_text_layer(self, w, ox, oy, z):
-        self.viewport.render_overlay_layer(w, ox, oy, z, "text_layer")
+    def draw_text_layer(self, w, ox, oy, z, page=None):
+        self.viewport.render_overlay_layer(w, ox, oy, z, "text_layer", page)
+
+    def draw_csv_layer(self, w, ox, oy, z, page=None):
+        self.viewport.render_overlay_layer(w, ox, oy, z, "csv_layer", page)
+
+    def draw_search_layer(self, w, ox, oy, z, page=None):
+        """Menggambar kotak hasil pencarian pada layer pencarian."""
+        self.viewport.render_overlay_layer(w, ox, oy, z, "search_layer", page)
+
+    def focus_search_hit(self, hit_id, page=None, center=True):
+        """Menyorot hasil pencarian aktif dan memusatkannya."""
+        self.viewport.focus_search_hit(hit_id, page, center)
+
+    def update_search_info(self, current, total):
+        """Memperbarui posisi hasil pencarian di bilah navigasi."""
+        self.nav_bar.update_search_info(current, total)
 
-    def draw_csv_layer(self, w, ox, oy, z):
-        self.viewport.render_overlay_layer(w, ox, oy, z, "csv_layer")
+    def clear_overlay_layer(self, tag, page=None):
+        self.viewport.clear_overlay_layer(tag, page)
 
-    def clear_overlay_layer(self, tag):
-        self.viewport.clear_overlay_layer(tag)
+    def set_layer_visible(self, tag, visible):
+        """Menampilkan atau menyembunyikan satu layer overlay."""
+        self.viewport.set_layer_visible(tag, visible)
 
     def update_ui_info(self, p, t, z, s, w, h, c):
         """Pembaruan UI dokumen yang dipicu oleh Controller."""
@@ -107,12 +169,11 @@ class PDFMdiChild(QMdiSubWindow):
             f"[DEBUG] UI info updated: Page {p}/{t}, Zoom {z}, Sandwich {s}, CSV {c} from MdiChild with Model ID: {id(self.model)}"
         )
 
-    def update_highlight_only(self, sid):
+    def update_highlight_only(self, sid, grouped_ids):
         """Sinkronisasi highlight antara PDF dan Tabel CSV Global."""
-        self.viewport.apply_highlight_to_items(sid)
+        self.viewport.apply_highlight_to_items(sid, grouped_ids)
         if self.parent_view.mdi_area.activeSubWindow() == self:
             if self.parent_view.csv_table_widget:
-                grouped_ids = self.controller._get_grouped_ids()
                 self.parent_view.csv_table_widget.select_row_and_mark_group(
                     sid, grouped_ids
                 )
@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QLabel, QProgressBar, QStatusBar
+from PyQt6.QtWidgets import QLabel, QProgressBar, QStatusBar, QToolButton
 
 
 class PyQt6StatusBar(QStatusBar):
@@ -26,8 +26,28 @@ class PyQt6StatusBar(QStatusBar):
         self.progress.setVisible(False)
         self.addPermanentWidget(self.progress)
 
+        # Ringkasan job ekspor latar belakang beserta tombol jeda/batal
+        self.lbl_export = QLabel(self)
+        self.lbl_export.setVisible(False)
+        self.addPermanentWidget(self.lbl_export)
+
+        self.btn_export_pause = QToolButton(self)
+        self.btn_export_pause.setText("⏸")
+        self.btn_export_pause.setToolTip("Jeda/lanjutkan ekspor")
+        self.btn_export_pause.setVisible(False)
+        self.addPermanentWidget(self.btn_export_pause)
+
+        self.btn_export_cancel = QToolButton(self)
+        self.btn_export_cancel.setText("✕")
+        self.btn_export_cancel.setToolTip("Batalkan ekspor")
+        self.btn_export_cancel.setVisible(False)
+        self.addPermanentWidget(self.btn_export_cancel)
+
     def update_status(self, zoom, is_sandwich, width, height):
-        status_txt = "Sandwich" if is_sandwich else "Image Only"
+        if is_sandwich is None:
+            status_txt = "Memindai..."  # Hasil pindai halaman belum tiba
+        else:
+            status_txt = "Sandwich" if is_sandwich else "Image Only"
         self.lbl_status.setText(f"Status: {status_txt}")
         self.lbl_dims.setText(f"Dimensi: {int(width)}x{int(height)} pt")
         self.lbl_zoom.setText(f"Zoom: {int(zoom*100)}%")
@@ -39,3 +59,34 @@ class PyQt6StatusBar(QStatusBar):
             self.progress.setValue(int(value))
         else:
             self.progress.setVisible(False)
+
+    def set_export_jobs(self, jobs):
+        """Menampilkan gabungan progres job ekspor yang sedang berjalan."""
+        active = bool(jobs)
+        for w in (self.lbl_export, self.btn_export_pause, self.btn_export_cancel):
+            w.setVisible(active)
+        if not active:
+            self.set_progress(0)
+            return
+
+        total = sum(j.total_pages for j in jobs)
+        done = sum(j.pages_done for j in jobs)
+        rows = sum(j.rows_written for j in jobs)
+        rate = sum(j.pages_per_sec for j in jobs)
+        etas = [j.eta for j in jobs]
+        paused = all(j.paused for j in jobs)
+
+        if paused:
+            state = "dijeda"
+        elif None in etas:
+            state = "ETA -"
+        else:
+            mins, secs = divmod(int(max(etas)), 60)
+            state = f"ETA {mins}:{secs:02d}"
+        self.lbl_export.setText(
+            f"Ekspor ({len(jobs)}): {done}/{total} hlm · {rows} baris · "
+            f"{rate:.1f} hlm/s · {state}"
+        )
+        self.btn_export_pause.setText("▶" if any(j.paused for j in jobs) else "⏸")
+        self.progress.setVisible(True)
+        self.progress.setValue(int(done / total * 100) if total else 0)
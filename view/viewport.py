@@ -1,17 +1,28 @@
+import bisect
 from typing import override
 
-from PyQt6.QtCore import QRectF, Qt
-from PyQt6.QtGui import QBrush, QColor, QPainter, QPen
+from PyQt6.QtCore import QPointF, QRect, QRectF, QSize, Qt, QTimer
+from PyQt6.QtGui import QBrush, QColor, QCursor, QPainter, QPen, QTransform
 from PyQt6.QtWidgets import (
     QFrame,
-    QGraphicsRectItem,
     QGraphicsScene,
     QGraphicsView,
+    QRubberBand,
+    QToolTip,
     QVBoxLayout,
 )
 
+from .components.image_item import PixmapImageItem
+from .components.overlay_item import OverlayLayerGroup, OverlayLayerItem
 from .components.ruler_system import RulerWrapper
 
+# Warna dasar kotak setiap layer overlay
+LAYER_COLORS = {
+    "text_layer": "#0078d7",
+    "csv_layer": "#28a745",
+    "search_layer": "#ffc107",
+}
+
 
 class ClickableGraphicsView(QGraphicsView):
     def __init__(self, scene, viewport_parent):
@@ -25,34 +36,66 @@ class ClickableGraphicsView(QGraphicsView):
         self.setStyleSheet("background-color: #323639; border: none;")
         self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
 
+        # Seleksi rubber-band (Shift + seret)
+        self._band = QRubberBand(QRubberBand.Shape.Rectangle, self.viewport())
+        self._band_origin = None
+
+    @override
+    def drawBackground(self, painter, rect):
+        """Menggambar kertas kosong hanya untuk slot halaman yang terlihat.
+
+        Pada mode kontinu halaman yang belum dimuat tidak memiliki item scene
+        sama sekali; bingkainya cukup dilukis di sini.
+        """
+        super().drawBackground(painter, rect)
+        slots = self.viewport_parent.page_slots
+        if not slots:
+            return
+        tops = self.viewport_parent.slot_tops
+        first = max(0, bisect.bisect_right(tops, rect.top()) - 1)
+        painter.save()
+        painter.setPen(QPen(QColor("#9a9a9a"), 1))
+        painter.setBrush(QBrush(QColor("white")))
+        for x, y, w, h in slots[first:]:
+            if y > rect.bottom():
+                break
+            painter.drawRect(QRectF(x, y, w, h))
+        painter.restore()
+
     @override
     def mouseMoveEvent(self, event):
         """Menangkap koordinat scene saat mouse bergerak."""
         # 1. Konversi posisi mouse ke koordinat Scene
         scene_pos = self.mapToScene(event.pos())
 
-        # 2. Kirim data ke Main View (via Viewport Parent)
+        # 2. Kirim data ke Main View (via Viewport Parent), termasuk info hover
         self.viewport_parent.on_mouse_moved(scene_pos)
 
-        # 3. Cek apakah ada item (teks/csv) di bawah kursor
-        item = self.itemAt(event.pos())
-        if item and isinstance(item, QGraphicsRectItem):
-            # Jika item adalah overlay, ambil data koordinat aslinya
-            # (Pastikan item memiliki data koordinat PDF asli jika diperlukan)
-            pass
+        # 3. Perbarui area rubber-band jika sedang menyeret
+        if self._band_origin is not None:
+            self._band.setGeometry(QRect(self._band_origin, event.pos()).normalized())
 
         super().mouseMoveEvent(event)
 
     @override
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            item = self.itemAt(event.pos())
-            if item and isinstance(item, QGraphicsRectItem):
-                row_id = item.data(0)
-                tag = item.data(1)
-                if tag == "csv_layer" and row_id:
-                    self.viewport_parent.view.controller._on_overlay_click(row_id)
-        super().mouse_press_event(event)
+            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                self._band_origin = event.pos()
+                self._band.setGeometry(QRect(self._band_origin, QSize()))
+                self._band.show()
+            else:
+                self.viewport_parent.on_click(self.mapToScene(event.pos()))
+        super().mousePressEvent(event)
+
+    @override
+    def mouseReleaseEvent(self, event):
+        if self._band_origin is not None:
+            self._band.hide()
+            rect = QRect(self._band_origin, event.pos()).normalized()
+            self._band_origin = None
+            self.viewport_parent.on_band_selected(self.mapToScene(rect).boundingRect())
+        super().mouseReleaseEvent(event)
 
 
 class PyQt6Viewport(QFrame):
@@ -70,26 +113,89 @@ class PyQt6Viewport(QFrame):
         self.last_doc_h = 0  # Tambahkan ini
 
         self.container = RulerWrapper(self.graphics_view)
-        self.overlay_items = {}
+        self.bg_item = None  # Item latar halaman tunggal yang dipakai ulang
+        self._layer_groups = {}  # {tag: OverlayLayerGroup} wadah per layer
+        self._layer_items = {}  # {(tag, halaman): OverlayLayerItem}
+        self._overlay_pool = []  # Item overlay tersembunyi siap dipakai ulang
+        self._highlight = (None, set())  # (ID terpilih, ID satu kelompok)
+        self.tile_items = {}  # {(kolom, baris): PixmapImageItem}
+        self.page_items = {}  # {indeks halaman: PixmapImageItem} mode kontinu
+        self.page_slots = []  # Slot (x, y, w, h) setiap halaman mode kontinu
+        self.slot_tops = []
         self._setup_layout()
 
+        # Permintaan tile baru saat scroll (diredam agar tidak tiap piksel)
+        self._tile_timer = QTimer(self)
+        self._tile_timer.setSingleShot(True)
+        self._tile_timer.setInterval(30)
+        self._tile_timer.timeout.connect(self._on_tiles_needed)
+        self.graphics_view.horizontalScrollBar().valueChanged.connect(
+            lambda _: self._tile_timer.start()
+        )
+        self.graphics_view.verticalScrollBar().valueChanged.connect(
+            lambda _: self._tile_timer.start()
+        )
+
+    def _page_at(self, scene_pos):
+        """Halaman di bawah posisi scene: (indeks, ox, oy, lebar, tinggi PDF)."""
+        if self.page_slots:
+            # Mode kontinu: gunakan slot halaman di bawah kursor
+            idx = max(0, bisect.bisect_right(self.slot_tops, scene_pos.y()) - 1)
+            ox, oy, slot_w, slot_h = self.page_slots[idx]
+            return idx, ox, oy, slot_w / self.last_zoom, slot_h / self.last_zoom
+        page = self.view.controller.model.current_page
+        return page, self.last_ox, self.last_oy, self.last_doc_w, self.last_doc_h
+
+    def scene_to_pdf(self, scene_pos):
+        """Konversi posisi scene ke (halaman, x, top) PDF, None di luar halaman."""
+        if not self.view.controller.model.doc or self.last_zoom <= 0:
+            return None
+        page, ox, oy, doc_w, doc_h = self._page_at(scene_pos)
+        pdf_x = (scene_pos.x() - ox) / self.last_zoom
+        pdf_top = (scene_pos.y() - oy) / self.last_zoom
+
+        # Validasi: Hanya aktif jika di dalam area halaman (0 sampai lebar/tinggi)
+        if 0 <= pdf_x <= doc_w and 0 <= pdf_top <= doc_h:
+            return page, pdf_x, pdf_top
+        return None
+
     def on_mouse_moved(self, scene_pos):
         """Logika konversi dengan pengecekan batas halaman."""
-        # 1. Cek apakah ada dokumen aktif
-        if not self.view.controller.model.doc or self.last_zoom <= 0:
+        hit = self.scene_to_pdf(scene_pos)
+        if hit is None:
+            # Jika di luar halaman, kirim None untuk mengosongkan display
             self.view._update_coord_display(None, None)
+            QToolTip.hideText()
             return
+        page, pdf_x, pdf_top = hit
+        self.view._update_coord_display(pdf_x, pdf_top)
 
-        # 2. Hitung koordinat relatif terhadap PDF asli
-        pdf_x = (scene_pos.x() - self.last_ox) / self.last_zoom
-        pdf_top = (scene_pos.y() - self.last_oy) / self.last_zoom
-
-        # 3. Validasi: Hanya aktif jika di dalam area halaman (0 sampai lebar/tinggi)
-        if 0 <= pdf_x <= self.last_doc_w and 0 <= pdf_top <= self.last_doc_h:
-            self.view._update_coord_display(pdf_x, pdf_top)
+        # Info hover dari indeks spasial controller
+        info = self.view.controller.hover_info(page, pdf_x, pdf_top)
+        if info:
+            QToolTip.showText(QCursor.pos(), info, self.graphics_view)
         else:
-            # Jika di luar halaman, kirim None untuk mengosongkan display
-            self.view._update_coord_display(None, None)
+            QToolTip.hideText()
+
+    def on_click(self, scene_pos):
+        """Meneruskan klik pada halaman ke controller dalam koordinat PDF."""
+        hit = self.scene_to_pdf(scene_pos)
+        if hit is not None:
+            self.view.controller._on_overlay_point_click(*hit)
+
+    def on_band_selected(self, scene_rect):
+        """Meneruskan area rubber-band ke controller dalam koordinat PDF."""
+        if not self.view.controller.model.doc or self.last_zoom <= 0:
+            return
+        page, ox, oy, _, _ = self._page_at(scene_rect.topLeft())
+        z = self.last_zoom
+        self.view.controller._on_overlay_band_select(
+            page,
+            (scene_rect.left() - ox) / z,
+            (scene_rect.top() - oy) / z,
+            (scene_rect.right() - ox) / z,
+            (scene_rect.bottom() - oy) / z,
+        )
 
     def _setup_layout(self):
         layout = QVBoxLayout(self)
@@ -105,86 +211,200 @@ class PyQt6Viewport(QFrame):
         self.last_doc_h = doc_h  # Simpan tinggi dokumen asli
         self.container.set_params(doc_w, doc_h, ox, oy, zoom)
 
-    def set_background_pdf(self, pixmap, ox, oy, region):
-        self.scene.clear()
-        self.overlay_items.clear()
-        bg = self.scene.addPixmap(pixmap)
-        bg.setPos(ox, oy)
-        bg.setZValue(-1)
-        self.scene.setSceneRect(QRectF(region[0], region[1], region[2], region[3]))
+    def preview_zoom(self, scale):
+        """Pratinjau zoom instan lewat transformasi view tanpa render ulang.
+
+        Nilai ``last_*`` tetap menggambarkan scene hasil render sehingga
+        konversi koordinat mouse (mapToScene) tetap benar. Penggaris diberi
+        offset titik asal halaman yang sudah ditransformasi ke viewport.
+        """
+        self.graphics_view.setTransform(QTransform.fromScale(scale, scale))
+        origin = self.graphics_view.mapFromScene(QPointF(self.last_ox, self.last_oy))
+        h_val = self.graphics_view.horizontalScrollBar().value()
+        v_val = self.graphics_view.verticalScrollBar().value()
+        self.container.set_params(
+            self.last_doc_w,
+            self.last_doc_h,
+            origin.x() + h_val,
+            origin.y() + v_val,
+            self.last_zoom * scale,
+        )
 
-    def clear_overlay_layer(self, tag):
-        for item in [i for i in self.scene.items() if i.data(1) == tag]:
+    def _reset_scene(self):
+        """Melepas seluruh item halaman saat mode tampilan berganti."""
+        self.graphics_view.resetTransform()
+        if self.bg_item is not None:
+            self.scene.removeItem(self.bg_item)
+            self.bg_item = None
+        for item in [*self.tile_items.values(), *self.page_items.values()]:
             self.scene.removeItem(item)
+        self.tile_items.clear()
+        self.page_items.clear()
+        for key in list(self._layer_items):
+            self._release_overlays(key)
+        self.page_slots = []
+        self.slot_tops = []
+
+    def _add_image(self, pix, x, y):
+        """Menambahkan buffer pixmap ke scene tanpa menyalin piksel."""
+        item = PixmapImageItem(pix)
+        item.setPos(x, y)
+        item.setZValue(-1)
+        self.scene.addItem(item)
+        return item
+
+    def set_background_pdf(self, pix, ox, oy, region, scale=1.0):
+        # Item latar dan overlay dipertahankan; cukup ganti buffer dan posisi
+        if self.tile_items or self.page_slots:
+            self._reset_scene()
+        else:
+            self.graphics_view.resetTransform()
+        if self.bg_item is None:
+            self.bg_item = self._add_image(pix, ox, oy)
+        else:
+            self.bg_item.set_pix(pix)
+            self.bg_item.setPos(ox, oy)
+        # Placeholder resolusi rendah diperbesar ke ukuran halaman penuh
+        self.bg_item.smooth = scale != 1.0
+        self.bg_item.setScale(scale)
+        self.scene.setSceneRect(QRectF(region[0], region[1], region[2], region[3]))
+
+    def set_tiled_background(self, region):
+        """Menyiapkan scene kosong untuk halaman yang dirender per tile."""
+        self._reset_scene()
+        self.scene.setSceneRect(QRectF(region[0], region[1], region[2], region[3]))
+
+    def set_continuous_scene(self, slots, region):
+        """Menyiapkan scene mode kontinu berisi slot seluruh halaman."""
+        self._reset_scene()
+        self.page_slots = list(slots)
+        self.slot_tops = [slot[1] for slot in self.page_slots]
+        self.scene.setSceneRect(QRectF(region[0], region[1], region[2], region[3]))
+
+    def add_page_item(self, page, pix, x, y):
+        """Menempatkan pixmap satu halaman pada slotnya di mode kontinu."""
+        old = self.page_items.pop(page, None)
+        if old is not None:
+            self.scene.removeItem(old)
+        self.page_items[page] = self._add_image(pix, x, y)
+
+    def release_pages(self, keep):
+        """Membuang pixmap dan overlay halaman yang jauh dari viewport."""
+        for page in [p for p in self.page_items if p not in keep]:
+            self.scene.removeItem(self.page_items.pop(page))
+        for key in [k for k in self._layer_items if k[1] not in keep]:
+            self._release_overlays(key)
+
+    def scroll_to(self, y):
+        """Menggulir viewport secara vertikal ke posisi scene tertentu."""
+        self.graphics_view.verticalScrollBar().setValue(int(y))
+
+    def add_tile(self, tile, pix, x, y):
+        """Menempatkan satu tile sebagai item scene terpisah."""
+        old = self.tile_items.pop(tile, None)
+        if old is not None:
+            self.scene.removeItem(old)
+        self.tile_items[tile] = self._add_image(pix, x, y)
+
+    def prune_tiles(self, keep):
+        """Membuang tile yang sudah keluar dari area viewport (plus margin)."""
+        for tile in [t for t in self.tile_items if t not in keep]:
+            self.scene.removeItem(self.tile_items.pop(tile))
+
+    def visible_scene_rect(self):
+        """Area scene yang sedang terlihat di viewport (x, y, w, h)."""
+        view_rect = self.graphics_view.viewport().rect()
+        r = self.graphics_view.mapToScene(view_rect).boundingRect()
+        return r.x(), r.y(), r.width(), r.height()
+
+    def _on_tiles_needed(self):
+        if self.view.controller.model.doc:
+            self.view.controller._on_viewport_scrolled()
+
+    def _release_overlays(self, key):
+        """Menyembunyikan item layer overlay dan mengembalikannya ke pool."""
+        item = self._layer_items.pop(key, None)
+        if item is not None:
+            item.hide()
+            self._overlay_pool.append(item)
+
+    def _layer_group(self, tag):
+        """Mengambil wadah layer, membuatnya saat pertama kali dibutuhkan."""
+        group = self._layer_groups.get(tag)
+        if group is None:
+            group = OverlayLayerGroup(tag)
+            # Di atas pixmap halaman; hasil pencarian di atas layer lain
+            group.setZValue(2 if tag == "search_layer" else 1)
+            self.scene.addItem(group)
+            self._layer_groups[tag] = group
+        return group
+
+    def _acquire_overlay(self, tag):
+        """Mengambil item layer overlay dari pool, atau membuat baru."""
+        item = self._overlay_pool.pop() if self._overlay_pool else OverlayLayerItem()
+        item.setParentItem(self._layer_group(tag))
+        item.show()
+        return item
+
+    def set_layer_visible(self, tag, visible):
+        """Menampilkan/menyembunyikan satu layer tanpa menyentuh isinya."""
+        self._layer_group(tag).setVisible(visible)
+
+    def clear_overlay_layer(self, tag, page=None):
+        for key in [k for k in self._layer_items if k[0] == tag]:
+            if page is None or key[1] == page:
+                self._release_overlays(key)
+
+    def render_overlay_layer(self, words, ox, oy, zoom, tag, page=None):
+        item = self._layer_items.get((tag, page))
+        if item is None or not item.shows(words):
+            # Isi layer hanya dibangun ulang jika datanya berubah
+            self.clear_overlay_layer(tag, page)
+            if not words:
+                return
+            color = QColor(LAYER_COLORS.get(tag, "#28a745"))
+            item = self._acquire_overlay(tag)
+            item.set_boxes(words, tag, page, color)
+            self._layer_items[(tag, page)] = item
+        # Zoom dan offset cukup memperbarui transformasi item
+        item.set_geometry(ox, oy, zoom)
         if tag == "csv_layer":
-            self.overlay_items.clear()
+            item.set_states(*self._highlight)
 
-    def render_overlay_layer(self, words, ox, oy, zoom, tag):
-        self.clear_overlay_layer(tag)
-        color = QColor("#0078d7") if tag == "text_layer" else QColor("#28a745")
-        grouped_ids = (
-            self.view.controller._get_grouped_ids() if tag == "csv_layer" else set()
-        )
-        sel_id = str(self.view.controller.model.selected_row_id)
-
-        for w in words:
-            rect = QRectF(
-                w[0] * zoom + ox,
-                w[1] * zoom + oy,
-                (w[2] - w[0]) * zoom,
-                (w[3] - w[1]) * zoom,
-            )
-            item = QGraphicsRectItem(rect)
-            row_id = str(w[5]) if len(w) > 5 else None
-            item.setData(0, row_id)
-            item.setData(1, tag)
-
-            item.setBrush(QBrush(QColor(color.red(), color.green(), color.blue(), 60)))
-            is_active = row_id == sel_id
-            is_grouped = row_id in grouped_ids
-
-            pen_color = (
-                QColor("red")
-                if is_active
-                else (QColor("orange") if is_grouped else color)
-            )
-            item.setPen(QPen(pen_color, 2 if is_active or is_grouped else 1))
-            item.setZValue(1)
-            self.scene.addItem(item)
-
-            if tag == "csv_layer" and row_id:
-                self.overlay_items[row_id] = item
-
-    def apply_highlight_to_items(self, selected_id):
+    def focus_search_hit(self, hit_id, page=None, center=True):
+        """Menyorot kotak hasil pencarian aktif dan memusatkannya secara vertikal."""
+        item = self._layer_items.get(("search_layer", page))
+        if item is None:
+            return
+        item.set_states(None, {str(hit_id)})
+        if not center:
+            return
+        target = item.scene_rect_for_ids([hit_id])
+        if target is not None:
+            view_center = self.graphics_view.viewport().rect().center()
+            x = self.graphics_view.mapToScene(view_center).x()
+            self.graphics_view.centerOn(x, target.center().y())
+
+    def apply_highlight_to_items(self, selected_id, grouped_ids):
         """Pemusatan Vertikal Eksklusif: Menjaga kursor horizontal tetap di tempatnya."""
-        grouped_ids = self.view.controller._get_grouped_ids()
         sel_id_str = str(selected_id)
+        # Disimpan agar layer CSV yang dibangun kemudian ikut tersorot
+        self._highlight = (sel_id_str, set(grouped_ids))
 
-        target_item = None
-        for row_id, item in self.overlay_items.items():
-            rid = str(row_id)
-            is_active = rid == sel_id_str
-            is_grouped = rid in grouped_ids
-
-            if is_active:
-                item.setPen(QPen(QColor("red"), 3))
-                item.setZValue(10)
-                target_item = item  # Referensi untuk centering
-            elif is_grouped:
-                item.setPen(QPen(QColor("orange"), 2))
-                item.setZValue(5)
-            else:
-                item.setPen(QPen(QColor("#28a745"), 1))
-                item.setZValue(1)
+        target_rect = None
+        for (tag, _), item in self._layer_items.items():
+            if tag == "csv_layer":
+                rect = item.set_states(sel_id_str, grouped_ids)
+                target_rect = target_rect or rect  # Referensi untuk centering
 
         # LOGIKA PEMUSATAN VERTIKAL SAJA
-        if target_item:
+        if target_rect is not None:
             # 1. Dapatkan pusat viewport saat ini dipetakan ke koordinat scene (Sumbu X)
             current_view_center = self.graphics_view.viewport().rect().center()
             current_scene_center = self.graphics_view.mapToScene(current_view_center)
 
-            # 2. Dapatkan pusat vertikal dari item target (Sumbu Y)
-            target_center_y = target_item.sceneBoundingRect().center().y()
+            # 2. Dapatkan pusat vertikal dari kotak target (Sumbu Y)
+            target_center_y = target_rect.center().y()
 
             # 3. Lakukan pemusatan dengan mempertahankan X lama dan memperbarui Y baru
             self.graphics_view.centerOn(current_scene_center.x(), target_center_y)